@@ -5,7 +5,13 @@
 
 import bpy # type: ignore
 
-from .Helpers.MiscUtils import ftos
+from .Helpers import FacadeModel
+from .Helpers import FacWriter
+
+#Properties copied into a FacadeModel.FacadeDecal, that's everything the exported text depends on
+MODEL_PROPERTIES = ("enabled", "visible", "type", "decal_lib", "alb", "nml", "projected", "tile_ratio", "scale_x", "scale_y", "dither_ratio",
+                    "rgb_strength_constant", "rgb_strength_modulator", "rgb_decal_key_red", "rgb_decal_key_green", "rgb_decal_key_blue", "rgb_decal_key_alpha",
+                    "alpha_strength_constant", "alpha_strength_modulator", "alpha_decal_key_red", "alpha_decal_key_green", "alpha_decal_key_blue", "alpha_decal_key_alpha")
 
 #Forced a UI update
 def update_ui(self, context):
@@ -46,7 +52,6 @@ class DecalProperties(bpy.types.PropertyGroup):
 
     def draw(layout, property_item, index):
         layout.prop(property_item, "enabled", text=f"Decal {index + 1} - " + property_item.type)
-        fac_props = bpy.context.scene.facade_exporter
 
         if property_item.enabled:
 
@@ -113,55 +118,12 @@ class DecalProperties(bpy.types.PropertyGroup):
                 row.prop(property_item, "alpha_decal_key_blue")
                 row.prop(property_item, "alpha_decal_key_alpha")
 
+    #Copies this slot into a Helpers.FacadeModel.FacadeDecal
+    def to_model(property_item):
+        decal = FacadeModel.FacadeDecal()
+        for name in MODEL_PROPERTIES:
+            setattr(decal, name, getattr(property_item, name))
+        return decal
+
     def to_string(property_item):
-        if (not property_item.visible) or (not property_item.enabled):
-            return ""
-        
-        if property_item.decal_lib != "":
-            return "DECAL_LIB " + property_item.decal_lib + "\n"
-        
-        #Make sure there is a texture specified
-        if property_item.alb == "" and property_item.nml == "":
-            return ""
-        
-        decal_string_alb = ""
-        decal_string_nml = ""
-
-        #Start off the decals
-        if property_item.projected:
-            if (property_item.type == "ALB" or property_item.type == "BOTH") and property_item.alb != "":
-                decal_string_alb = "DECAL_PARAMS_PROJ " + ftos(property_item.scale_x, 2) + " " + ftos(property_item.scale_y, 2) + " "
-            if (property_item.type == "BOTH" or property_item.type == "NML") and property_item.nml != "":
-                decal_string_nml = "NORMAL_DECAL_PARAMS_PROJ " + ftos(property_item.scale_x, 2) + " " + ftos(property_item.scale_y, 2) + " "
-        else:
-            if (property_item.type == "ALB" or property_item.type == "BOTH") and property_item.alb != "":
-                decal_string_alb = "DECAL_PARAMS " + ftos(property_item.tile_ratio, 2) + " "
-            if (property_item.type == "BOTH" or property_item.type == "NML") and property_item.nml != "":
-                decal_string_nml = "NORMAL_DECAL_PARAMS " + ftos(property_item.tile_ratio, 2) + " "
-
-        #For readability
-        p = property_item
-
-        alb_path = p.alb
-        nml_path = p.nml
-        if alb_path.startswith("//"):
-            alb_path = alb_path[2:]
-        if nml_path.startswith("//"):
-            nml_path = nml_path[2:]
-
-        #Finish off the albedo
-        if decal_string_alb != "":
-            decal_string_alb += (ftos(p.dither_ratio, 2) + " " +
-                                 ftos(p.rgb_decal_key_red, 2) + " " + ftos(p.rgb_decal_key_green, 2) + " " + ftos(p.rgb_decal_key_blue, 2) + " " + ftos(p.rgb_decal_key_alpha, 2) + " " +
-                                 ftos(p.rgb_strength_modulator, 2) + " " + ftos(p.rgb_strength_constant, 2) + " " +
-                                 ftos(p.alpha_decal_key_red, 2) + " " + ftos(p.alpha_decal_key_green, 2) + " " + ftos(p.alpha_decal_key_blue, 2) + " " + ftos(p.alpha_decal_key_alpha, 2) + " " +
-                                 ftos(p.alpha_strength_modulator, 2) + " " + ftos(p.alpha_strength_constant, 2) + " " + alb_path)
-
-        #Finish off the normal
-        if decal_string_nml != "":
-            decal_string_nml += (ftos(p.rgb_decal_key_red, 2) + " " + ftos(p.rgb_decal_key_green, 2) + " " + ftos(p.rgb_decal_key_blue, 2) + " " + ftos(p.rgb_decal_key_alpha, 2) + " " +
-                                 ftos(p.rgb_strength_modulator, 2) + " " + ftos(p.rgb_strength_constant, 2) + " " + nml_path)
-            
-        return decal_string_alb + "\n" + decal_string_nml + "\n"
-
-        
\ No newline at end of file
+        return FacWriter.get_decal_text(DecalProperties.to_model(property_item))
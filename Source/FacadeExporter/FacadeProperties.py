@@ -1,52 +1,55 @@
 #Project: BlenderFacadeExporter
 #Author: Connor Russell
 #Date: 11/14/2024
-#Purpose: Contains the properties for the whole facade in Blender. There can only be one facade per file.
+#Purpose: Contains the properties for the whole facade in Blender. A scene has one facade, plus any added in the panel, each made of the collections under its root collection.
 
 import bpy  # type: ignore
 import os
+import time
 
+from bpy_extras.io_utils import ImportHelper # type: ignore
 from . import GetFacade
+from . import ImportFacade
 from . import DecalProperties
+from .Helpers import ExportProfiler
+from .Helpers import ExportSession
+from .Helpers import GeometryBudget
+from .Helpers import ExportQueue
 from bpy.app.handlers import persistent # type: ignore
 
 #Forced a UI update
 def update_ui(self, context):
     context.area.tag_redraw()
 
-#Functions that update the state of the decals.
+#Functions that update the state of the decals. self is the facade (PROP_facade_exporter) whose option changed
 def update_wall_decals(self, context):
-    seperate = bpy.context.scene.facade_exporter.wall_seperate_normal_decals
+    seperate = self.wall_seperate_normal_decals
     if seperate:
         #Set the first 4 decals to be visible, first 2 to alb, second 2 to nml
         for i in range(4):
-            bpy.context.scene.facade_exporter.wall_decals[i].visible = True
-            bpy.context.scene.facade_exporter.wall_decals[i].type = "ALB" if i < 2 else "NML"
+            self.wall_decals[i].visible = True
+            self.wall_decals[i].type = "ALB" if i < 2 else "NML"
     else:
         #Set the first 2 decals to be visible, both to both, last 2 to not visible
         for i in range(4):
-            bpy.context.scene.facade_exporter.wall_decals[i].visible = i < 2
-            bpy.context.scene.facade_exporter.wall_decals[i].type = "BOTH"
+            self.wall_decals[i].visible = i < 2
+            self.wall_decals[i].type = "BOTH"
 
 def update_roof_decals(self, context):
-    seperate = bpy.context.scene.facade_exporter.roof_seperate_normal_decals
+    seperate = self.roof_seperate_normal_decals
     if seperate:
         #Set the first 4 decals to be visible, first 2 to alb, second 2 to nml
         for i in range(4):
-            bpy.context.scene.facade_exporter.roof_decals[i].visible = True
-            bpy.context.scene.facade_exporter.roof_decals[i].type = "ALB" if i < 2 else "NML"
+            self.roof_decals[i].visible = True
+            self.roof_decals[i].type = "ALB" if i < 2 else "NML"
     else:
         #Set the first 2 decals to be visible, both to both, last 2 to not visible
         for i in range(4):
-            bpy.context.scene.facade_exporter.roof_decals[i].visible = i < 2
-            bpy.context.scene.facade_exporter.roof_decals[i].type = "BOTH"
+            self.roof_decals[i].visible = i < 2
+            self.roof_decals[i].type = "BOTH"
 
-#This get's called after everything is loaded to give us 4 decals. We should only *ever* have 4 as X-Plane has a fixed number of slots (2 alb 2 nml), and this also simplifies the rest of our code because we can assume we have 4.
-@persistent
-def set_four_decals(dummy):
-    print("Validating collection size")
-    scene = bpy.context.scene
-    facade_exporter = scene.facade_exporter
+#Gives a facade exactly 4 wall and 4 roof decals, set up for its decal options
+def set_facade_decals(facade_exporter):
     while len(facade_exporter.wall_decals) < 4:
         facade_exporter.wall_decals.add()
     while len(facade_exporter.wall_decals) > 4:
@@ -57,8 +60,17 @@ def set_four_decals(dummy):
     while len(facade_exporter.roof_decals) > 4:
         facade_exporter.roof_decals.remove(len(facade_exporter.roof_decals) - 1)
 
-    update_wall_decals(None, None)
-    update_roof_decals(None, None)
+    update_wall_decals(facade_exporter, None)
+    update_roof_decals(facade_exporter, None)
+
+#This get's called after everything is loaded to give us 4 decals. We should only *ever* have 4 as X-Plane has a fixed number of slots (2 alb 2 nml), and this also simplifies the rest of our code because we can assume we have 4.
+@persistent
+def set_four_decals(dummy):
+    print("Validating collection size")
+    for scene in bpy.data.scenes:
+        for facade_exporter in ExportSession.get_facades(scene):
+            set_facade_decals(facade_exporter)
+    ExportSession.assign_facade_ids()
 
 class FacadeSpellingItem(bpy.types.PropertyGroup):
     type: bpy.props.EnumProperty(
@@ -82,6 +94,13 @@ class PROP_facade_exporter(bpy.types.PropertyGroup):
     #Facade name
     facade_name: bpy.props.StringProperty( name="Facade Name", description="The name of the facade")# type: ignore
 
+    #Identifies the facade to incremental export and the geometry budget, see ExportSession.assign_facade_ids
+    facade_id: bpy.props.StringProperty(name="Facade ID", options={'HIDDEN'})# type: ignore
+
+    #Collections
+    root_collection: bpy.props.PointerProperty(name="Root Collection", description="The collection this facade's segments, curved segments, and roof are in. Without one, the facade is every collection in the scene except other facades' root collections", type=bpy.types.Collection)# type: ignore
+    nested_collections: bpy.props.BoolProperty(name="Include Child Collections", description="Export collections nested inside other collections as segments too, depth first in outliner order. Otherwise only the top level collections (under the root collection, if there is one) are segments")# type: ignore
+
     #Global properties
     graded: bpy.props.BoolProperty(name="Graded", description="Whether the facade is graded, otherwise draped")# type: ignore
     ring: bpy.props.BoolProperty(name="Ring", description="Whether the facade is a closed or an open ring")# type: ignore
@@ -89,6 +108,30 @@ class PROP_facade_exporter(bpy.types.PropertyGroup):
     layergroup_draped: bpy.props.StringProperty(name="Layer Group Draped", description="The layer group of the draped facade")# type: ignore
     solid: bpy.props.BoolProperty(name="Solid", description="Whether the roof has collision testing enabled")# type: ignore
 
+    #Export options
+    fast_extraction: bpy.props.BoolProperty(name="Fast Mesh Extraction", description="Read mesh data in bulk with NumPy instead of triangle by triangle. The output is identical, disable only to troubleshoot", default=True)# type: ignore
+    weld_vertices: bpy.props.BoolProperty(name="Weld Verticies", description="Merge verticies with the same position, normal and UV. Reduces the vertex count and file size, UV seams and split normals are kept")# type: ignore
+    weld_tolerance: bpy.props.FloatProperty(name="Weld Tolerance", description="Verticies are merged when every component rounds to the same multiple of this value. 0 only merges exact duplicates", default=0.0, min=0.0, precision=6)# type: ignore
+    optimize_index_order: bpy.props.BoolProperty(name="Optimize Index Order", description="Reorder each mesh's triangles so the GPU's vertex cache is hit more often (Tipsify). Only helps with welded verticies. The ACMR before and after is shown in the export timing")# type: ignore
+    cache_size_mb: bpy.props.IntProperty(name="Geometry Cache (MB)", description="Memory used to keep extracted and formatted meshes between exports, so unchanged meshes aren't processed again", default=256, min=0)# type: ignore
+    incremental_export: bpy.props.BoolProperty(name="Incremental Export", description="Only regenerate segments whose collections changed since the last export, the rest are reused from the geometry cache")# type: ignore
+    export_workers: bpy.props.IntProperty(name="Export Workers", description="Number of workers formatting meshes in parallel. 1 formats everything on the main thread", default=1, min=1, max=64)# type: ignore
+    export_pool: bpy.props.EnumProperty(name="Worker Type", description="How the export workers run", items=[
+            ("PROCESS", "Processes", "Separate Python processes. Scales with cores. They start on the first export and are kept until Blender closes. Threads are used while Blender runs a script"),
+            ("THREAD", "Threads", "Threads in Blender's process. Low overhead, but formatting mostly holds Python's GIL")
+        ], default="PROCESS")# type: ignore
+    write_timing_report: bpy.props.BoolProperty(name="Write Timing Report", description="Write how long each stage of the export took, and the slowest objects and collections, to a .timing.json next to the .fac")# type: ignore
+    profile_export: bpy.props.BoolProperty(name="Profile Export", description="Run the export under cProfile and add the slowest functions to the timing report. Makes the export slower")# type: ignore
+    timing_report_count: bpy.props.IntProperty(name="Report Top", description="Number of objects, collections, and functions listed in the timing report", default=10, min=1, max=100)# type: ignore
+
+    #Geometry budget
+    live_budget_stats: bpy.props.BoolProperty(name="Live Stats", description="Re-analyze the facade's geometry after edits, so the stats below stay current. Analysis runs at most once per refresh interval")# type: ignore
+    budget_refresh_interval: bpy.props.FloatProperty(name="Refresh Interval (s)", description="Minimum time between live analyses", default=2.0, min=0.1, max=60.0)# type: ignore
+    budget_segment_verticies: bpy.props.IntProperty(name="Segment Verticies", description="Warn when a segment (all its LODs) has more verticies than this. 0 doesn't check", default=0, min=0)# type: ignore
+    budget_segment_triangles: bpy.props.IntProperty(name="Segment Triangles", description="Warn when a segment (all its LODs) has more triangles than this. 0 doesn't check", default=0, min=0)# type: ignore
+    budget_segment_attached_objects: bpy.props.IntProperty(name="Segment Attached Objects", description="Warn when a segment has more attached objects than this. 0 doesn't check", default=0, min=0)# type: ignore
+    budget_file_size_kb: bpy.props.IntProperty(name="File Size (KB)", description="Warn when the estimated .fac size is over this. 0 doesn't check", default=0, min=0)# type: ignore
+
     #Wall properties
     render_wall: bpy.props.BoolProperty(name="Render Wall", description="Whether the wall is rendered", update=update_ui)# type: ignore
     wall_texture_alb: bpy.props.StringProperty(name="Texture ALB Path", description="The relative path of the ALB", subtype='FILE_PATH')# type: ignore
@@ -110,7 +153,7 @@ class PROP_facade_exporter(bpy.types.PropertyGroup):
     wall_seperate_normal_decals: bpy.props.BoolProperty(name="Wall Seperate Normal Decals", description="Whether the wall has seperate normal decals, otherwise normals align with the RGB decal.", update=update_wall_decals)# type: ignore
     wall_decals: bpy.props.CollectionProperty(type=DecalProperties.DecalProperties)# type: ignore
     roof_modulator_texture: bpy.props.StringProperty(name="Roof Modulator Texture", description="The texture that modulates the roof", subtype='FILE_PATH')# type: ignore
-    roof_seperate_normal_decals: bpy.props.BoolProperty(name="Roof Seperate Normal Decals", description="Whether the roof has seperate normal decals, otherwise normals align with the RGB decal.", update=update_wall_decals) # type: ignore
+    roof_seperate_normal_decals: bpy.props.BoolProperty(name="Roof Seperate Normal Decals", description="Whether the roof has seperate normal decals, otherwise normals align with the RGB decal.", update=update_roof_decals) # type: ignore
     roof_decals: bpy.props.CollectionProperty(type=DecalProperties.DecalProperties) # type: ignore
 
 #Classes that add/remove spellings
@@ -120,7 +163,7 @@ class MENU_BT_facade_exporter_add_spelling(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     def execute(self, context):
-        context.scene.facade_exporter.spellings.add()
+        ExportSession.get_active_facade(context.scene).spellings.add()
         return {'FINISHED'}
 
 class MENU_BT_facade_exporter_remove_spelling(bpy.types.Operator):
@@ -131,7 +174,48 @@ class MENU_BT_facade_exporter_remove_spelling(bpy.types.Operator):
     index: bpy.props.IntProperty()# type: ignore
 
     def execute(self, context):
-        context.scene.facade_exporter.spellings.remove(self.index)
+        ExportSession.get_active_facade(context.scene).spellings.remove(self.index)
+        return {'FINISHED'}
+
+#Classes that add, remove, and select facades. Facade 0 is the scene's own facade_exporter, the rest are in facade_exporters
+class MENU_BT_facade_exporter_add_facade(bpy.types.Operator):
+    bl_idname = "object.add_facade"
+    bl_label = "Add Facade"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        scene = context.scene
+        set_facade_decals(scene.facade_exporters.add())
+        scene.facade_exporter_index = len(scene.facade_exporters)
+        ExportSession.assign_facade_ids()
+        return {'FINISHED'}
+
+class MENU_BT_facade_exporter_remove_facade(bpy.types.Operator):
+    bl_idname = "object.remove_facade"
+    bl_label = "Remove Facade"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    index: bpy.props.IntProperty()# type: ignore
+
+    def execute(self, context):
+        scene = context.scene
+        if self.index < 1 or self.index > len(scene.facade_exporters):
+            return {'CANCELLED'}
+
+        scene.facade_exporters.remove(self.index - 1)
+        if scene.facade_exporter_index >= self.index:
+            scene.facade_exporter_index -= 1
+        return {'FINISHED'}
+
+class MENU_BT_facade_exporter_select_facade(bpy.types.Operator):
+    bl_idname = "object.select_facade"
+    bl_label = "Select Facade"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    index: bpy.props.IntProperty()# type: ignore
+
+    def execute(self, context):
+        context.scene.facade_exporter_index = self.index
         return {'FINISHED'}
     
 #Class that creates the UI
@@ -147,11 +231,26 @@ class MENU_facade_exporter(bpy.types.Panel):
 
         layout = self.layout
 
-        facade_exporter = context.scene.facade_exporter
+        facade_exporter = ExportSession.get_active_facade(context.scene)
+
+        #Facades in this scene. The properties below are the selected one's
+        facades = ExportSession.get_facades(context.scene)
+        if len(facades) > 1:
+            box = layout.box()
+            box.label(text="Facades:")
+            for index, item in enumerate(facades):
+                row = box.row()
+                row.operator("object.select_facade", text=item.facade_name if item.facade_name != "" else "Facade " + str(index), depress=item == facade_exporter).index = index
+                if index > 0:
+                    row.operator("object.remove_facade", text="", icon='X').index = index
+            box.operator("blender_utils.export_all_facades")
+        layout.operator("object.add_facade", text="Add Facade")
 
         #Export button
         layout.operator("blender_utils.export_facade")
         layout.prop(facade_exporter, "facade_name")
+        layout.prop(facade_exporter, "root_collection")
+        layout.prop(facade_exporter, "nested_collections")
 
         layout.separator()
 
@@ -164,6 +263,77 @@ class MENU_facade_exporter(bpy.types.Panel):
 
         layout.separator()
 
+        layout.label(text="Export Options:")
+        layout.prop(facade_exporter, "fast_extraction")
+        layout.prop(facade_exporter, "weld_vertices")
+        if facade_exporter.weld_vertices:
+            layout.prop(facade_exporter, "weld_tolerance")
+            layout.prop(facade_exporter, "optimize_index_order")
+        if facade_exporter.fast_extraction:
+            layout.prop(facade_exporter, "cache_size_mb")
+            layout.prop(facade_exporter, "incremental_export")
+        layout.prop(facade_exporter, "export_workers")
+        if facade_exporter.export_workers > 1:
+            layout.prop(facade_exporter, "export_pool")
+        layout.prop(facade_exporter, "write_timing_report")
+        layout.prop(facade_exporter, "profile_export")
+        if facade_exporter.write_timing_report or facade_exporter.profile_export:
+            layout.prop(facade_exporter, "timing_report_count")
+
+        #Timing of the last export in this session
+        report = ExportProfiler.last_report
+        if report != None:
+            box = layout.box()
+            box.label(text="Last Export: " + "{:.3f}".format(report["total_seconds"]) + "s")
+            for item in report["stages"]:
+                box.label(text="    " + item["label"] + ": " + "{:.3f}".format(item["seconds"]) + "s")
+            if report["vertex_cache"]["meshes"] > 0:
+                box.label(text="    ACMR: " + "{:.3f}".format(report["vertex_cache"]["acmr_before"]) + " -> " + "{:.3f}".format(report["vertex_cache"]["acmr_after"]) + " (" + str(report["vertex_cache"]["meshes"]) + " meshes)")
+            if report["shared_mesh_instances"] > 0:
+                box.label(text="    Linked Duplicates Reused: " + str(report["shared_mesh_instances"]))
+            if len(report["top_objects"]) > 0:
+                box.label(text="Slowest Objects:")
+                for item in report["top_objects"]:
+                    box.label(text="    " + item["name"] + ": " + "{:.3f}".format(item["seconds"]) + "s")
+            if len(report["top_collections"]) > 0:
+                box.label(text="Slowest Collections:")
+                for item in report["top_collections"]:
+                    box.label(text="    " + item["name"] + ": " + "{:.3f}".format(item["seconds"]) + "s")
+            if len(report["profile"]) > 0:
+                box.label(text="Slowest Functions (cumulative):")
+                for item in report["profile"]:
+                    box.label(text="    " + item["function"] + " (" + os.path.basename(item["file"]) + ":" + str(item["line"]) + "): " + "{:.3f}".format(item["cumulative_time"]) + "s")
+
+        layout.separator()
+
+        #Geometry budget-----------------------------------------------------------------------------------------
+
+        box = layout.box()
+
+        box.label(text="Geometry Budget:")
+        row = box.row()
+        row.operator("blender_utils.analyze_facade")
+        row.prop(facade_exporter, "live_budget_stats")
+        if facade_exporter.live_budget_stats:
+            box.prop(facade_exporter, "budget_refresh_interval")
+        box.prop(facade_exporter, "budget_segment_verticies")
+        box.prop(facade_exporter, "budget_segment_triangles")
+        box.prop(facade_exporter, "budget_segment_attached_objects")
+        box.prop(facade_exporter, "budget_file_size_kb")
+
+        budget = GeometryBudget.get_report(context.scene, facade_exporter)
+        if budget != None:
+            box.label(text="Total: " + str(budget.verticies) + " verticies, " + str(budget.triangles) + " triangles, " + str(budget.attached_objects) + " objects, ~" + "{:.1f}".format(budget.estimated_bytes / 1024) + " KB" + (" (out of date)" if GeometryBudget.dirty else ""))
+            for segment in budget.segments:
+                box.label(text="    " + segment.name + ": " + str(segment.verticies) + " verticies, " + str(segment.triangles) + " triangles, " + "{:.0%}".format(segment.get_unique_ratio()) + " unique, " + str(segment.attached_objects) + " objects, ~" + "{:.1f}".format(segment.estimated_bytes / 1024) + " KB", icon='ERROR' if len(segment.warnings) > 0 else 'NONE')
+                if len(segment.lods) > 1:
+                    for lod in segment.get_lods():
+                        box.label(text="        LOD " + str(lod.far_lod) + ": " + str(lod.verticies) + " verticies, " + str(lod.triangles) + " triangles")
+            for warning in budget.warnings:
+                box.label(text=warning, icon='ERROR')
+
+        layout.separator()
+
         #Wall properties-----------------------------------------------------------------------------------------
 
         box = layout.box()
@@ -247,25 +417,119 @@ class MENU_facade_exporter(bpy.types.Panel):
         # Add button to add new text items
         box.operator("object.add_spelling", text="Add Spelling")
 
+class BUTTON_analyze_facade(bpy.types.Operator):
+    """Count the facade's verticies, triangles, and attached objects, and estimate its size, without exporting it"""
+    bl_idname = "blender_utils.analyze_facade"
+    bl_label = "Analyze Geometry"
+
+    def execute(self, context):
+        report = GeometryBudget.refresh(context.scene, context.view_layer)
+
+        for warning in report.warnings:
+            self.report({'WARNING'}, warning)
+        self.report({'INFO'}, "Analyzed " + str(len(report.segments)) + " segments in " + "{:.3f}".format(report.seconds) + "s")
+        return {'FINISHED'}
+
 class BUTTON_export_facade(bpy.types.Operator):
     """Export the X-Plane facade to a file"""
     bl_idname = "blender_utils.export_facade"
     bl_label = "Export X-Plane Facade"
 
     def execute(self, context):
-        #First get the file path, this is the facade name relative to the blender file
-        file_path = os.path.join(os.path.dirname(bpy.data.filepath), bpy.context.scene.facade_exporter.facade_name + ".fac")
+        #Stream the facade into a temporary file that replaces the .fac once it's complete. If the text is identical to the existing .fac it's left alone
+        session, file_path, written = GetFacade.export_facade(context.scene, context.view_layer)
+        report = session.report
+
+        for warning in session.warnings:
+            self.report({'WARNING'}, warning)
+
+        #Remind them of anything over budget in the last analysis
+        budget = GeometryBudget.get_report(context.scene)
+        if budget != None:
+            for warning in budget.warnings:
+                self.report({'WARNING'}, warning)
+
+        if written:
+            self.report({'INFO'}, "Exported " + os.path.basename(file_path) + " in " + "{:.3f}".format(report["total_seconds"]) + "s")
+        else:
+            self.report({'INFO'}, "Skipped " + os.path.basename(file_path) + ", it's unchanged (" + "{:.3f}".format(report["total_seconds"]) + "s)")
+
+        return {'FINISHED'}
+
+class BUTTON_export_all_facades(bpy.types.Operator):
+    """Export every facade in the scene. Each file is written on its own thread while the next facade is generated, and meshes in collections shared between facades are only extracted once"""
+    bl_idname = "blender_utils.export_all_facades"
+    bl_label = "Export All Facades"
+
+    def execute(self, context):
+        start = time.perf_counter()
+        scene = context.scene
+        writers = []
+        file_paths = set()
+
+        try:
+            for index, facade in enumerate(ExportSession.get_facades(scene)):
+                if facade.facade_name == "":
+                    self.report({'WARNING'}, "Skipped facade " + str(index) + ", it has no name")
+                    continue
+
+                file_path = GetFacade.get_output_path(scene, facade)
+                if file_path in file_paths:
+                    self.report({'WARNING'}, "Skipped facade " + str(index) + ", another facade is already exported to " + os.path.basename(file_path))
+                    continue
+                file_paths.add(file_path)
+
+                #Generate the text here and let the file's thread write it. Sessions share the geometry cache, so a collection in more than one facade is only extracted and formatted once
+                session = ExportSession.ExportSession(scene, context.view_layer, facade)
+                writer = ExportQueue.QueuedWriter(file_path)
+                writers.append((writer, session))
+                try:
+                    GetFacade.write_facade(writer, session)
+                finally:
+                    report = session.finish()
+
+                if session.settings.write_timing_report:
+                    ExportProfiler.write_report(report, os.path.splitext(file_path)[0] + ".timing.json")
+
+                for warning in session.warnings:
+                    self.report({'WARNING'}, facade.facade_name + ": " + warning)
+
+            #A facade only counts as exported once its writer has replaced the .fac (or found it unchanged)
+            written = []
+            for writer, session in writers:
+                written.append(writer.finish())
+                session.mark_exported()
+        except Exception:
+            for writer, session in writers:
+                writer.abort()
+            raise
+
+        self.report({'INFO'}, "Exported " + str(sum(written)) + " facades (" + str(len(written) - sum(written)) + " unchanged) in " + "{:.3f}".format(time.perf_counter() - start) + "s")
+        return {'FINISHED'}
+
+class BUTTON_import_facade(bpy.types.Operator, ImportHelper):
+    """Import an X-Plane facade (type 2) as segment collections, meshes, attached objects, and facade properties"""
+    bl_idname = "blender_utils.import_facade"
+    bl_label = "Import X-Plane Facade"
 
-        #If the file path ends with .fac.fac, remove the last .fac
-        if str.endswith(file_path, ".fac.fac"):
-            file_path = file_path[:-4]
+    filename_ext = ".fac"
+    filter_glob: bpy.props.StringProperty(default="*.fac", options={'HIDDEN'})# type: ignore
+    set_properties: bpy.props.BoolProperty(name="Set Facade Properties", description="Replace the selected facade's properties (header, decals, spellings, facade name, and root collection) with the imported facade's", default=True)# type: ignore
 
-        #Get the facade text
-        facade_text = GetFacade.get_facade()
+    def execute(self, context):
+        start = time.perf_counter()
 
-        #Now write the file
-        with open(file_path, "w") as file:
-            file.write(facade_text)
+        try:
+            result = ImportFacade.import_facade(self.filepath, context.scene, self.set_properties)
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, "Couldn't import " + os.path.basename(self.filepath) + ": " + str(e))
+            return {'CANCELLED'}
 
+        for warning in result.warnings:
+            self.report({'WARNING'}, warning)
+        self.report({'INFO'}, "Imported " + str(result.segments) + " segments (" + str(result.curved_segments) + " curved), " + str(result.meshes) + " meshes, " + str(result.triangles) + " triangles, and " + str(result.attached_objs) + " attached objects in " + "{:.3f}".format(time.perf_counter() - start) + "s")
         return {'FINISHED'}
 
+#Adds the importer to File > Import
+def menu_import_facade(self, context):
+    self.layout.operator(BUTTON_import_facade.bl_idname, text="X-Plane Facade (.fac)")
@@ -3,250 +3,282 @@
 #Date: 11/14/2024
 #Purpose: Provide a single function call to get the facade file text from all the collections
 
+import os
+import time
 import bpy  #type: ignore
+from .Helpers import GeometryCache
 from .Helpers import SegmentUtils
+from .Helpers import ExportTracker
+from .Helpers import WorkerPool
+from .Helpers import ExportSession
+from .Helpers import ExportProfiler
+from .Helpers import AtomicWriter
+from .Helpers import FacadeModel
+from .Helpers import FacWriter
 from . import GetSegment
 from . import GetRoof
 from . import DecalProperties
 
-def get_collections_in_ui_order():
-    collections = []
-    for col in bpy.context.view_layer.layer_collection.children:
-        if collections is None:
-            collections = []
-        if col.exclude:
-            continue
-        collections.append(col.collection)
-    
-    return collections
-
-def get_facade():
-    #Get the collections
-    collections = get_collections_in_ui_order()
-
-    #Define a list of collections that are exportable
-    exportable_segments = []
-    exportable_curved_segments = []
-    roof_collection = None
-
-    #Iterate through every collection
-    for col in collections:
-        #Get the name of the collection
-        col_name = col.name
-
-        #Make the name lowercase
-        col_name = col_name.lower()
-
-        #Make sure there are exportable objects in this collection
-        good_for_export = False
-        for obj in col.objects:
-            if obj.facade_object.exportable == True:
-                good_for_export = True
-                break
-        if not good_for_export:
-            continue
-
-        #Make sure this facade name doesn't end in _curved
-        if col_name.endswith("_curved"):
-            continue
-
-        if col_name == "roof":
-            roof_collection = col
-            continue
-
-        #Append this collection to the exportable list
-        exportable_segments.append(col)
-
-        #Check all the other collections for a name_curved variant
-        did_find_curved = False
-        for curved_col in collections:
-            curved_col_name = curved_col.name
-            curved_col_name = curved_col_name.lower()
-            if curved_col_name == col_name + "_curved":
-                exportable_curved_segments.append(curved_col)
-                did_find_curved = True
-                break
-        
-        #If we didn't find a curved variant, append None, we'll use the text from the straight segment
-        if not did_find_curved:
-            exportable_curved_segments.append(None)
-
-    #We now have a list of exportable segments, exportable curved segments, and the roof collection.
+#Generates the parts (text and MeshJobs, see GetSegment.iter_segment_parts) of one segment, from its SceneIndex.CollectionEntry. In incremental mode, segments whose collection (and objects) didn't change since the last export are reused from the cache
+def iter_segment_text(entry, session):
+    settings = session.settings
+    if not settings.incremental_export:
+        yield from GetSegment.iter_entry_parts(entry, session)
+        return
+
+    collection = entry.collection
+    key = ExportTracker.get_segment_key(collection, (settings.fast_extraction,) + settings.get_mesh_options(), session.resources.resources)
+    if not ExportTracker.is_collection_changed(collection, session.target):
+        chunks = session.cache.get(key)
+        if chunks is not None:
+            yield from chunks
+            return
+
+    #Pass the parts along, then once they've all been resolved (in order), cache the segment's text
+    parts = []
+    for part in GetSegment.iter_entry_parts(entry, session):
+        parts.append(part)
+        yield part
+
+    def store_segment():
+        chunks = []
+        for part in parts:
+            chunks.extend(GetSegment.resolve_part(part))
+        session.cache.put(key, chunks, sum(len(chunk) for chunk in chunks))
+    yield store_segment
+
+#Generates the facade file text in chunks, in file order. Everything the export reads and keeps is in the session (see Helpers.ExportSession)
+def iter_facade(session):
+    profiler = session.profiler
+
+    #Index the collections in one pass, sorting out which ones are segments and which objects they hold
+    with profiler.stage("collection_scan"):
+        scene_index = session.build_index()
+
+    #We now have the exportable segments, exportable curved segments, and the roof collection.
     #So now, we need to:
     #1. Get a list of all facade objects
     #2. Load the facade roof (since it goes into the header)
     #3. Get the facade header text
     #4. Get the roof text
-    #5. Get the facade segment text, and corresponding curved text
-    #6. Get the spelling text
-    #7. Merge it all together and return it
+    #5. Get the spelling text
+    #6. Stream out the header, roof, segment text and corresponding curved text, and spellings
 
     #Shortcut for the facade properties
-    f = bpy.context.scene.facade_exporter
+    f = session.facade
+
+    #Apply the geometry cache size
+    GeometryCache.set_memory_limit(session.settings.cache_size_mb)
 
     #1. Get a list of all facade objects
-    for col in exportable_segments:
-        if col == None:
-            continue
-        for obj in col.objects:
-            if obj == None:
-                continue
-            SegmentUtils.AttachedObj.add_object_to_list(obj)
-    for col in exportable_curved_segments:
-        if col == None:
-            continue
-        for obj in col.objects:
-            if obj == None:
-                continue
-            SegmentUtils.AttachedObj.add_object_to_list(obj)
-    if roof_collection != None:
-        for obj in roof_collection.objects:
-            if obj == None:
-                continue
-            SegmentUtils.AttachedObj.add_object_to_list(obj)
-
-    SegmentUtils.AttachedObj.prep_object_list()
+    with profiler.stage("object_list"):
+        load_resources(scene_index, session)
+        check_generated_lods(scene_index, session)
 
     #2. Load the facade roof
-    roof = GetRoof.FacadeRoof()
-    if roof_collection != None: #If there is a roof collection, load it, otherwise just default the roof to 10x10. If they don't have a roof they probably don't care
-        roof.read_from_collection(roof_collection)
-    else:
-        roof.roof_scale_x = 10
-        roof.roof_scale_y = 10
+    with profiler.stage("roof"):
+        roof = load_roof(scene_index)
 
     #3. Get the facade header text
-    header_text = "I\n1000\nFACADE\n\n"
+    with profiler.stage("header"):
+        header_text = FacWriter.get_header_text(get_header_model(f, session.resources))
 
-    #General properties
-    if f.ring:
-        header_text += "RING 1\n"
-    else:
-        header_text += "RING 0\n"
-    if f.graded:
-        header_text += "GRADED\n"
-    else:
-        header_text += "DRAPED\n"
-    if f.layergroup != "":
-        header_text += "LAYER_GROUP " + f.layergroup + "\n"
-    if f.layergroup_draped != "":
-        header_text += "LAYER_GROUP_DRAPED " + f.layergroup_draped + "\n"
-
-    #Wall properties
-    if f.render_wall:
-        #Specify this is for the wall shader, if we have anything to do
-        if f.wall_texture_alb != "" or f.wall_texture_nml != "":
-            header_text += "\nSHADER_WALL\n"
-
-        if f.wall_texture_alb != "":
-            tex_path = f.wall_texture_alb
-            if tex_path.startswith("//"):
-                tex_path = tex_path[2:]
-            header_text += "TEXTURE " + tex_path + "\n"
-        if f.wall_texture_nml != "":
-            tex_path = f.wall_texture_nml
-            if tex_path.startswith("//"):
-                tex_path = tex_path[2:]
-            header_text += "TEXTURE_NORMAL " + str(f.wall_texture_nml_scale) + " " + tex_path + "\n"
-            header_text += "SPECULAR 1.0\nNORMAL_METALNESS\n"
-
-        #Decals
-        if f.wall_modulator_texture != "":
-            mod_texture = f.wall_modulator_texture
-            if mod_texture.startswith("//"):
-                mod_texture = mod_texture[2:]
-            header_text += "TEXTURE_MODULATOR " + mod_texture + "\n"
-        
-        for index, item in enumerate(f.wall_decals):
-            header_text += DecalProperties.DecalProperties.to_string(item)
+    #4. Get the roof text
+    with profiler.stage("roof"):
+        roof_text = FacWriter.get_roof_text(get_roof_model(roof, f, session.resources, session.warnings))
 
-    else:
-        header_text += "\nNO_WALL_MESH\n"
-
-    #Roof properties
-    if f.render_roof:
-        #Specify this is for the roof shader, if we have anything to dos
-        if f.roof_texture_alb != "" or f.roof_texture_nml != "":
-            header_text += "\nSHADER_ROOF\n"
-
-        if f.roof_texture_alb != "":
-            tex_path = f.roof_texture_alb
-            if tex_path.startswith("//"):
-                tex_path = tex_path[2:]
-            header_text += "TEXTURE " + tex_path + "\n"
-        if f.roof_texture_nml != "":
-            tex_path = f.roof_texture_nml
-            if tex_path.startswith("//"):
-                tex_path = tex_path[2:]
-            header_text += "TEXTURE_NORMAL " + str(f.roof_texture_nml_scale) + " " + tex_path + "\n"
-            header_text += "SPECULAR 1.0\nNORMAL_METALNESS\n"   
-
-        #Decals
-        if f.roof_modulator_texture != "":  
-            mod_texture = f.roof_modulator_texture
-            if mod_texture.startswith("//"):
-                mod_texture = mod_texture[2:]
-            header_text += "TEXTURE_MODULATOR " + mod_texture + "\n"
-
-        for index, item in enumerate(f.roof_decals):
-            header_text += DecalProperties.DecalProperties.to_string(item)
-    else:
-        header_text += "\nNO_ROOF_MESH\n"
+    #5. Get the spelling text.
+    with profiler.stage("spellings"):
+        spelling_text = FacWriter.get_spelling_text(get_spelling_models(f))
 
-    #Object definitions
-    for obj in SegmentUtils.AttachedObj.all_objects:
-        header_text += "OBJ " + obj + "\n"
+    #6. Stream it all out. The segments are generated as they are written so we never hold the whole file in memory.
+    #Meshes are extracted here on the main thread, and formatted on the worker pool if there is one. Output order doesn't depend on the pool
+    yield header_text + "\n" + roof_text + "\n"
 
-    #4. Get the roof text
-    roof_text = ""
-    roof_text += "FLOOR Default\n"
-    roof_text += "ROOF_HEIGHT " + str(f.roof_height) + "\n"
-    roof_text += "ROOF_SCALE " + str(roof.roof_scale_x) + " " + str(roof.roof_scale_y) + "\n"
+    executor = WorkerPool.get_executor(session.settings.export_pool, session.settings.export_workers, session.warnings)
+    parts = iter_facade_segments(scene_index.segments, scene_index.curved_segments, session)
+    yield from profiler.timed_iter(GetSegment.resolve_parts(parts, executor, WorkerPool.get_max_pending(session.settings.export_workers)), "segments")
 
-    if len(roof.roof_objs) > 0:
-        roof_text += "\n"
+    yield spelling_text
 
-    for obj in roof.roof_objs:
-        obj.roof_obj = True
-        roof_text += obj.get_string() + "\n"
+#Fills the session's OBJ resource table from the attached objects of every exported collection
+def load_resources(scene_index, session):
+    for entry in scene_index.get_exported_entries():
+        for obj in entry.empties:
+            session.resources.add_object(obj)
 
-    #5. Get the facade curve and straight segment text
-    straight_segment_text = []
-    curved_segment_text = []
+    session.resources.finalize()
 
-    #Straight
-    for i in range(0, len(exportable_segments)):
-        straight_segment_text.append(GetSegment.get_segment(exportable_segments[i]))
+#Warns about every segment mesh with Generated LODs set, they're never exported (see SegmentUtils.get_generated_lod_warning). Segments reused by an incremental export are checked too
+def check_generated_lods(scene_index, session):
+    for entry in scene_index.segments + [entry for entry in scene_index.curved_segments if entry != None]:
+        for obj in entry.meshes:
+            warning = SegmentUtils.get_generated_lod_warning(obj)
+            if warning != None:
+                session.warnings.append(warning)
 
-    #Curved
-    for i in range(0, len(exportable_curved_segments)):
-        if exportable_curved_segments[i] == None:
-            curved_segment_text.append(straight_segment_text[i])
-        else:
-            curved_segment_text.append(GetSegment.get_segment(exportable_curved_segments[i]))
-
-    #6. Get the spelling text.
-    spelling_text = "" 
-    for index, item in enumerate(f.spellings):
-        if item.type == "WALL":
-            spelling_text += "WALL " + str(item.min_width) + " " + str(item.max_width) + " " + str(item.min_heading) + " " + str(item.max_heading) + " " + item.wall_name + "\n"
-        elif item.type == "WALL_RULE":
-            spelling_text += "WALL_RULE " + str(item.min_width) + " " + str(item.max_width) + " " + str(item.min_heading) + " " + str(item.max_heading) + "\n"
+#Gets the facade's GetRoof.FacadeRoof
+def load_roof(scene_index):
+    roof = GetRoof.FacadeRoof()
+    if scene_index.roof != None: #If there is a roof collection, load it, otherwise just default the roof to 10x10. If they don't have a roof they probably don't care
+        roof.read_from_entry(scene_index.roof)
+    else:
+        roof.roof_scale_x = 10
+        roof.roof_scale_y = 10
+    return roof
+
+#Copies a shader's (wall or roof, by prefix) properties into a FacadeModel.FacadeShader
+def get_shader_model(f, prefix):
+    shader = FacadeModel.FacadeShader()
+    shader.render = getattr(f, "render_" + prefix)
+    shader.texture_alb = getattr(f, prefix + "_texture_alb")
+    shader.texture_nml = getattr(f, prefix + "_texture_nml")
+    shader.texture_nml_scale = getattr(f, prefix + "_texture_nml_scale")
+    shader.modulator_texture = getattr(f, prefix + "_modulator_texture")
+    shader.decals = [DecalProperties.DecalProperties.to_model(item) for item in getattr(f, prefix + "_decals")]
+    return shader
+
+#Copies the facade properties into a FacadeModel.FacadeHeader. resources is the export's (finalized) ResourceTable
+def get_header_model(f, resources):
+    header = FacadeModel.FacadeHeader()
+    header.ring = f.ring
+    header.graded = f.graded
+    header.layergroup = f.layergroup
+    header.layergroup_draped = f.layergroup_draped
+    header.wall = get_shader_model(f, "wall")
+    header.roof = get_shader_model(f, "roof")
+    header.resources = list(resources.resources)
+    return header
+
+#Gets a FacadeModel.FacadeRoof from a GetRoof.FacadeRoof. Roof objects whose resource isn't in resources are added to warnings
+def get_roof_model(roof, f, resources, warnings=None):
+    model = FacadeModel.FacadeRoof(f.roof_height, roof.roof_scale_x, roof.roof_scale_y)
+    for obj in roof.roof_objs:
+        obj.roof_obj = True
+        model.objs.append(obj.to_model(resources, warnings))
+    return model
+
+#Copies the spellings into FacadeModel.FacadeSpellings
+def get_spelling_models(f):
+    return [FacadeModel.FacadeSpelling(item.type, item.min_width, item.max_width, item.min_heading, item.max_heading, item.wall_name, item.spellings) for item in f.spellings]
+
+#Reads the whole facade into a FacadeModel.Facade, with every mesh extracted into arrays (nothing comes from the geometry cache). Helpers.FacWriter turns it into the same text the export writes.
+#Unlike the export this holds every mesh at once, it's meant for running the serializer on its own (benchmarks, worker processes, or saving the model)
+def get_facade_model(session):
+    scene_index = session.build_index()
+    f = session.facade
+
+    load_resources(scene_index, session)
+    check_generated_lods(scene_index, session)
+    roof = load_roof(scene_index)
+
+    facade = FacadeModel.Facade()
+    facade.header = get_header_model(f, session.resources)
+    facade.roof = get_roof_model(roof, f, session.resources, session.warnings)
+    facade.segments = [GetSegment.get_segment_model(entry, session) for entry in scene_index.segments]
+
+    #A segment without a curved variant is written again as its own curved segment
+    for index, entry in enumerate(scene_index.curved_segments):
+        if entry == None:
+            facade.curved_segments.append(facade.segments[index])
         else:
-            spelling_text += "SPELLING " + str(item.spellings) + "\n"
+            facade.curved_segments.append(GetSegment.get_segment_model(entry, session))
 
-    #7. Merge it all together and return it
-    facade_text = header_text + "\n" + roof_text + "\n"
+    facade.spellings = get_spelling_models(f)
+    return facade
 
-    for i in range(0, len(straight_segment_text)):
-        facade_text += "SEGMENT " + str(i) + "\n" + straight_segment_text[i] + "\n"
-    
-    for i in range(0, len(curved_segment_text)):
-        facade_text += "SEGMENT_CURVED " + str(i) + "\n" + curved_segment_text[i] + "\n"
+#Gets a part that yields the text of already generated parts again, once they've been resolved. Callables (i.e. caching the segment) aren't run twice
+def get_replay_part(parts):
+    return lambda: [chunk for part in parts if not callable(part) for chunk in GetSegment.resolve_part(part)]
 
-    facade_text += spelling_text
-
-    return facade_text
+#Generates the parts of every straight segment, then every curved segment. Segments are SceneIndex.CollectionEntry
+def iter_facade_segments(exportable_segments, exportable_curved_segments, session):
+    #Straight. The parts of segments without a curved variant are kept, their text is written again as the curved segment
+    straight_parts = {}
+    for i in range(0, len(exportable_segments)):
+        yield "SEGMENT " + str(i) + "\n"
 
+        parts = session.profiler.timed_iter(iter_segment_text(exportable_segments[i], session), None, exportable_segments[i].name)
+        if exportable_curved_segments[i] == None:
+            straight_parts[i] = []
+            for part in parts:
+                straight_parts[i].append(part)
+                yield part
+        else:
+            yield from parts
+        yield "\n"
 
+    #Curved
+    for i in range(0, len(exportable_curved_segments)):
+        yield "SEGMENT_CURVED " + str(i) + "\n"
 
+        curved_col = exportable_curved_segments[i]
+        if curved_col == None:
+            yield get_replay_part(straight_parts.pop(i))
+        else:
+            yield from session.profiler.timed_iter(iter_segment_text(curved_col, session), None, curved_col.name)
+        yield "\n"
+
+#Gets the path a facade is exported to, the scene's active facade by default. This is the facade name relative to the blender file
+def get_output_path(scene=None, facade=None):
+    if scene == None:
+        scene = bpy.context.scene
+    if facade == None:
+        facade = ExportSession.get_active_facade(scene)
+
+    file_path = os.path.join(os.path.dirname(bpy.data.filepath), facade.facade_name + ".fac")
+
+    #If the file path ends with .fac.fac, remove the last .fac
+    if str.endswith(file_path, ".fac.fac"):
+        file_path = file_path[:-4]
+
+    return file_path
+
+#Gets the whole facade file text as one string. Without a session, one is made for the current scene (its timings end up in ExportProfiler.last_report)
+def get_facade(session=None):
+    if session != None:
+        return "".join(iter_facade(session))
+
+    session = ExportSession.ExportSession()
+    try:
+        return "".join(iter_facade(session))
+    finally:
+        session.finish()
+
+#Writes the facade to an open file (or any object with a write method) chunk by chunk. Without a session, one is made for the current scene (its timings end up in ExportProfiler.last_report)
+def write_facade(file, session=None):
+    if session == None:
+        session = ExportSession.ExportSession()
+        try:
+            write_facade(file, session)
+        finally:
+            session.finish()
+        return
+
+    write_time = 0.0
+    for chunk in iter_facade(session):
+        start = time.perf_counter()
+        file.write(chunk)
+        write_time += time.perf_counter() - start
+    session.profiler.add_time(write_time, "write")
+
+#Exports a facade (the scene's active facade by default) to its .fac, the way the export button does. The file is replaced atomically, and left alone if the output is identical (see Helpers.AtomicWriter).
+#Once it's written the facade is marked exported (for incremental export), and the timing report is written next to it if the facade asks for one. Returns a tuple of the ExportSession (its report and warnings), the file path, and whether the file was written
+def export_facade(scene=None, view_layer=None, facade=None):
+    #The session holds the timers, so the timing covers opening the file too
+    session = ExportSession.ExportSession(scene, view_layer, facade)
+    file_path = get_output_path(scene, facade)
+
+    try:
+        with AtomicWriter.AtomicWriter(file_path) as file:
+            write_facade(file, session)
+
+        #The .fac is on disk, so changes from now on are relative to this export
+        session.mark_exported()
+    finally:
+        report = session.finish()
+
+    if session.settings.write_timing_report:
+        ExportProfiler.write_report(report, os.path.splitext(file_path)[0] + ".timing.json")
+
+    return (session, file_path, file.written)
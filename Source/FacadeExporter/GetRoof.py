@@ -4,6 +4,7 @@
 #Purpose: Provides a class to abstract the roof definition for a facade
 
 from .Helpers.SegmentUtils import AttachedObj
+from .Helpers.SceneIndex import CollectionEntry
 
 #Class containing the details of a roof
 class FacadeRoof:
@@ -16,17 +17,19 @@ class FacadeRoof:
         self.roof_objs = []
 
     def read_from_collection(self, collection):
-        #Loop through and find the first mesh object
-        for obj in collection.objects:
-            if obj.type == 'MESH':
-                #Get this object's dimensions. This will be used to scale the roof
-                self.roof_scale_x = obj.dimensions.x
-                self.roof_scale_y = obj.dimensions.y
-
-            elif obj.type == 'EMPTY':
-                #Attempt to load this attached object and save it if the results are not None
-                roof_obj = AttachedObj()
-                roof_obj.read_from_obj(obj)
-
-                if roof_obj.valid:
-                    self.roof_objs.append(roof_obj)
\ No newline at end of file
+        self.read_from_entry(CollectionEntry(collection))
+
+    #Same as read_from_collection, for a collection that's already been indexed (see Helpers.SceneIndex)
+    def read_from_entry(self, entry):
+        #Get the mesh's dimensions. This will be used to scale the roof (if there are several, the last one wins)
+        for obj in entry.meshes:
+            self.roof_scale_x = obj.dimensions.x
+            self.roof_scale_y = obj.dimensions.y
+
+        for obj in entry.empties:
+            #Attempt to load this attached object and save it if the results are not None
+            roof_obj = AttachedObj()
+            roof_obj.read_from_obj(obj)
+
+            if roof_obj.valid:
+                self.roof_objs.append(roof_obj)
\ No newline at end of file
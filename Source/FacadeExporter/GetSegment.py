@@ -3,59 +3,273 @@
 #Date: 11/9/2024
 #Purpose: Provide a single function call to get the geometry of a segment, and attached objects, from a layer in a blender scene. 
 
+import collections
+import time
+
 #Our modules
 from .Helpers import SegmentUtils
 from .Helpers import MiscUtils
-from .Helpers import GeometryUtils
+from .Helpers import FormatUtils
+from .Helpers import GeometryCache
+from .Helpers import SceneIndex
+from .Helpers import VertexCache
+from .Helpers import ExportSession
+from .Helpers import FacadeModel
+from .Helpers import FacWriter
+from .Helpers import WorkerPool
 
-#Gets the geometry of a segment, and attached objects, from a layer in a blender scene. Returns the all data in a string, formatted for an X-Plane Facade
-def get_segment(layer):
+#Number of VERTEX/IDX lines joined into each chunk we hand to the writer
+CHUNK_LINES = FacWriter.CHUNK_LINES
+
+#A mesh whose verticies and indicies have been extracted but not formatted yet. Formatting can happen right away, or on a worker pool
+class MeshJob:
+    def __init__(self, header, text_key, verticies, indicies, obj_name=None, collection_name=None, profiler=None, warnings=None):
+        self.header = header        #The full MESH line
+        self.text_key = text_key    #Key to cache the formatted text under
+        self.verticies = verticies
+        self.indicies = indicies
+
+        #What the formatting time is counted against in the export timing report
+        self.obj_name = obj_name
+        self.collection_name = collection_name
+        self.profiler = profiler
+
+        #Where a failing worker pool is reported (the session's warnings)
+        self.warnings = warnings
+
+        self.executor = None
+        self.future = None
+        self.chunks = None
+
+    #Starts formatting on an executor. If the pool is broken (e.g. a worker process couldn't start) it's reported and dropped, and this is formatted on the main thread later
+    def submit(self, executor):
+        try:
+            self.future = executor.submit(FormatUtils.format_mesh, self.verticies, self.indicies, CHUNK_LINES)
+            self.executor = executor
+        except Exception as e:
+            self.report_pool_failure(executor, e)
+
+    #Stops waiting on the worker, for an export that was abandoned part way
+    def cancel(self):
+        if self.future != None:
+            self.future.cancel()
+            self.future = None
+
+    #Gets the formatted text chunks (including the MESH line), waiting for the worker if needed. If the worker failed it's reported, and we format it here instead
+    def get_chunks(self):
+        if self.chunks is None:
+            start = time.perf_counter()
+            chunks = None
+            if self.future != None:
+                try:
+                    chunks = self.future.result()
+                except Exception as e:
+                    self.report_pool_failure(self.executor, e)
+            if chunks is None:
+                chunks = FormatUtils.format_mesh(self.verticies, self.indicies, CHUNK_LINES)
+
+            GeometryCache.store_mesh_text(self.text_key, len(self.verticies), len(self.indicies), chunks)
+            self.chunks = [self.header] + chunks
+            if self.profiler != None:
+                self.profiler.add_time(time.perf_counter() - start, "formatting", self.obj_name, self.collection_name)
+
+            #We don't need the arrays anymore
+            self.verticies = None
+            self.indicies = None
+            self.executor = None
+            self.future = None
+        return self.chunks
+
+    #Adds a worker pool failure to the warnings, and drops the pool so the next export starts a new one
+    def report_pool_failure(self, executor, e):
+        print("Worker pool error: " + str(e))
+        WorkerPool.add_warning(self.warnings, "The worker pool failed (" + type(e).__name__ + "), meshes were formatted on the main thread instead")
+        WorkerPool.discard_executor(executor)
+
+#Reorders a mesh's triangles for the vertex cache (see Helpers.VertexCache), recording the time and the ACMR before and after. Returns the new indicies
+def optimize_mesh_index_order(obj_name, verticies, indicies, profiler):
+    start = time.perf_counter()
+    indicies, acmr_before, acmr_after = VertexCache.optimize_index_order(indicies, len(verticies))
+    profiler.add_time(time.perf_counter() - start, "index_order", obj_name)
+    profiler.add_acmr(obj_name, len(indicies) // 3, acmr_before, acmr_after)
+    return indicies
+
+#Transforms an object's local geometry into the verticies and indicies that are written, welded and reordered as the session's settings say. Returns a tuple of the verticies and indicies
+def get_output_geometry(local, obj, session):
+    settings = session.settings
+    start = time.perf_counter()
+    verticies, indicies = SegmentUtils.transform_local_geometry(local, obj.matrix_world, settings.weld_vertices, settings.weld_tolerance)
+    session.profiler.add_time(time.perf_counter() - start, "geometry_extraction", obj.name)
+
+    if settings.optimize_index_order:
+        indicies = optimize_mesh_index_order(obj.name, verticies, indicies, session.profiler)
+    return verticies, indicies
+
+#Gets the geometry of a segment, and attached objects, from a layer in a blender scene. This is the extraction half of the export, it's the only part that reads from Blender.
+#Yields the data in order as chunks of text, and MeshJobs for meshes that still need to be formatted. The session (see Helpers.ExportSession) gives the settings, the OBJ resources, and the timers.
+def iter_segment_parts(layer, session):
+    return iter_entry_parts(SceneIndex.CollectionEntry(layer), session)
+
+#Same as iter_segment_parts, for a collection that's already been indexed (see Helpers.SceneIndex)
+def iter_entry_parts(entry, session):
+    #fast_extraction reads meshes in bulk, weld merges duplicate verticies (within weld_tolerance)
+    fast_extraction = session.settings.fast_extraction
+    weld = session.settings.weld_vertices
+    weld_tolerance = session.settings.weld_tolerance
+    optimize_index_order = session.settings.optimize_index_order
+    profiler = session.profiler
+
+    #Get the geometry of every mesh
+    for obj in entry.meshes:
+        #The mesh header is MESH <group> <far LOD> <cuts> <vertex_count> <idx_count>
+        group = obj.facade_object.group
+        far_lod = obj.facade_object.far_lod
+        cuts = obj.facade_object.cuts
+
+        start = time.perf_counter()
+
+        #The fast path reads the mesh in bulk into arrays, formats them in bulk, and caches the text so an unchanged mesh is never re-serialized
+        if fast_extraction:
+            #Linked duplicates of a mesh that was already read this export reuse its fingerprint, without evaluating the mesh again.
+            #They reuse its geometry too, if it was read (it's only read when the text isn't cached)
+            shared = session.shared_meshes.get(obj)
+            if shared != None:
+                fingerprint, local = shared
+                text_key = GeometryCache.get_mesh_text_key(obj, fingerprint, session.settings.get_mesh_options())
+                cached = GeometryCache.get_mesh_text(text_key)
+            else:
+                #The evaluated mesh is only held while we fingerprint and read it
+                local = None
+                with SegmentUtils.get_evaluated_mesh(obj, session.depsgraph) as mesh:
+                    fingerprint = GeometryCache.get_fingerprint(mesh)
+                    text_key = GeometryCache.get_mesh_text_key(obj, fingerprint, session.settings.get_mesh_options())
+                    cached = GeometryCache.get_mesh_text(text_key)
+                    if cached is None:
+                        local = SegmentUtils.get_local_geometry(obj, mesh, fingerprint)
+                session.shared_meshes.add(obj, fingerprint, local)
 
-    #Define an empty array of attached objects
-    attached_objects = []
+            #A linked duplicate of a mesh whose text was cached (e.g. this object moved, the first didn't). Read it now, with the fingerprint we already have
+            if cached is None and local is None:
+                with SegmentUtils.get_evaluated_mesh(obj, session.depsgraph) as mesh:
+                    local = SegmentUtils.get_local_geometry(obj, mesh, fingerprint)
+                session.shared_meshes.add(obj, fingerprint, local)
 
-    #Define a string to hold output
-    output = ""
+            if cached is None:
+                profiler.add_time(time.perf_counter() - start, "geometry_extraction", obj.name)
+                verticies, indicies = get_output_geometry(local, obj, session)
+                yield MeshJob(FacWriter.get_mesh_line(group, far_lod, cuts, len(verticies), len(indicies)), text_key, verticies, indicies, obj.name, entry.name, profiler, session.warnings)
+            else:
+                profiler.add_time(time.perf_counter() - start, "geometry_extraction", obj.name)
+                yield FacWriter.get_mesh_line(group, far_lod, cuts, cached[0], cached[1])
+                yield from cached[2]
+            continue
+
+        #Get the geometry of this object one triangle at a time
+        verticies, indicies = SegmentUtils.get_geometry_from_obj(obj, weld, weld_tolerance, session.depsgraph)
+        profiler.add_time(time.perf_counter() - start, "geometry_extraction", obj.name)
+        if optimize_index_order:
+            indicies = optimize_mesh_index_order(obj.name, verticies, indicies, profiler)
+
+        yield FacWriter.get_mesh_line(group, far_lod, cuts, len(verticies), len(indicies))
+
+        #Format the verticies, then the indicies 10 per IDX line
+        start = time.perf_counter()
+        chunks = ["".join(verticies.to_string(i) + "\n" for i in range(start_line, min(start_line + CHUNK_LINES, len(verticies)))) for start_line in range(0, len(verticies), CHUNK_LINES)]
+        chunks.extend(FormatUtils.iter_index_lines(indicies, CHUNK_LINES))
+        profiler.add_time(time.perf_counter() - start, "formatting", obj.name)
+
+        yield from chunks
+
+    #Empties are typically attached objects, they go after the meshes
+    start = time.perf_counter()
+    attached_text = FacWriter.get_attached_objs_text(get_attached_obj_models(entry, session))
+    profiler.add_time(time.perf_counter() - start, "attached_objects")
+
+    if attached_text != "":
+        yield attached_text
+
+#Gets the exportable attached objects of an indexed collection as FacadeModel.FacadeAttachedObjs
+def get_attached_obj_models(entry, session):
+    models = []
+    for obj in entry.empties:
+        attached_obj = SegmentUtils.AttachedObj()
+        attached_obj.read_from_obj(obj)
+
+        if attached_obj.valid:
+            models.append(attached_obj.to_model(session.resources, session.warnings))
+    return models
+
+#Reads a segment into a FacadeModel.FacadeSegment, with every mesh kept as arrays. The formatted text cache isn't used
+def get_segment_model(entry, session):
+    segment = FacadeModel.FacadeSegment(entry.name)
+
+    for obj in entry.meshes:
+        local = SegmentUtils.read_local_geometry(obj, session.depsgraph, session.shared_meshes)
+        verticies, indicies = get_output_geometry(local, obj, session)
+        segment.meshes.append(FacadeModel.FacadeMesh(obj.facade_object.group, obj.facade_object.far_lod, obj.facade_object.cuts, verticies, indicies))
+
+    segment.attached_objs = get_attached_obj_models(entry, session)
+    return segment
+
+#Turns parts from iter_segment_parts into text chunks, in order. Text is passed through, MeshJobs are formatted, and callables are called once everything before them is out.
+#With an executor, MeshJobs are formatted on the pool with at most max_pending of them in flight at once.
+def resolve_parts(parts, executor=None, max_pending=0):
+    pending = collections.deque()
+    pending_jobs = 0
+
+    try:
+        for part in parts:
+            if isinstance(part, MeshJob) and executor != None:
+                part.submit(executor)
+                pending_jobs += 1
+            pending.append(part)
+
+            #Hand out everything up to (and including) the oldest job once we have too many in flight
+            while pending_jobs > max_pending:
+                part = pending.popleft()
+                if isinstance(part, MeshJob):
+                    pending_jobs -= 1
+                yield from resolve_part(part)
+
+            #Nothing is waiting on the pool, so text can go straight out
+            if pending_jobs == 0:
+                while len(pending) > 0:
+                    yield from resolve_part(pending.popleft())
+
+        while len(pending) > 0:
+            yield from resolve_part(pending.popleft())
+    finally:
+        #The pool outlives the export, so jobs of an abandoned export mustn't keep it busy
+        for part in pending:
+            if isinstance(part, MeshJob):
+                part.cancel()
+
+#Turns a single part into text chunks. A callable part is called, and the chunks it returns (if any) are passed on
+def resolve_part(part):
+    if isinstance(part, MeshJob):
+        yield from part.get_chunks()
+    elif callable(part):
+        chunks = part()
+        if chunks is not None:
+            yield from chunks
+    else:
+        yield part
+
+#Gets the geometry of a segment, and attached objects, from a layer in a blender scene. Yields the data in chunks of text, formatted for an X-Plane Facade
+def iter_segment(layer, session):
+    return resolve_parts(iter_segment_parts(layer, session))
+
+#Gets the geometry of a segment, and attached objects, from a layer in a blender scene. Returns the all data in a string, formatted for an X-Plane Facade
+#Without a session, one is made for the current scene whose OBJ resources are just this layer's
+def get_segment(layer, session=None):
+    if session != None:
+        return "".join(iter_segment(layer, session))
 
-    #Iterate through the objects in the layer
+    session = ExportSession.ExportSession()
     for obj in layer.objects:
-        #If the object is a segment, get its geometry
-        if obj.type == "MESH":
-            #Get the geometry of this object
-            geometry = SegmentUtils.get_geometry_from_obj(obj)
-
-            #add the mesh header (MESH <group> <far LOD> <cuts> <vertex_count> <idx_count>)
-            output += "MESH\t" + str(obj.facade_object.group) + "\t" + str(obj.facade_object.far_lod) + "\t" + str(obj.facade_object.cuts) + "\t" + str(len(geometry[0])) + "\t" + str(len(geometry[1])) + "\n"
-
-            #Add the verticies
-            for v in geometry[0]:
-                output += v.to_string() + "\n"
-
-            #Add the indicies
-            for i in range(0, len(geometry[1])):
-                #Add the newline idx
-                if (i + 1) % 10 == 1:
-                    output += "IDX "
-
-                #Add the index
-                output += str(geometry[1][i]) + " "
-
-                #Add the newline every 10 indicies
-                if (i + 1) % 10 == 0 and i != 0:
-                    output += "\n"
-            output += "\n"
-
-        #If this is an empty, these typically are an attached object. We will check and handle that here.
-        if obj.type == "EMPTY":
-            attached_obj = SegmentUtils.AttachedObj()
-            attached_obj.read_from_obj(obj)
-
-            if attached_obj.valid:
-                attached_objects.append(attached_obj)
-
-    #Add the attached objects
-    for obj in attached_objects:
-        output += obj.get_string() + "\n"
-
-    #Return the output
-    return output
+        session.resources.add_object(obj)
+    session.resources.finalize()
+    try:
+        return "".join(iter_segment(layer, session))
+    finally:
+        session.finish()
@@ -0,0 +1,138 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Write a file so it is either fully replaced or left alone. Text goes to a temporary file next to the target, which is renamed over it once everything is written, so a crash never leaves a truncated file.
+#While the output matches the existing file nothing is written at all, so an unchanged export doesn't touch the file (or its modified time).
+#The output is compared with the existing file as it streams, rather than hashing both, so we stop reading as soon as they differ. The comparison is of bytes, encoded the way a text mode file would write them, so line ending and encoding differences count as changes.
+
+import os
+import locale
+import tempfile
+
+#Number of bytes copied at a time when the output stops matching the existing file
+COPY_BYTES = 1024 * 1024
+
+#A file-like object (it only has write) that replaces file_path atomically. Use it in a with block, the file is only replaced if the block finishes without an exception.
+#After the block, written is true if the file was replaced and false if the output was identical and it was skipped
+class AtomicWriter:
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.written = False
+
+        self.existing = None    #The existing file, read alongside the output while they match
+        self.matched = 0        #Bytes of output that matched the existing file
+        self.temp = None        #The temporary file, once the output differs
+        self.temp_path = None
+
+        #What open(file_path, "w") would write, the encoding and line ending of the platform
+        self.encoding = locale.getpreferredencoding(False)
+        self.newline = os.linesep
+
+        try:
+            self.existing = open(file_path, "rb", buffering=COPY_BYTES)
+        except OSError:
+            self.existing = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type == None:
+            self.finish()
+        else:
+            self.abort()
+        return False
+
+    #Writes a chunk of text. Nothing is written until the output differs from the existing file
+    def write(self, text):
+        data = self.encode(text)
+        if self.temp == None:
+            if self.existing != None:
+                try:
+                    if self.existing.read(len(data)) == data:
+                        self.matched += len(data)
+                        return
+                except OSError:
+                    pass
+            self.start_temp()
+
+        self.temp.write(data)
+
+    #Encodes text the way a text mode file would write it
+    def encode(self, text):
+        if self.newline != "\n":
+            text = text.replace("\n", self.newline)
+        return text.encode(self.encoding)
+
+    #Opens the temporary file, and copies the part of the existing file that matched so far into it
+    def start_temp(self):
+        directory = os.path.dirname(os.path.abspath(self.file_path))
+        fd, self.temp_path = tempfile.mkstemp(prefix="." + os.path.basename(self.file_path) + ".", suffix=".tmp", dir=directory)
+        self.temp = open(fd, "wb", buffering=COPY_BYTES)
+
+        if self.existing != None:
+            if self.matched > 0:
+                self.existing.seek(0)
+                remaining = self.matched
+                while remaining > 0:
+                    data = self.existing.read(min(remaining, COPY_BYTES))
+                    self.temp.write(data)
+                    remaining -= len(data)
+            self.existing.close()
+            self.existing = None
+
+    #Replaces the file with everything written, unless it was identical. Returns whether the file was written
+    def finish(self):
+        #Everything matched so far, it's only identical if the existing file doesn't go on past the output
+        if self.temp == None and self.existing != None:
+            try:
+                identical = self.existing.read(1) == b""
+            except OSError:
+                identical = False
+
+            if identical:
+                self.existing.close()
+                self.existing = None
+                self.written = False
+                return False
+
+        if self.temp == None:
+            self.start_temp()
+
+        try:
+            self.temp.flush()
+            os.fsync(self.temp.fileno())
+            self.temp.close()
+            self.temp = None
+
+            #Keep the permissions of the file we're replacing (mkstemp makes it private)
+            if os.path.exists(self.file_path):
+                os.chmod(self.temp_path, os.stat(self.file_path).st_mode & 0o777)
+            else:
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(self.temp_path, 0o666 & ~umask)
+
+            os.replace(self.temp_path, self.file_path)
+            self.temp_path = None
+        except Exception:
+            self.abort()
+            raise
+
+        self.written = True
+        return True
+
+    #Throws away everything written, leaving the existing file as it was
+    def abort(self):
+        if self.existing != None:
+            self.existing.close()
+            self.existing = None
+        if self.temp != None:
+            self.temp.close()
+            self.temp = None
+        if self.temp_path != None:
+            try:
+                os.remove(self.temp_path)
+            except OSError:
+                pass
+            self.temp_path = None
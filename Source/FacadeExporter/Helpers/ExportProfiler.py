@@ -0,0 +1,157 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Time each stage of an export, and the objects and collections within it, so a slow export shows where the time goes. Optionally runs cProfile over the whole export too.
+
+import time
+import json
+import io
+import contextlib
+import cProfile
+import pstats
+
+#Stages in the order they are shown, with their display names
+STAGE_NAMES = [
+    ("collection_scan", "Collection Scan"),
+    ("object_list", "Attached Object List"),
+    ("roof", "Roof"),
+    ("header", "Header and Decals"),
+    ("geometry_extraction", "Geometry Extraction"),
+    ("index_order", "Index Order Optimization"),
+    ("formatting", "Mesh Formatting"),
+    ("attached_objects", "Attached Objects"),
+    ("segments", "Segments (Total)"),
+    ("spellings", "Spellings"),
+    ("write", "File Write")
+]
+
+#Collects the timings of one export
+class ExportProfiler:
+    def __init__(self, use_cprofile=False):
+        self.stages = {}
+        self.objects = {}
+        self.collections = {}
+        self.acmr = {}  #Object name -> (triangle count, ACMR before, ACMR after), for meshes whose index order was optimized
+        self.shared_mesh_instances = 0  #Linked duplicates that reused geometry already read for the same mesh
+        self.total_time = 0.0
+        self.start_time = time.perf_counter()
+
+        self.profile = None
+        if use_cprofile:
+            #Only one cProfile can run at a time, if another export is already profiling this one just isn't
+            try:
+                self.profile = cProfile.Profile()
+                self.profile.enable()
+            except ValueError as e:
+                print("Could not start cProfile: " + str(e))
+                self.profile = None
+
+    #Adds time to a stage
+    def add_stage_time(self, name, seconds):
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    #Adds time to an object
+    def add_object_time(self, name, seconds):
+        self.objects[name] = self.objects.get(name, 0.0) + seconds
+
+    #Adds time to a collection
+    def add_collection_time(self, name, seconds):
+        self.collections[name] = self.collections.get(name, 0.0) + seconds
+
+    #Records the vertex cache ACMR of a mesh before and after its index order was optimized
+    def add_acmr(self, name, tri_count, before, after):
+        self.acmr[name] = (tri_count, before, after)
+
+    #Gets the triangle weighted ACMR of every optimized mesh, before and after
+    def get_vertex_cache_summary(self):
+        tri_count = sum(item[0] for item in self.acmr.values())
+        summary = {"meshes": len(self.acmr), "triangles": tri_count, "acmr_before": 0.0, "acmr_after": 0.0}
+        if tri_count > 0:
+            summary["acmr_before"] = sum(item[0] * item[1] for item in self.acmr.values()) / tri_count
+            summary["acmr_after"] = sum(item[0] * item[2] for item in self.acmr.values()) / tri_count
+        return summary
+
+    #Stops the clock (and cProfile)
+    def finish(self):
+        self.total_time = time.perf_counter() - self.start_time
+        if self.profile != None:
+            self.profile.disable()
+
+    #Times a block of code as a stage
+    @contextlib.contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_stage_time(name, time.perf_counter() - start)
+
+    #Records time spent on a stage, and optionally on an object and collection too
+    def add_time(self, seconds, stage_name=None, object_name=None, collection_name=None):
+        if stage_name != None:
+            self.add_stage_time(stage_name, seconds)
+        if object_name != None:
+            self.add_object_time(object_name, seconds)
+        if collection_name != None:
+            self.add_collection_time(collection_name, seconds)
+
+    #Passes items through from a generator, timing only the time spent producing them (not the time the consumer spends between items)
+    def timed_iter(self, iterable, stage_name=None, collection_name=None):
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add_time(time.perf_counter() - start, stage_name, None, collection_name)
+                return
+            self.add_time(time.perf_counter() - start, stage_name, None, collection_name)
+            yield item
+
+    #Gets the top functions from cProfile as a list of dictionaries, sorted by cumulative time
+    def get_profile_functions(self, top_count):
+        if self.profile == None:
+            return []
+
+        stats = pstats.Stats(self.profile, stream=io.StringIO())
+        functions = []
+        for (file, line, function), (calls, primitive_calls, own_time, cumulative_time, callers) in stats.stats.items():
+            functions.append({"function": function, "file": file, "line": line, "calls": calls, "own_time": own_time, "cumulative_time": cumulative_time})
+
+        functions.sort(key=lambda item: item["cumulative_time"], reverse=True)
+        return functions[:top_count]
+
+    #Gets the report as a dictionary (it's written as JSON as is)
+    def get_report(self, top_count=10):
+        stages = []
+        for name, label in STAGE_NAMES:
+            if name in self.stages:
+                stages.append({"stage": name, "label": label, "seconds": self.stages[name]})
+
+        objects = sorted(self.objects.items(), key=lambda item: item[1], reverse=True)[:top_count]
+        collections = sorted(self.collections.items(), key=lambda item: item[1], reverse=True)[:top_count]
+
+        return {
+            "total_seconds": self.total_time,
+            "stages": stages,
+            "top_objects": [{"name": name, "seconds": seconds} for name, seconds in objects],
+            "top_collections": [{"name": name, "seconds": seconds} for name, seconds in collections],
+            "vertex_cache": self.get_vertex_cache_summary(),
+            "shared_mesh_instances": self.shared_mesh_instances,
+            "profile": self.get_profile_functions(top_count)
+        }
+
+#The report of the last finished export, shown in the panel
+last_report = None
+
+#Finishes a profiler and keeps its report as the last one. Returns the report
+def finish(profiler, top_count=10):
+    global last_report
+    profiler.finish()
+    last_report = profiler.get_report(top_count)
+    return last_report
+
+#Writes a report as JSON
+def write_report(report, file_path):
+    with open(file_path, "w") as file:
+        json.dump(report, file, indent=4)
@@ -0,0 +1,87 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Write .fac files on background threads. The facade text is generated on the main thread (bpy isn't thread safe), each chunk is queued, and the file's thread does the I/O: comparing against the existing file, writing the temporary file, the fsync, and the rename (see AtomicWriter).
+#Exporting every facade, each file gets its own QueuedWriter, so earlier files are still being written while the next facade is generated.
+
+import os
+import queue
+import threading
+from . import AtomicWriter
+
+#Chunks queued per file. Bounded so a slow disk doesn't let the whole facade pile up in memory
+MAX_PENDING_CHUNKS = 256
+
+#Queued in place of a chunk to throw the output away
+ABORT = object()
+
+#A file-like object (it only has write) that replaces file_path atomically from a background thread. Use it in a with block like an AtomicWriter, or call finish/abort.
+#An error on the thread is raised by the next write, or by finish
+class QueuedWriter:
+    def __init__(self, file_path, max_pending=MAX_PENDING_CHUNKS):
+        self.file_path = file_path
+        self.written = False
+        self.error = None
+        self.done = False
+
+        self.writer = AtomicWriter.AtomicWriter(file_path)
+        self.queue = queue.Queue(max_pending)
+        self.thread = threading.Thread(target=self.run, name="Write " + os.path.basename(file_path), daemon=True)
+        self.thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type == None:
+            self.finish()
+        else:
+            self.abort()
+        return False
+
+    #The thread. Writes chunks until None (finish) or ABORT
+    def run(self):
+        chunk = ""
+        try:
+            chunk = self.queue.get()
+            while chunk is not None and chunk is not ABORT:
+                self.writer.write(chunk)
+                chunk = self.queue.get()
+
+            if chunk is None:
+                self.writer.finish()
+            else:
+                self.writer.abort()
+        except BaseException as e:
+            self.error = e
+            self.writer.abort()
+
+            #Keep taking chunks until the end, so the export never blocks on a full queue. It sees the error on its next write
+            while chunk is not None and chunk is not ABORT:
+                chunk = self.queue.get()
+
+    #Queues a chunk of text. Blocks while the queue is full
+    def write(self, text):
+        if self.error != None:
+            raise self.error
+        self.queue.put(text)
+
+    #Waits for everything queued to be written, and the file replaced (unless it was identical). Returns whether the file was written
+    def finish(self):
+        if not self.done:
+            self.done = True
+            self.queue.put(None)
+            self.thread.join()
+
+        if self.error != None:
+            raise self.error
+
+        self.written = self.writer.written
+        return self.written
+
+    #Throws away everything queued and written, leaving the existing file as it was
+    def abort(self):
+        if not self.done:
+            self.done = True
+            self.queue.put(ABORT)
+            self.thread.join()
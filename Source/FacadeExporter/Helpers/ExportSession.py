@@ -0,0 +1,128 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Hold the state of one export: the scene and facade it reads, a snapshot of its settings, its OBJ resource table, the caches, and its timers.
+#The session is passed through the whole pipeline, so two exports in one Blender instance don't share any state. The geometry cache is the exception, it is keyed on content so sharing it is safe (and the point).
+
+import uuid
+import bpy # type: ignore
+
+#Our modules
+from . import SegmentUtils
+from . import GeometryCache
+from . import ExportTracker
+from . import ExportProfiler
+from . import SceneIndex
+
+#The export options, copied when the export starts. Changing them in the UI part way through an export doesn't affect it
+class ExportSettings:
+    def __init__(self, f):
+        self.fast_extraction = f.fast_extraction
+        self.weld_vertices = f.weld_vertices
+        self.weld_tolerance = f.weld_tolerance
+        self.optimize_index_order = f.weld_vertices and f.optimize_index_order
+        self.cache_size_mb = f.cache_size_mb
+        self.incremental_export = f.incremental_export
+        self.export_workers = f.export_workers
+        self.export_pool = f.export_pool
+        self.write_timing_report = f.write_timing_report
+        self.profile_export = f.profile_export
+        self.timing_report_count = f.timing_report_count
+        self.nested_collections = f.nested_collections
+
+    #Gets the options that change a mesh's text, these are part of the cache keys
+    def get_mesh_options(self):
+        return (self.weld_vertices, self.weld_tolerance, self.optimize_index_order)
+
+#Gets every facade defined in a scene. The first is the scene's own facade_exporter, then any added in the panel
+def get_facades(scene):
+    return [scene.facade_exporter] + list(scene.facade_exporters)
+
+#Gets the facade selected in the panel
+def get_active_facade(scene):
+    facades = get_facades(scene)
+    return facades[min(max(scene.facade_exporter_index, 0), len(facades) - 1)]
+
+#Gives every facade in the file a unique facade_id, which is what exports and analyses are tracked by. Pointers to the facades can't be used, adding or removing one moves the rest.
+#Copying a scene copies its facades' ids too, so duplicates get a new one. This writes to the facades, so it can't run while the panel is drawn
+def assign_facade_ids():
+    seen = set()
+    for scene in bpy.data.scenes:
+        for facade in get_facades(scene):
+            if facade.facade_id == "" or facade.facade_id in seen:
+                facade.facade_id = uuid.uuid4().hex
+            seen.add(facade.facade_id)
+
+#Gets the names of the root collections of a scene's other facades. A facade never includes another facade's collections
+def get_other_roots(scene, facade):
+    return {other.root_collection.name for other in get_facades(scene) if other.root_collection != None and other.root_collection != facade.root_collection}
+
+#Gets a view layer's evaluated depsgraph, evaluating it if needed
+def get_evaluated_depsgraph(view_layer):
+    if view_layer == bpy.context.view_layer:
+        return bpy.context.evaluated_depsgraph_get()
+
+    depsgraph = view_layer.depsgraph
+    depsgraph.update()
+    return depsgraph
+
+#State of one export
+class ExportSession:
+    #Starts an export of a scene's facade, the current scene and view layer, and the active facade, by default
+    def __init__(self, scene=None, view_layer=None, facade=None):
+        if scene == None:
+            scene = bpy.context.scene
+        if view_layer == None:
+            view_layer = bpy.context.view_layer if scene == bpy.context.scene else scene.view_layers[0]
+
+        self.scene = scene
+        self.view_layer = view_layer
+
+        #The evaluated depsgraph meshes are read from (with their modifiers applied). It's evaluated once here, not once per object
+        self.depsgraph = get_evaluated_depsgraph(view_layer)
+
+        #The facade's properties, the header is built from these
+        assign_facade_ids()
+        if facade == None:
+            facade = get_active_facade(scene)
+        self.facade = facade
+        self.settings = ExportSettings(self.facade)
+
+        #The collections this facade is made of: everything under its root collection (the whole scene if it has none), minus other facades' roots
+        self.root_collection = facade.root_collection
+        self.skip_collections = get_other_roots(scene, facade)
+
+        #Identifies this facade to ExportTracker, changes are tracked per target
+        self.target = ("facade", facade.facade_id)
+        self.start_update = ExportTracker.get_update_count()
+
+        #The OBJ resources of this export
+        self.resources = SegmentUtils.ResourceTable()
+
+        #Geometry of the meshes read so far, so linked duplicates are only read once per export
+        self.shared_meshes = SegmentUtils.SharedMeshTable()
+
+        #The geometry cache, shared by every session
+        self.cache = GeometryCache.cache
+
+        #Timers
+        self.profiler = ExportProfiler.ExportProfiler(self.settings.profile_export)
+        self.report = None
+
+        #Problems found while exporting that didn't stop it, the operator reports them
+        self.warnings = []
+
+    #Indexes the collections of this facade (see Helpers.SceneIndex)
+    def build_index(self):
+        return SceneIndex.build_index(self.view_layer, self.root_collection, self.skip_collections, self.settings.nested_collections)
+
+    #Records that the facade was fully written, so the next incremental export is relative to this one. Call it once the writer has committed the file, not when the text has been generated
+    def mark_exported(self):
+        ExportTracker.mark_exported(self.target, self.start_update)
+
+    #Stops the timers. Returns the timing report (see ExportProfiler), which is also shown in the panel
+    def finish(self):
+        if self.report == None:
+            self.profiler.shared_mesh_instances = self.shared_meshes.hits
+            self.report = ExportProfiler.finish(self.profiler, self.settings.timing_report_count)
+        return self.report
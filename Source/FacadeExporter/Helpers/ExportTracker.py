@@ -0,0 +1,88 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Track which objects and collections changed since the last export, so an incremental export only regenerates the segments that were touched.
+#Every facade (export target) remembers when it was last exported, so exporting one facade doesn't hide changes from another.
+
+import bpy # type: ignore
+from bpy.app.handlers import persistent # type: ignore
+
+#Counts depsgraph updates. Changes are stamped with this, so "changed since the last export" is a comparison
+update_count = 0
+
+#Pointers of the objects, collections, and mesh datablocks that changed, and the update_count when they last did.
+#Meshes are tracked on their own since an edit to a mesh shared by linked duplicates doesn't always show up as an update of every object using it
+changed_objects = {}
+changed_collections = {}
+changed_meshes = {}
+
+#Export target key -> update_count when it was last exported. A target that isn't here hasn't been exported yet, so everything has changed for it
+last_exports = {}
+
+#Records what changed. This runs on every depsgraph update while modelling so it only collects pointers.
+@persistent
+def on_depsgraph_update(scene, depsgraph):
+    global update_count
+    if len(last_exports) == 0:
+        return
+
+    update_count += 1
+    for update in depsgraph.updates:
+        id = update.id
+        if isinstance(id, bpy.types.Object):
+            changed_objects[id.original.as_pointer()] = update_count
+        elif isinstance(id, bpy.types.Collection):
+            changed_collections[id.original.as_pointer()] = update_count
+        elif isinstance(id, bpy.types.Mesh):
+            changed_meshes[id.original.as_pointer()] = update_count
+
+#Nothing from the last file can be reused
+@persistent
+def on_load(dummy):
+    reset()
+
+#Forgets everything, the next export of every target regenerates every segment
+def reset():
+    global update_count
+    update_count = 0
+    changed_objects.clear()
+    changed_collections.clear()
+    changed_meshes.clear()
+    last_exports.clear()
+
+#Gets the update_count to pass to mark_exported. Take it when the export starts, so changes made while exporting count as after it
+def get_update_count():
+    return update_count
+
+#Returns true if a collection, or any object in it (its mesh, or any of its parents, wherever they are), changed since the target was last exported
+def is_collection_changed(collection, target):
+    since = last_exports.get(target)
+    if since == None or changed_collections.get(collection.as_pointer(), 0) > since:
+        return True
+
+    for obj in collection.objects:
+        if obj.type == "MESH" and changed_meshes.get(obj.data.as_pointer(), 0) > since:
+            return True
+
+        while obj != None:
+            if changed_objects.get(obj.as_pointer(), 0) > since:
+                return True
+            obj = obj.parent
+
+    return False
+
+#Gets the key a segment's text is cached under. Anything that changes the text without a depsgraph update (export options, the OBJ list, which objects are in the collection) is part of the key
+def get_segment_key(collection, options, resources):
+    return ("segment", collection.as_pointer(), tuple(obj.as_pointer() for obj in collection.objects), options, tuple(resources))
+
+#Call once a target has been fully written, with the update_count from when its export started. Changes from there on are relative to this export
+def mark_exported(target, count):
+    last_exports[target] = count
+    prune_changes()
+
+#Forgets changes from before every target's last export. They can't count as changed for any target anymore, so the tables would only keep growing over the session
+def prune_changes():
+    oldest = min(last_exports.values())
+    for changed in (changed_objects, changed_collections, changed_meshes):
+        for pointer in [pointer for pointer, count in changed.items() if count <= oldest]:
+            del changed[pointer]
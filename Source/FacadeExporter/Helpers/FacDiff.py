@@ -0,0 +1,106 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Compare two .fac files by what they mean instead of character by character. Numbers are compared with a tolerance, so float noise between Blender versions (i.e. 0.18745191 vs 0.18745190) doesn't count as a difference.
+#Both files are streamed side by side (see FacParser.iter_directives), so only one mesh from each is held at a time.
+
+import numpy as np
+from . import FacParser
+
+#Names of the 8 vertex columns, in FacParser's order
+VERTEX_COLUMN_NAMES = ["x", "y", "z", "normal x", "normal y", "normal z", "u", "v"]
+
+#The first difference between two files. where is the part of the file it's in (i.e. "Segment 2 (curved), mesh 1"), the line numbers are each file's line of the directive
+class FacDifference:
+    def __init__(self, where, message, line_a, line_b):
+        self.where = where
+        self.message = message
+        self.line_a = line_a
+        self.line_b = line_b
+
+    def __str__(self):
+        return self.where + ", lines " + str(self.line_a) + "/" + str(self.line_b) + ": " + self.message
+
+#Compares two words. Numbers are equal within the tolerance, anything else must match exactly
+def words_equal(word_a, word_b, tolerance):
+    if word_a == word_b:
+        return True
+    try:
+        return abs(float(word_a) - float(word_b)) <= tolerance
+    except ValueError:
+        return False
+
+#Compares two FacMeshes. Returns a message describing the first difference, or None
+def compare_meshes(mesh_a, mesh_b, tolerance):
+    if len(mesh_a.verticies) != len(mesh_b.verticies):
+        return "vertex counts differ, " + str(len(mesh_a.verticies)) + " vs " + str(len(mesh_b.verticies))
+    if len(mesh_a.indicies) != len(mesh_b.indicies):
+        return "index counts differ, " + str(len(mesh_a.indicies)) + " vs " + str(len(mesh_b.indicies))
+
+    different = np.abs(mesh_a.verticies - mesh_b.verticies) > tolerance
+    if different.any():
+        vertex, column = np.unravel_index(np.argmax(different), different.shape)
+        return "vertex " + str(vertex) + " " + VERTEX_COLUMN_NAMES[column] + " differs, " + repr(float(mesh_a.verticies[vertex, column])) + " vs " + repr(float(mesh_b.verticies[vertex, column]))
+
+    different = mesh_a.indicies != mesh_b.indicies
+    if different.any():
+        index = int(np.argmax(different))
+        return "index " + str(index) + " differs, " + str(mesh_a.indicies[index]) + " vs " + str(mesh_b.indicies[index])
+
+    return None
+
+#Compares two open .fac files. Returns a FacDifference for the first difference, or None if they're the same (within the tolerance). A file that can't be parsed (i.e. a truncated mesh) is a difference too
+def compare_files(file_a, file_b, tolerance=1e-6):
+    directives_a = FacParser.iter_directives(file_a)
+    directives_b = FacParser.iter_directives(file_b)
+    where = "Header"
+    mesh_index = 0
+
+    while True:
+        try:
+            directive_a = next(directives_a, None)
+        except ValueError as e:
+            return FacDifference(where, "the first file can't be parsed (" + str(e) + ")", None, None)
+        try:
+            directive_b = next(directives_b, None)
+        except ValueError as e:
+            return FacDifference(where, "the second file can't be parsed (" + str(e) + ")", None, None)
+
+        if directive_a == None and directive_b == None:
+            return None
+        if directive_a == None:
+            return FacDifference(where, "the first file ends before \"" + " ".join(directive_b[1][:6]) + "\"", None, directive_b[0])
+        if directive_b == None:
+            return FacDifference(where, "the second file ends before \"" + " ".join(directive_a[1][:6]) + "\"", directive_a[0], None)
+
+        line_a, words_a, mesh_a = directive_a
+        line_b, words_b, mesh_b = directive_b
+
+        #Keep track of where we are for the report
+        if words_a[0] == "SEGMENT" or words_a[0] == "SEGMENT_CURVED":
+            where = "Segment " + (words_a[1] if len(words_a) > 1 else "?") + (" (curved)" if words_a[0] == "SEGMENT_CURVED" else "")
+            mesh_index = 0
+        elif words_a[0] in ("WALL", "WALL_RULE", "SPELLING"):
+            where = "Spellings"
+
+        if mesh_a != None or mesh_b != None:
+            mesh_where = where + ", mesh " + str(mesh_index)
+            mesh_index += 1
+
+            if mesh_a == None or mesh_b == None:
+                return FacDifference(mesh_where, "only one file has a mesh here: " + " ".join(words_a[:6]) + " vs " + " ".join(words_b[:6]), line_a, line_b)
+            if words_a[1:4] != words_b[1:4]:
+                return FacDifference(mesh_where, "group, far LOD, or segments differ: " + " ".join(words_a[1:4]) + " vs " + " ".join(words_b[1:4]), line_a, line_b)
+
+            message = compare_meshes(mesh_a, mesh_b, tolerance)
+            if message != None:
+                return FacDifference(mesh_where, message, line_a, line_b)
+            continue
+
+        if len(words_a) != len(words_b) or not all(words_equal(word_a, word_b, tolerance) for word_a, word_b in zip(words_a, words_b)):
+            return FacDifference(where, "\"" + " ".join(words_a) + "\" vs \"" + " ".join(words_b) + "\"", line_a, line_b)
+
+#Compares two .fac files by path. Returns a FacDifference for the first difference, or None if they're the same (within the tolerance)
+def compare(path_a, path_b, tolerance=1e-6):
+    with open(path_a, "r", buffering=1024 * 1024) as file_a, open(path_b, "r", buffering=1024 * 1024) as file_b:
+        return compare_files(file_a, file_b, tolerance)
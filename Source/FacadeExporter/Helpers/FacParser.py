@@ -0,0 +1,219 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Parse a type 2 .fac into plain Python and NumPy data (no bpy), the reverse of what GetFacade writes. The file is streamed line by line, and each mesh's VERTEX and IDX blocks are read as a whole and converted to arrays in one go.
+#ImportFacade turns the result into Blender data.
+
+import hashlib
+import itertools
+import numpy as np
+from . import FormatUtils
+
+#A MESH block. Verticies are an n x 8 array laid out like GeometryUtils.VertexBuffer.to_array, indicies are 3 per triangle
+class FacMesh:
+    def __init__(self, group, far_lod, cuts, verticies, indicies):
+        self.group = group
+        self.far_lod = far_lod
+        self.cuts = cuts
+        self.verticies = verticies
+        self.indicies = indicies
+
+#An ATTACH_GRADED, ATTACH_DRAPED, or ROOF_OBJ_HEADING line. Positions are in Blender's axes, the heading is X-Plane's (degrees)
+class FacAttachedObj:
+    def __init__(self, resource_index, x, y, z, heading, draped=False, roof_obj=False):
+        self.resource_index = resource_index
+        self.x = x
+        self.y = y
+        self.z = z
+        self.heading = heading
+        self.draped = draped
+        self.roof_obj = roof_obj
+
+#A SEGMENT or SEGMENT_CURVED block. The digest is of its content, so a curved segment that's just a copy of its straight one can be spotted
+class FacSegment:
+    def __init__(self, index, curved):
+        self.index = index
+        self.curved = curved
+        self.meshes = []
+        self.attached_objs = []
+        self.digest = hashlib.blake2b(digest_size=16)
+
+#A decal line. kind is "LIB", "ALB", or "NML". values are the numbers in the order they're written, see DecalProperties.to_string
+class FacDecal:
+    def __init__(self, kind, projected, values, path):
+        self.kind = kind
+        self.projected = projected
+        self.values = values
+        self.path = path
+
+#Everything read from a .fac
+class FacFile:
+    def __init__(self):
+        #Scene properties, keyed by their name in FacadeProperties.PROP_facade_exporter
+        self.properties = {"ring": False, "graded": False, "layergroup": "", "layergroup_draped": "", "render_wall": True, "render_roof": True, "roof_height": 0.0}
+        self.wall_decals = []
+        self.roof_decals = []
+
+        self.resources = []         #OBJ paths, in order
+        self.roof_scale = (1.0, 1.0)
+        self.roof_objs = []         #FacAttachedObj
+        self.segments = []          #Straight FacSegments, in order
+        self.curved_segments = {}   #Segment index -> curved FacSegment
+        self.spellings = []         #Dictionaries keyed by FacadeProperties.FacadeSpellingItem's property names
+
+#Reads count lines from a file, and converts every number on them (after the first word of each line) into one array
+def read_block(file, count, dtype):
+    lines = list(itertools.islice(file, count))
+    text = "".join(line.split(None, 1)[1] if " " in line or "\t" in line else "" for line in lines)
+    return lines, np.array(text.split(), dtype=dtype)
+
+#Reads a MESH block after its MESH line. Returns the FacMesh and the number of lines read
+def read_mesh(file, words, line_number):
+    group, far_lod, cuts, vertex_count, index_count = (int(word) for word in words[1:6])
+
+    vertex_lines, values = read_block(file, vertex_count, np.float64)
+    line_count = len(vertex_lines)
+    if len(values) != vertex_count * 8:
+        raise ValueError("Line " + str(line_number) + ": MESH has " + str(vertex_count) + " verticies, but " + str(len(values)) + " VERTEX values follow it")
+    #The written columns have y and z swapped, swapping them again gets back to loc x y z, normal x y z, uv x y
+    verticies = values.reshape(-1, 8)[:, FormatUtils.VERTEX_COLUMNS]
+
+    #IDX lines normally hold 10 indicies each, if they hold fewer keep reading until we have them all
+    index_lines, indicies = read_block(file, (index_count + 9) // 10, np.int64)
+    line_count += len(index_lines)
+    parts = [indicies]
+    found = len(indicies)
+    while found < index_count:
+        more_lines, more = read_block(file, 1, np.int64)
+        if len(more_lines) == 0:
+            raise ValueError("Line " + str(line_number) + ": MESH has " + str(index_count) + " indicies, but the file ends after " + str(found))
+        line_count += 1
+        parts.append(more)
+        found += len(more)
+    indicies = np.concatenate(parts)[:index_count]
+
+    if len(indicies) > 0 and (indicies.min() < 0 or indicies.max() >= vertex_count):
+        raise ValueError("Line " + str(line_number) + ": MESH has indicies outside its " + str(vertex_count) + " verticies")
+
+    return FacMesh(group, far_lod, cuts, verticies, indicies), line_count
+
+#Parses a decal line into a FacDecal
+def read_decal(words):
+    if words[0] == "DECAL_LIB":
+        return FacDecal("LIB", False, [], words[1] if len(words) > 1 else "")
+
+    kind = "NML" if words[0].startswith("NORMAL_") else "ALB"
+    projected = words[0].endswith("_PROJ")
+    return FacDecal(kind, projected, [float(word) for word in words[1:-1]], words[-1])
+
+#Streams the directives of an open .fac. Yields (line number, words, FacMesh), the mesh is only set for MESH lines, and its VERTEX and IDX lines are read with it.
+#Blank lines are skipped. Only one mesh is held at a time, so this works on files of any size
+def iter_directives(file):
+    line_number = 0
+    for line in file:
+        line_number += 1
+        words = line.split()
+        if len(words) == 0:
+            continue
+
+        if words[0] == "MESH":
+            mesh, line_count = read_mesh(file, words, line_number)
+            yield line_number, words, mesh
+            line_number += line_count
+        else:
+            yield line_number, words, None
+
+#Parses an open .fac. Returns a FacFile
+def read_fac_file(file):
+    fac = FacFile()
+
+    section = "wall"    #Which shader the header lines apply to
+    segment = None
+
+    for line_number, words, mesh in iter_directives(file):
+        token = words[0]
+
+        #Segments. Everything after a SEGMENT line belongs to it, and goes into its digest
+        if token == "SEGMENT" or token == "SEGMENT_CURVED":
+            segment = FacSegment(int(words[1]), token == "SEGMENT_CURVED")
+            if segment.curved:
+                fac.curved_segments[segment.index] = segment
+            else:
+                fac.segments.append(segment)
+            continue
+
+        if token == "MESH":
+            if segment == None:
+                raise ValueError("Line " + str(line_number) + ": MESH outside of a segment")
+            segment.meshes.append(mesh)
+            segment.digest.update(" ".join(words).encode())
+            segment.digest.update(mesh.verticies.tobytes())
+            segment.digest.update(mesh.indicies.tobytes())
+            continue
+
+        if token == "ATTACH_GRADED" or token == "ATTACH_DRAPED":
+            if segment == None:
+                raise ValueError("Line " + str(line_number) + ": " + token + " outside of a segment")
+            #Written as index, x, z, y, heading, min draw, max draw
+            segment.attached_objs.append(FacAttachedObj(int(words[1]), float(words[2]), float(words[4]), float(words[3]), float(words[5]), token == "ATTACH_DRAPED"))
+            segment.digest.update(" ".join(words).encode())
+            continue
+
+        #Spellings come after the segments
+        if token == "WALL":
+            fac.spellings.append({"type": "WALL", "min_width": float(words[1]), "max_width": float(words[2]), "min_heading": float(words[3]), "max_heading": float(words[4]), "wall_name": " ".join(words[5:])})
+            continue
+        if token == "WALL_RULE":
+            #The enum value really does have a trailing space, see FacadeProperties.FacadeSpellingItem
+            fac.spellings.append({"type": "WALL_RULE ", "min_width": float(words[1]), "max_width": float(words[2]), "min_heading": float(words[3]), "max_heading": float(words[4])})
+            continue
+        if token == "SPELLING":
+            fac.spellings.append({"type": "SPELLING", "spellings": " ".join(words[1:])})
+            continue
+
+        #Header
+        if token == "RING":
+            fac.properties["ring"] = len(words) > 1 and words[1] == "1"
+        elif token == "GRADED":
+            fac.properties["graded"] = True
+        elif token == "DRAPED":
+            fac.properties["graded"] = False
+        elif token == "LAYER_GROUP":
+            fac.properties["layergroup"] = " ".join(words[1:])
+        elif token == "LAYER_GROUP_DRAPED":
+            fac.properties["layergroup_draped"] = " ".join(words[1:])
+        elif token == "SHADER_WALL":
+            section = "wall"
+        elif token == "SHADER_ROOF":
+            section = "roof"
+        elif token == "NO_WALL_MESH":
+            fac.properties["render_wall"] = False
+            section = "roof"
+        elif token == "NO_ROOF_MESH":
+            fac.properties["render_roof"] = False
+        elif token == "TEXTURE":
+            fac.properties[section + "_texture_alb"] = " ".join(words[1:])
+        elif token == "TEXTURE_NORMAL":
+            fac.properties[section + "_texture_nml_scale"] = float(words[1])
+            fac.properties[section + "_texture_nml"] = " ".join(words[2:])
+        elif token == "TEXTURE_MODULATOR":
+            fac.properties[section + "_modulator_texture"] = " ".join(words[1:])
+        elif token in ("DECAL_LIB", "DECAL_PARAMS", "DECAL_PARAMS_PROJ", "NORMAL_DECAL_PARAMS", "NORMAL_DECAL_PARAMS_PROJ"):
+            decals = fac.wall_decals if section == "wall" else fac.roof_decals
+            decals.append(read_decal(words))
+        elif token == "OBJ":
+            fac.resources.append(" ".join(words[1:]))
+        elif token == "ROOF_HEIGHT":
+            fac.properties["roof_height"] = float(words[1])
+        elif token == "ROOF_SCALE":
+            fac.roof_scale = (float(words[1]), float(words[2]))
+        elif token == "ROOF_OBJ_HEADING":
+            #Written as index, x, y, heading, min draw, max draw
+            fac.roof_objs.append(FacAttachedObj(int(words[1]), float(words[2]), float(words[3]), 0.0, float(words[4]), False, True))
+
+    return fac
+
+#Parses a .fac file. Returns a FacFile
+def read_fac(file_path):
+    with open(file_path, "r", buffering=1024 * 1024) as file:
+        return read_fac_file(file)
@@ -0,0 +1,202 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Turn a Helpers.FacadeModel into .fac text. Plain Python and NumPy only, so this runs without Blender (in worker processes, or under plain python for benchmarks).
+
+from . import FormatUtils
+from . import MiscUtils
+
+#Number of VERTEX/IDX lines joined into each chunk
+CHUNK_LINES = 4096
+
+#Removes the // Blender puts in front of relative paths
+def strip_relative(path):
+    if path.startswith("//"):
+        return path[2:]
+    return path
+
+#Gets the text of one decal slot (a FacadeDecal). Empty if the slot is hidden, disabled, or has no texture
+def get_decal_text(decal):
+    if (not decal.visible) or (not decal.enabled):
+        return ""
+
+    if decal.decal_lib != "":
+        return "DECAL_LIB " + decal.decal_lib + "\n"
+
+    #Make sure there is a texture specified
+    if decal.alb == "" and decal.nml == "":
+        return ""
+
+    decal_string_alb = ""
+    decal_string_nml = ""
+
+    #Start off the decals
+    if decal.projected:
+        if (decal.type == "ALB" or decal.type == "BOTH") and decal.alb != "":
+            decal_string_alb = "DECAL_PARAMS_PROJ " + MiscUtils.ftos(decal.scale_x, 2) + " " + MiscUtils.ftos(decal.scale_y, 2) + " "
+        if (decal.type == "BOTH" or decal.type == "NML") and decal.nml != "":
+            decal_string_nml = "NORMAL_DECAL_PARAMS_PROJ " + MiscUtils.ftos(decal.scale_x, 2) + " " + MiscUtils.ftos(decal.scale_y, 2) + " "
+    else:
+        if (decal.type == "ALB" or decal.type == "BOTH") and decal.alb != "":
+            decal_string_alb = "DECAL_PARAMS " + MiscUtils.ftos(decal.tile_ratio, 2) + " "
+        if (decal.type == "BOTH" or decal.type == "NML") and decal.nml != "":
+            decal_string_nml = "NORMAL_DECAL_PARAMS " + MiscUtils.ftos(decal.tile_ratio, 2) + " "
+
+    #For readability
+    p = decal
+    ftos = MiscUtils.ftos
+
+    #Finish off the albedo
+    if decal_string_alb != "":
+        decal_string_alb += (ftos(p.dither_ratio, 2) + " " +
+                             ftos(p.rgb_decal_key_red, 2) + " " + ftos(p.rgb_decal_key_green, 2) + " " + ftos(p.rgb_decal_key_blue, 2) + " " + ftos(p.rgb_decal_key_alpha, 2) + " " +
+                             ftos(p.rgb_strength_modulator, 2) + " " + ftos(p.rgb_strength_constant, 2) + " " +
+                             ftos(p.alpha_decal_key_red, 2) + " " + ftos(p.alpha_decal_key_green, 2) + " " + ftos(p.alpha_decal_key_blue, 2) + " " + ftos(p.alpha_decal_key_alpha, 2) + " " +
+                             ftos(p.alpha_strength_modulator, 2) + " " + ftos(p.alpha_strength_constant, 2) + " " + strip_relative(p.alb))
+
+    #Finish off the normal
+    if decal_string_nml != "":
+        decal_string_nml += (ftos(p.rgb_decal_key_red, 2) + " " + ftos(p.rgb_decal_key_green, 2) + " " + ftos(p.rgb_decal_key_blue, 2) + " " + ftos(p.rgb_decal_key_alpha, 2) + " " +
+                             ftos(p.rgb_strength_modulator, 2) + " " + ftos(p.rgb_strength_constant, 2) + " " + strip_relative(p.nml))
+
+    return decal_string_alb + "\n" + decal_string_nml + "\n"
+
+#Gets the text of the wall or roof shader (a FacadeShader). name is WALL or ROOF
+def get_shader_text(shader, name):
+    if not shader.render:
+        return "\nNO_" + name + "_MESH\n"
+
+    text = ""
+
+    #Specify which shader this is for, if we have anything to do
+    if shader.texture_alb != "" or shader.texture_nml != "":
+        text += "\nSHADER_" + name + "\n"
+
+    if shader.texture_alb != "":
+        text += "TEXTURE " + strip_relative(shader.texture_alb) + "\n"
+    if shader.texture_nml != "":
+        text += "TEXTURE_NORMAL " + str(shader.texture_nml_scale) + " " + strip_relative(shader.texture_nml) + "\n"
+        text += "SPECULAR 1.0\nNORMAL_METALNESS\n"
+
+    #Decals
+    if shader.modulator_texture != "":
+        text += "TEXTURE_MODULATOR " + strip_relative(shader.modulator_texture) + "\n"
+
+    for decal in shader.decals:
+        text += get_decal_text(decal)
+
+    return text
+
+#Gets the header text (a FacadeHeader), up to and including the OBJ lines
+def get_header_text(header):
+    text = "I\n1000\nFACADE\n\n"
+
+    #General properties
+    if header.ring:
+        text += "RING 1\n"
+    else:
+        text += "RING 0\n"
+    if header.graded:
+        text += "GRADED\n"
+    else:
+        text += "DRAPED\n"
+    if header.layergroup != "":
+        text += "LAYER_GROUP " + header.layergroup + "\n"
+    if header.layergroup_draped != "":
+        text += "LAYER_GROUP_DRAPED " + header.layergroup_draped + "\n"
+
+    text += get_shader_text(header.wall, "WALL")
+    text += get_shader_text(header.roof, "ROOF")
+
+    #Object definitions
+    for resource in header.resources:
+        text += "OBJ " + resource + "\n"
+
+    return text
+
+#Gets the line (without the newline) of an attached or roof object (a FacadeAttachedObj)
+def get_attached_obj_text(obj):
+    #Add the data index, x, y, z, rot_z, min_draw, max_draw
+    if obj.roof_obj:
+        return "ROOF_OBJ_HEADING " + str(obj.resource_index) + " " + MiscUtils.ftos(obj.loc_x, 8) + " " + MiscUtils.ftos(obj.loc_y, 8) + " " + MiscUtils.ftos(MiscUtils.resolve_heading(obj.rot_z * -1), 4) + " " + str(obj.min_draw) + " " + str(obj.max_draw)
+
+    out = "ATTACH_DRAPED " if obj.draped else "ATTACH_GRADED "
+    return out + str(obj.resource_index) + " " + MiscUtils.ftos(obj.loc_x, 8) + " " + MiscUtils.ftos(obj.loc_z, 8) + " " + MiscUtils.ftos(obj.loc_y, 8) + " " + MiscUtils.ftos(MiscUtils.resolve_heading(obj.rot_z + 180), 3) + " " + str(obj.min_draw) + " " + str(obj.max_draw)
+
+#Gets the roof text (a FacadeRoof)
+def get_roof_text(roof):
+    text = "FLOOR Default\n"
+    text += "ROOF_HEIGHT " + str(roof.height) + "\n"
+    text += "ROOF_SCALE " + str(roof.scale_x) + " " + str(roof.scale_y) + "\n"
+
+    if len(roof.objs) > 0:
+        text += "\n"
+
+    for obj in roof.objs:
+        text += get_attached_obj_text(obj) + "\n"
+
+    return text
+
+#Gets the text of the spellings (FacadeSpellings)
+def get_spelling_text(spellings):
+    text = ""
+    for item in spellings:
+        if item.type == "WALL":
+            text += "WALL " + str(item.min_width) + " " + str(item.max_width) + " " + str(item.min_heading) + " " + str(item.max_heading) + " " + item.wall_name + "\n"
+        elif item.type == "WALL_RULE":
+            text += "WALL_RULE " + str(item.min_width) + " " + str(item.max_width) + " " + str(item.min_heading) + " " + str(item.max_heading) + "\n"
+        else:
+            text += "SPELLING " + str(item.spellings) + "\n"
+    return text
+
+#Gets the MESH line of a mesh (a FacadeMesh), for the given counts
+def get_mesh_line(group, far_lod, cuts, vertex_count, index_count):
+    return "MESH\t" + str(group) + "\t" + str(far_lod) + "\t" + str(cuts) + "\t" + str(vertex_count) + "\t" + str(index_count) + "\n"
+
+#Generates the text of a mesh (a FacadeMesh) in chunks, starting with its MESH line
+def iter_mesh_text(mesh, chunk_lines=CHUNK_LINES):
+    vertex_count, index_count = mesh.get_counts()
+    yield get_mesh_line(mesh.group, mesh.far_lod, mesh.cuts, vertex_count, index_count)
+
+    if mesh.text != None:
+        yield from mesh.text[2]
+    else:
+        yield from FormatUtils.format_mesh(mesh.verticies, mesh.indicies, chunk_lines)
+
+#Gets the text of a segment's attached objects
+def get_attached_objs_text(attached_objs):
+    return "".join(get_attached_obj_text(obj) + "\n" for obj in attached_objs)
+
+#Generates the text of a segment (a FacadeSegment) in chunks, without its SEGMENT line
+def iter_segment_text(segment, chunk_lines=CHUNK_LINES):
+    for mesh in segment.meshes:
+        yield from iter_mesh_text(mesh, chunk_lines)
+
+    attached_text = get_attached_objs_text(segment.attached_objs)
+    if attached_text != "":
+        yield attached_text
+
+#Generates the whole .fac text of a Facade in chunks, in file order
+def iter_facade(facade, chunk_lines=CHUNK_LINES):
+    yield get_header_text(facade.header) + "\n" + get_roof_text(facade.roof) + "\n"
+
+    for index, segment in enumerate(facade.segments):
+        yield "SEGMENT " + str(index) + "\n"
+        yield from iter_segment_text(segment, chunk_lines)
+        yield "\n"
+
+    for index, segment in enumerate(facade.curved_segments):
+        yield "SEGMENT_CURVED " + str(index) + "\n"
+        yield from iter_segment_text(segment, chunk_lines)
+        yield "\n"
+
+    yield get_spelling_text(facade.spellings)
+
+#Gets the whole .fac text of a Facade as one string
+def get_facade_text(facade):
+    return "".join(iter_facade(facade))
+
+#Writes a Facade to an open file (or anything with a write method), chunk by chunk
+def write_facade(file, facade):
+    for chunk in iter_facade(facade):
+        file.write(chunk)
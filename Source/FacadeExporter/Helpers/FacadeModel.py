@@ -0,0 +1,120 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Plain Python (and NumPy) description of everything that goes into a .fac: the header, decals, roof, segments, meshes, attached objects, and spellings. No bpy here.
+#The export fills these from Blender once, and Helpers.FacWriter turns them into text, so the serializer can run (and be benchmarked) in plain Python or a worker process. Everything pickles, so a model can be saved to disk too.
+
+#One decal slot, with the same fields as DecalProperties
+class FacadeDecal:
+    def __init__(self):
+        self.enabled = False
+        self.visible = True
+        self.type = "BOTH"      #BOTH, ALB, or NML
+        self.decal_lib = ""
+        self.alb = ""
+        self.nml = ""
+
+        self.projected = False
+        self.tile_ratio = 1.0
+        self.scale_x = 1.0
+        self.scale_y = 1.0
+        self.dither_ratio = 0.0
+
+        self.rgb_strength_constant = 1.0
+        self.rgb_strength_modulator = 0.0
+        self.rgb_decal_key_red = 0.0
+        self.rgb_decal_key_green = 0.0
+        self.rgb_decal_key_blue = 0.0
+        self.rgb_decal_key_alpha = 0.0
+
+        self.alpha_strength_constant = 1.0
+        self.alpha_strength_modulator = 0.0
+        self.alpha_decal_key_red = 0.0
+        self.alpha_decal_key_green = 0.0
+        self.alpha_decal_key_blue = 0.0
+        self.alpha_decal_key_alpha = 0.0
+
+#The wall or roof shader. Paths are as they're set in Blender (a leading // is removed when they're written)
+class FacadeShader:
+    def __init__(self):
+        self.render = True
+        self.texture_alb = ""
+        self.texture_nml = ""
+        self.texture_nml_scale = 1.0
+        self.modulator_texture = ""
+        self.decals = []        #FacadeDecals
+
+#Everything before the roof
+class FacadeHeader:
+    def __init__(self):
+        self.ring = False
+        self.graded = False
+        self.layergroup = ""
+        self.layergroup_draped = ""
+        self.wall = FacadeShader()
+        self.roof = FacadeShader()
+        self.resources = []     #OBJ paths, in order. Attached objects refer to them by index
+
+#An attached object, or a roof object. Locations are in Blender's axes, rot_z is Blender's rotation around Z in degrees
+class FacadeAttachedObj:
+    def __init__(self, resource_index=0, loc_x=0.0, loc_y=0.0, loc_z=0.0, rot_z=0.0, draped=False, roof_obj=False, min_draw=0, max_draw=0):
+        self.resource_index = resource_index
+        self.loc_x = loc_x
+        self.loc_y = loc_y
+        self.loc_z = loc_z
+        self.rot_z = rot_z
+        self.draped = draped
+        self.roof_obj = roof_obj
+        self.min_draw = min_draw
+        self.max_draw = max_draw
+
+#The roof. height is the ROOF_HEIGHT, the scale is the ROOF_SCALE
+class FacadeRoof:
+    def __init__(self, height=0.0, scale_x=10, scale_y=10):
+        self.height = height
+        self.scale_x = scale_x
+        self.scale_y = scale_y
+        self.objs = []          #FacadeAttachedObjs
+
+#A mesh. verticies is an n x 8 array (loc x y z, normal x y z, uv x y) and indicies has 3 per triangle.
+#A mesh whose text is already known (i.e. from the geometry cache) has text set instead: (vertex count, index count, VERTEX/IDX text chunks)
+class FacadeMesh:
+    def __init__(self, group, far_lod, cuts, verticies=None, indicies=None, text=None):
+        self.group = group
+        self.far_lod = far_lod
+        self.cuts = cuts
+        self.verticies = verticies
+        self.indicies = indicies
+        self.text = text
+
+    def get_counts(self):
+        if self.text != None:
+            return self.text[0], self.text[1]
+        return len(self.verticies), len(self.indicies)
+
+#A segment: its meshes (in order), then its attached objects
+class FacadeSegment:
+    def __init__(self, name=""):
+        self.name = name
+        self.meshes = []        #FacadeMeshes
+        self.attached_objs = [] #FacadeAttachedObjs
+
+#A WALL, WALL_RULE, or SPELLING line. type is the FacadeSpellingItem type
+class FacadeSpelling:
+    def __init__(self, type, min_width=0.0, max_width=0.0, min_heading=0.0, max_heading=0.0, wall_name="", spellings=""):
+        self.type = type
+        self.min_width = min_width
+        self.max_width = max_width
+        self.min_heading = min_heading
+        self.max_heading = max_heading
+        self.wall_name = wall_name
+        self.spellings = spellings
+
+#A whole facade. curved_segments has one entry per segment, a segment without its own curved variant is the straight segment again (the same object)
+class Facade:
+    def __init__(self):
+        self.header = FacadeHeader()
+        self.roof = FacadeRoof()
+        self.segments = []
+        self.curved_segments = []
+        self.spellings = []     #FacadeSpellings
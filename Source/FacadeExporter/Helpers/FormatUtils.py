@@ -0,0 +1,74 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Format whole vertex and index arrays into VERTEX and IDX lines in bulk. Output is byte-identical to VertexBuffer.to_string and the per index IDX loop.
+
+import numpy as np
+
+#Columns of an n x 8 vertex array (loc x y z, normal x y z, uv x y) in the order they are written. X-Plane is Y up, so y and z swap.
+VERTEX_COLUMNS = [0, 2, 1, 3, 5, 4, 6, 7]
+
+#Template for one VERTEX line. "%.8f" gives the same text as MiscUtils.ftos(value, 8)
+VERTEX_TEMPLATE = "VERTEX\t" + "\t".join(["%.8f"] * 8) + "\n"
+
+#Template for one full IDX line of 10 indicies. Every index is followed by a space, including the last one
+IDX_TEMPLATE = "IDX " + "%d " * 10 + "\n"
+
+#Formats an n x 8 vertex array into VERTEX lines. Yields one string per chunk of chunk_lines verticies.
+def iter_vertex_lines(verticies, chunk_lines=4096):
+    for start in range(0, len(verticies), chunk_lines):
+        rows = verticies[start:start + chunk_lines][:, VERTEX_COLUMNS]
+        yield (VERTEX_TEMPLATE * len(rows)) % tuple(rows.ravel().tolist())
+
+#Formats an index array into IDX lines of 10. Yields one string per chunk of chunk_lines lines.
+#A short last line has no newline of its own, the block always ends with an extra newline (just like the per index loop this replaces).
+def iter_index_lines(indicies, chunk_lines=4096):
+    full_count = (len(indicies) // 10) * 10
+    chunk_size = chunk_lines * 10
+
+    #Full lines of 10
+    for start in range(0, full_count, chunk_size):
+        values = indicies[start:min(start + chunk_size, full_count)]
+        yield (IDX_TEMPLATE * (len(values) // 10)) % tuple(np.asarray(values).tolist())
+
+    #Whatever is left over, then the closing newline
+    remainder = indicies[full_count:]
+    if len(remainder) > 0:
+        yield "IDX " + ("%d " * len(remainder)) % tuple(np.asarray(remainder).tolist()) + "\n"
+    else:
+        yield "\n"
+
+#Formats a whole vertex array into one string
+def format_vertex_lines(verticies):
+    return "".join(iter_vertex_lines(verticies))
+
+#Formats a whole index array into one string
+def format_index_lines(indicies):
+    return "".join(iter_index_lines(indicies))
+
+#Gets the number of characters iter_vertex_lines would produce for an n x 8 vertex array, without formatting it
+def get_vertex_lines_size(verticies):
+    if len(verticies) == 0:
+        return 0
+
+    #Every "%.8f" is the sign, the integer digits, the point, and 8 decimals. -0.0 (and anything that rounds to it) still gets a sign
+    values = np.asarray(verticies, dtype=np.float64)
+    whole = np.floor(np.abs(np.round(values, 8)))
+    digits = np.where(whole < 1, 1, np.floor(np.log10(np.maximum(whole, 1))) + 1)
+    value_chars = int(np.sum(digits)) + int(np.count_nonzero(np.signbit(values))) + values.size * 9
+
+    #"VERTEX", a tab before each value, and the newline
+    return value_chars + len(verticies) * (6 + 8 + 1)
+
+#Gets the number of characters iter_index_lines would produce for an index array, without formatting it
+def get_index_lines_size(indicies):
+    indicies = np.asarray(indicies, dtype=np.int64)
+    line_count = (len(indicies) + 9) // 10
+
+    #Every index and its space, "IDX " on every line, a newline after each full line, and the closing newline
+    digits = np.floor(np.log10(np.maximum(indicies, 1))) + 1
+    return int(np.sum(digits)) + len(indicies) + line_count * 4 + len(indicies) // 10 + 1
+
+#Formats a whole mesh into a list of text chunks, verticies then indicies. This is what runs on the worker pool, so it only takes and returns plain data
+def format_mesh(verticies, indicies, chunk_lines=4096):
+    return list(iter_vertex_lines(verticies, chunk_lines)) + list(iter_index_lines(indicies, chunk_lines))
@@ -0,0 +1,248 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Analyze a facade's geometry without exporting it: vertex and triangle counts per segment and per LOD, how many verticies welding would save, attached objects, and the estimated .fac size, checked against the facade's budgets.
+#The last analysis of each facade is kept and shown in the panel. With live stats on, edits re-analyze the scene at most once per refresh interval, from a timer so the panel itself never does the work.
+
+import time
+import bpy # type: ignore
+from bpy.app.handlers import persistent # type: ignore
+
+#Our modules
+from . import SegmentUtils
+from . import GeometryUtils
+from . import GeometryCache
+from . import FormatUtils
+from . import SceneIndex
+from . import ExportSession
+
+#Vertex and triangle counts of one LOD (every MESH with the same far LOD) in a segment
+class LodStats:
+    def __init__(self, far_lod):
+        self.far_lod = far_lod
+        self.meshes = 0
+        self.verticies = 0      #Verticies written, after welding if it's on
+        self.triangles = 0
+
+#The stats of one segment (or the roof)
+class SegmentStats:
+    def __init__(self, name):
+        self.name = name
+        self.lods = {}              #Far LOD -> LodStats
+        self.verticies = 0          #Verticies written, after welding if it's on
+        self.emitted_verticies = 0  #Verticies before welding (3 per triangle)
+        self.unique_verticies = 0   #Verticies after welding
+        self.triangles = 0
+        self.attached_objects = 0
+        self.estimated_bytes = 0
+        self.warnings = []
+
+    #Adds a mesh's counts to its LOD and to the segment
+    def add_mesh(self, far_lod, verticies, triangles, emitted_verticies, unique_verticies, estimated_bytes):
+        if far_lod not in self.lods:
+            self.lods[far_lod] = LodStats(far_lod)
+        lod = self.lods[far_lod]
+        lod.meshes += 1
+        lod.verticies += verticies
+        lod.triangles += triangles
+
+        self.verticies += verticies
+        self.triangles += triangles
+        self.emitted_verticies += emitted_verticies
+        self.unique_verticies += unique_verticies
+        self.estimated_bytes += estimated_bytes
+
+    #Gets the LODs nearest first
+    def get_lods(self):
+        return [self.lods[far_lod] for far_lod in sorted(self.lods)]
+
+    #Gets the unique to emitted vertex ratio (1 means welding can't save anything)
+    def get_unique_ratio(self):
+        if self.emitted_verticies == 0:
+            return 1.0
+        return self.unique_verticies / self.emitted_verticies
+
+#The stats of a whole facade
+class BudgetReport:
+    def __init__(self):
+        self.segments = []          #SegmentStats, in export order
+        self.verticies = 0
+        self.triangles = 0
+        self.attached_objects = 0
+        self.estimated_bytes = 0
+        self.warnings = []
+        self.seconds = 0.0          #How long the analysis took
+
+    #Adds a segment's stats to the totals
+    def add_segment(self, segment):
+        self.segments.append(segment)
+        self.verticies += segment.verticies
+        self.triangles += segment.triangles
+        self.attached_objects += segment.attached_objects
+        self.estimated_bytes += segment.estimated_bytes
+
+    #Checks every segment, and the whole facade, against the budgets. A budget of 0 isn't checked
+    def check_budgets(self, f):
+        for segment in self.segments:
+            if f.budget_segment_verticies > 0 and segment.verticies > f.budget_segment_verticies:
+                segment.warnings.append(segment.name + " has " + str(segment.verticies) + " verticies (budget " + str(f.budget_segment_verticies) + ")")
+            if f.budget_segment_triangles > 0 and segment.triangles > f.budget_segment_triangles:
+                segment.warnings.append(segment.name + " has " + str(segment.triangles) + " triangles (budget " + str(f.budget_segment_triangles) + ")")
+            if f.budget_segment_attached_objects > 0 and segment.attached_objects > f.budget_segment_attached_objects:
+                segment.warnings.append(segment.name + " has " + str(segment.attached_objects) + " attached objects (budget " + str(f.budget_segment_attached_objects) + ")")
+            self.warnings.extend(segment.warnings)
+
+        if f.budget_file_size_kb > 0 and self.estimated_bytes > f.budget_file_size_kb * 1024:
+            self.warnings.append("The .fac is about " + str(self.estimated_bytes // 1024) + " KB (budget " + str(f.budget_file_size_kb) + " KB)")
+
+#Gets the stats of one mesh object's geometry (with its modifiers applied, as evaluated in depsgraph) into a segment
+def add_mesh_stats(segment, obj, settings, depsgraph):
+    #The verticies before welding, from the same bulk extraction the export uses (so this fills the geometry cache too)
+    with SegmentUtils.get_evaluated_mesh(obj, depsgraph) as mesh:
+        local = SegmentUtils.get_local_geometry(obj, mesh, GeometryCache.get_fingerprint(mesh))
+
+    verticies, indicies = SegmentUtils.transform_local_geometry(local, obj.matrix_world)
+    welded_verticies, welded_indicies = GeometryUtils.weld_vertex_arrays(verticies, indicies, settings.weld_tolerance)
+
+    if settings.weld_vertices:
+        out_verticies, out_indicies = welded_verticies, welded_indicies
+    else:
+        out_verticies, out_indicies = verticies, indicies
+
+    #MESH line, VERTEX lines, IDX lines
+    header_bytes = len("MESH\t" + str(obj.facade_object.group) + "\t" + str(obj.facade_object.far_lod) + "\t" + str(obj.facade_object.cuts) + "\t" + str(len(out_verticies)) + "\t" + str(len(out_indicies)) + "\n")
+    mesh_bytes = header_bytes + FormatUtils.get_vertex_lines_size(out_verticies) + FormatUtils.get_index_lines_size(out_indicies)
+    segment.add_mesh(obj.facade_object.far_lod, len(out_verticies), len(indicies) // 3, len(verticies), len(welded_verticies), mesh_bytes)
+
+    warning = SegmentUtils.get_generated_lod_warning(obj)
+    if warning != None:
+        segment.warnings.append(warning)
+
+#Gets the stats of one SceneIndex.CollectionEntry. Attached objects are measured with their index in resources. The roof's meshes aren't exported (they only give its size), only its attached objects are counted
+def get_segment_stats(entry, settings, resources, depsgraph, roof=False):
+    segment = SegmentStats(entry.name)
+
+    if not roof:
+        for obj in entry.meshes:
+            add_mesh_stats(segment, obj, settings, depsgraph)
+
+    for obj in entry.empties:
+        attached_obj = SegmentUtils.AttachedObj()
+        attached_obj.read_from_obj(obj)
+        attached_obj.roof_obj = roof
+        if attached_obj.valid:
+            segment.attached_objects += 1
+            segment.estimated_bytes += len(attached_obj.get_string(resources)) + 1
+
+    return segment
+
+#Analyzes a facade of a scene, the current scene and view layer, and the active facade, by default. Returns a BudgetReport.
+#The estimated size covers the OBJ list, segments, and attached objects, the rest of the header and the spellings are only a few lines
+def analyze(scene=None, view_layer=None, facade=None):
+    if scene == None:
+        scene = bpy.context.scene
+    if view_layer == None:
+        view_layer = bpy.context.view_layer if scene == bpy.context.scene else scene.view_layers[0]
+
+    if facade == None:
+        facade = ExportSession.get_active_facade(scene)
+
+    start = time.perf_counter()
+    f = facade
+    settings = ExportSession.ExportSettings(f)
+    scene_index = SceneIndex.build_index(view_layer, f.root_collection, ExportSession.get_other_roots(scene, f), settings.nested_collections)
+    depsgraph = ExportSession.get_evaluated_depsgraph(view_layer)
+
+    #The OBJ list, so attached objects are measured with their real index
+    resources = SegmentUtils.ResourceTable()
+    for entry in scene_index.get_exported_entries():
+        for obj in entry.empties:
+            resources.add_object(obj)
+    resources.finalize()
+
+    report = BudgetReport()
+
+    #The OBJ list in the header
+    report.estimated_bytes += sum(len("OBJ " + resource + "\n") for resource in resources.resources)
+
+    #Straight segments, then curved. A segment without a curved variant is written again as its own curved variant
+    straight = [get_segment_stats(entry, settings, resources, depsgraph) for entry in scene_index.segments]
+    for index, segment in enumerate(straight):
+        report.add_segment(segment)
+        report.estimated_bytes += len("SEGMENT " + str(index) + "\n\n")
+
+    for index, entry in enumerate(scene_index.curved_segments):
+        if entry != None:
+            report.add_segment(get_segment_stats(entry, settings, resources, depsgraph))
+        else:
+            report.estimated_bytes += straight[index].estimated_bytes
+        report.estimated_bytes += len("SEGMENT_CURVED " + str(index) + "\n\n")
+
+    if scene_index.roof != None:
+        report.add_segment(get_segment_stats(scene_index.roof, settings, resources, depsgraph, True))
+
+    report.check_budgets(f)
+    report.seconds = time.perf_counter() - start
+    return report
+
+#The last analysis of each facade, by facade_id
+reports = {}
+
+#Whether something changed since the last analysis
+dirty = False
+
+#Gets the last analysis of a scene's facade (the active one by default), or None if it hasn't been analyzed
+def get_report(scene, facade=None):
+    if facade == None:
+        facade = ExportSession.get_active_facade(scene)
+    if facade.facade_id == "":
+        return None
+    return reports.get(facade.facade_id)
+
+#Analyzes a scene's facade (the active one by default) and keeps the report for the panel. Returns the report
+def refresh(scene=None, view_layer=None, facade=None):
+    global dirty
+    if scene == None:
+        scene = bpy.context.scene
+    if facade == None:
+        facade = ExportSession.get_active_facade(scene)
+
+    dirty = False
+    ExportSession.assign_facade_ids()
+    report = analyze(scene, view_layer, facade)
+    reports[facade.facade_id] = report
+    return report
+
+#Timer callback that refreshes the stats of the current scene's active facade, then redraws the properties editor so they show
+def on_refresh_timer():
+    try:
+        scene = bpy.context.scene
+        if scene != None and ExportSession.get_active_facade(scene).live_budget_stats:
+            refresh(scene)
+
+            for window in bpy.context.window_manager.windows:
+                for area in window.screen.areas:
+                    if area.type == 'PROPERTIES':
+                        area.tag_redraw()
+    except Exception as e:
+        print("Could not refresh the facade geometry stats: " + str(e))
+    return None
+
+#Marks the stats out of date after an edit, and schedules a refresh if there isn't one coming already. This runs on every depsgraph update, so it does no work itself
+@persistent
+def on_depsgraph_update(scene, depsgraph):
+    global dirty
+    f = ExportSession.get_active_facade(scene)
+    if not f.live_budget_stats:
+        return
+
+    dirty = True
+    if not bpy.app.timers.is_registered(on_refresh_timer):
+        bpy.app.timers.register(on_refresh_timer, first_interval=f.budget_refresh_interval)
+
+#Nothing from the last file applies
+@persistent
+def on_load(dummy):
+    global dirty
+    reports.clear()
+    dirty = False
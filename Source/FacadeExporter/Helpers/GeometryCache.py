@@ -0,0 +1,166 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Cache the local-space (untransformed) geometry of each mesh object, with its modifiers applied, so moving, rotating, or re-parenting an object only costs a matrix multiply at export time.
+#Also caches the formatted VERTEX/IDX text of each mesh, so a header-only change doesn't re-triangulate or re-serialize anything. Entries are keyed on a content fingerprint and evicted least recently used first.
+
+import collections
+import hashlib
+import numpy as np
+import bpy # type: ignore
+from bpy.app.handlers import persistent # type: ignore
+
+#Container for the local-space geometry of a mesh. Arrays are per emitted vertex (3 per triangle, last corner first), so only the transform is left to apply.
+class LocalGeometry:
+    def __init__(self, positions, normals, uvs):
+        self.positions = positions  #n x 3 float32
+        self.normals = normals      #n x 3 float32
+        self.uvs = uvs              #n x 2 float32
+
+        self.tri_count = len(positions) // 3
+
+    def get_size(self):
+        return self.positions.nbytes + self.normals.nbytes + self.uvs.nbytes
+
+#Least recently used cache with a memory cap. Every entry is stored with its size in bytes.
+class LRUCache:
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.entries = collections.OrderedDict()
+
+    #Gets a value and marks it as recently used. Returns None if the key isn't cached
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    #Stores a value, evicting the least recently used entries until we fit. Values bigger than the whole cache aren't stored
+    def put(self, key, value, size):
+        self.discard(key)
+        if size > self.max_bytes:
+            return
+
+        self.entries[key] = (value, size)
+        self.total_bytes += size
+        self.evict()
+
+    #Removes a key if it is cached
+    def discard(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[1]
+
+    #Removes every key that matches a condition
+    def discard_if(self, condition):
+        for key in [key for key in self.entries if condition(key)]:
+            self.discard(key)
+
+    #Evicts the least recently used entries until we are within the memory cap
+    def evict(self):
+        while self.total_bytes > self.max_bytes and len(self.entries) > 0:
+            key, entry = self.entries.popitem(last=False)
+            self.total_bytes -= entry[1]
+
+    def clear(self):
+        self.entries.clear()
+        self.total_bytes = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+#The cache shared by every export in this Blender session. Keys are ("local", mesh pointer) for LocalGeometry and ("text", mesh pointer, ...) for formatted text
+cache = LRUCache(256 * 1024 * 1024)
+
+#Sets the memory cap, in megabytes
+def set_memory_limit(megabytes):
+    cache.max_bytes = int(megabytes * 1024 * 1024)
+    cache.evict()
+
+#Gets a cheap fingerprint of a mesh's content: the element counts plus a hash of everything the exported geometry depends on.
+#That's the vertex coordinates, which vertex each corner uses (so a flip or re-triangulation counts), the smooth flags, sharp edges, the corner normals (which include custom normals), and the UVs.
+#This catches edits even if we missed the depsgraph update, and pointers that were reused by a new mesh.
+def get_fingerprint(mesh):
+    digest = hashlib.blake2b(digest_size=16)
+
+    positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", positions)
+    digest.update(positions.tobytes())
+
+    corner_verticies = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", corner_verticies)
+    digest.update(corner_verticies.tobytes())
+
+    smooth = np.empty(len(mesh.polygons), dtype=bool)
+    mesh.polygons.foreach_get("use_smooth", smooth)
+    digest.update(smooth.tobytes())
+
+    sharp = np.empty(len(mesh.edges), dtype=bool)
+    mesh.edges.foreach_get("use_edge_sharp", sharp)
+    digest.update(sharp.tobytes())
+
+    #Blender 4.1+ moved the split normals from the loops to corner_normals
+    normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+    if hasattr(mesh, "corner_normals"):
+        mesh.corner_normals.foreach_get("vector", normals)
+    else:
+        mesh.calc_normals_split()
+        mesh.loops.foreach_get("normal", normals)
+    digest.update(normals.tobytes())
+
+    if len(mesh.uv_layers) > 0:
+        uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        mesh.uv_layers[0].data.foreach_get("uv", uvs)
+        digest.update(uvs.tobytes())
+
+    return (len(mesh.vertices), len(mesh.loops), len(mesh.polygons), digest.hexdigest())
+
+#Gets the cached LocalGeometry of a mesh object, or None if there is none or it is out of date
+def get_local_geometry(obj, fingerprint):
+    entry = cache.get(("local", obj.as_pointer()))
+    if entry is None or entry[0] != fingerprint:
+        return None
+    return entry[1]
+
+#Stores the LocalGeometry of a mesh object
+def store_local_geometry(obj, fingerprint, geometry):
+    cache.put(("local", obj.as_pointer()), (fingerprint, geometry), geometry.get_size())
+
+#Gets the key for a mesh object's formatted text. The text depends on the evaluated mesh's content (its fingerprint), the object's transform, and the export options
+def get_mesh_text_key(obj, fingerprint, options):
+    transform = tuple(value for row in obj.matrix_world for value in row)
+    return ("text", obj.as_pointer(), fingerprint, transform, options)
+
+#Gets the cached text chunks for a key, or None
+def get_mesh_text(key):
+    return cache.get(key)
+
+#Stores the text chunks for a key. Each entry is (vertex count, index count, list of chunks)
+def store_mesh_text(key, vertex_count, index_count, chunks):
+    cache.put(key, (vertex_count, index_count, chunks), sum(len(chunk) for chunk in chunks))
+
+#Removes everything cached for a mesh object
+def invalidate(obj_pointer):
+    cache.discard_if(lambda key: key[1] == obj_pointer)
+
+#Clears the whole cache
+def clear():
+    cache.clear()
+
+#Drops cache entries for objects whose geometry changed (an edit to their mesh, or their modifiers). Object transforms don't matter since they are part of the text key.
+#This only frees memory early, a stale entry would never be used anyway since its fingerprint wouldn't match
+@persistent
+def on_depsgraph_update(scene, depsgraph):
+    if len(cache) == 0:
+        return
+
+    for update in depsgraph.updates:
+        if update.is_updated_geometry and isinstance(update.id, bpy.types.Object):
+            invalidate(update.id.original.as_pointer())
+
+#Datablock pointers mean nothing once another file is loaded
+@persistent
+def on_load(dummy):
+    clear()
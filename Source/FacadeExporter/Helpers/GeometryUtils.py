@@ -4,40 +4,110 @@
 #Purpose: Provide utility functions to work with geometry (things like rotating a point, etc)
 
 import math
+import array
+import struct
+import numpy as np
 import bpy
 import bmesh
 from . import MiscUtils
 
-#Simple container to hold an X-Plane Vertex
-class XPVertex:
-    loc_x = 0
-    loc_y = 0
-    loc_z = 0
-
-    normal_x = 0
-    normal_y = 0
-    normal_z = 0
-
-    uv_x = 0
-    uv_y = 0
-
-    def __init__(self, loc_x, loc_y, loc_z, normal_x, normal_y, normal_z, uv_x, uv_y):
-        self.loc_x = loc_x
-        self.loc_y = loc_y
-        self.loc_z = loc_z
-
-        self.normal_x = normal_x
-        self.normal_y = normal_y
-        self.normal_z = normal_z
+#Compact buffer of X-Plane verticies. Each attribute is a typed array (structure of arrays), instead of an object per vertex.
+#Values are 32 bit floats, which is all Blender stores, so nothing is lost. Vertex i is positions[3i:3i+3], normals[3i:3i+3], uvs[2i:2i+2]
+class VertexBuffer:
+    __slots__ = ("positions", "normals", "uvs")
+
+    def __init__(self):
+        self.positions = array.array("f")   #x y z per vertex
+        self.normals = array.array("f")     #x y z per vertex
+        self.uvs = array.array("f")         #u v per vertex
+
+    def __len__(self):
+        return len(self.uvs) // 2
+
+    #Adds a vertex. Each argument is any sequence of floats (a tuple, a mathutils.Vector, etc)
+    def append(self, position, normal, uv):
+        self.positions.extend(position)
+        self.normals.extend(normal)
+        self.uvs.extend(uv)
+
+    def get_position(self, index):
+        return (self.positions[index * 3], self.positions[index * 3 + 1], self.positions[index * 3 + 2])
+
+    def set_position(self, index, x, y, z):
+        self.positions[index * 3] = x
+        self.positions[index * 3 + 1] = y
+        self.positions[index * 3 + 2] = z
+
+    def get_normal(self, index):
+        return (self.normals[index * 3], self.normals[index * 3 + 1], self.normals[index * 3 + 2])
+
+    def set_normal(self, index, x, y, z):
+        self.normals[index * 3] = x
+        self.normals[index * 3 + 1] = y
+        self.normals[index * 3 + 2] = z
+
+    #Gets a vertex as a tuple of loc x y z, normal x y z, uv x y
+    def get_vertex(self, index):
+        return self.get_position(index) + self.get_normal(index) + (self.uvs[index * 2], self.uvs[index * 2 + 1])
+
+    #Gets the VERTEX line of a vertex (without the newline). X-Plane is Y up, so y and z swap
+    def to_string(self, index):
+        loc_x, loc_y, loc_z, normal_x, normal_y, normal_z, uv_x, uv_y = self.get_vertex(index)
+        return "VERTEX\t" + MiscUtils.ftos(loc_x, 8) + "\t" + MiscUtils.ftos(loc_z, 8) + "\t" + MiscUtils.ftos(loc_y, 8) + "\t" + MiscUtils.ftos(normal_x, 8) + "\t" + MiscUtils.ftos(normal_z, 8) + "\t" + MiscUtils.ftos(normal_y, 8) + "\t" + MiscUtils.ftos(uv_x, 8) + "\t" + MiscUtils.ftos(uv_y, 8)
+
+    #Gets the verticies as an n x 8 array (loc x y z, normal x y z, uv x y), the layout FormatUtils uses
+    def to_array(self):
+        out = np.empty((len(self), 8), dtype=np.float64)
+        out[:, 0:3] = np.frombuffer(self.positions, dtype=np.float32).reshape(-1, 3)
+        out[:, 3:6] = np.frombuffer(self.normals, dtype=np.float32).reshape(-1, 3)
+        out[:, 6:8] = np.frombuffer(self.uvs, dtype=np.float32).reshape(-1, 2)
+        return out
+
+#Gets the key used to weld a vertex. With a tolerance > 0 every component is quantized to a multiple of the tolerance, otherwise the exact bits are used (so -0.0 and 0.0, which format differently, stay apart).
+def get_weld_key(values, tolerance):
+    if tolerance > 0:
+        return tuple(round(v / tolerance) for v in values)
+    return struct.pack("8d", *values)
+
+#Welds a VertexBuffer using a hash map over the position/normal/UV of each vertex. Returns a tuple of a new VertexBuffer with the unique verticies and the remapped indicies.
+#Verticies are kept in order of first use, and verticies on UV seams or split normals stay separate since their UVs/normals differ.
+def weld_vertices(verticies, indicies, tolerance=0.0):
+    out_verts = VertexBuffer()
+    remap = array.array("l")
+    seen = {}
+
+    for i in range(len(verticies)):
+        values = verticies.get_vertex(i)
+        key = get_weld_key(values, tolerance)
+        index = seen.get(key)
+        if index is None:
+            index = len(out_verts)
+            seen[key] = index
+            out_verts.append(values[0:3], values[3:6], values[6:8])
+        remap.append(index)
+
+    return (out_verts, array.array("l", [remap[i] for i in indicies]))
+
+#Welds an n x 8 array of verticies (see VertexBuffer.to_array for the layout). Same results as weld_vertices, but uses a sort based unique so it stays fast on large meshes.
+def weld_vertex_arrays(verticies, indicies, tolerance=0.0):
+    if len(verticies) == 0:
+        return (verticies, indicies)
+
+    #Build the keys. Quantized keys are integers, exact keys compare the raw bits so -0.0 and 0.0 (which format differently) stay apart
+    if tolerance > 0:
+        keys = np.round(verticies / tolerance).astype(np.int64)
+    else:
+        keys = np.ascontiguousarray(verticies).view(np.int64)
 
-        self.uv_x = uv_x
-        self.uv_y = uv_y
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    inverse = inverse.ravel()
 
-    def __eq__(self, other):
-        return self.loc_x == other.loc_x and self.loc_y == other.loc_y and self.loc_z == other.loc_z and self.normal_x == other.normal_x and self.normal_y == other.normal_y and self.normal_z == other.normal_z and self.uv_x == other.uv_x and self.uv_y == other.uv_y
+    #np.unique sorts the verticies, so put them back in order of first use
+    order = np.argsort(first, kind="stable")
+    remap = np.empty(len(order), dtype=np.int64)
+    remap[order] = np.arange(len(order), dtype=np.int64)
 
-    def to_string(self):
-        return "VERTEX\t" + MiscUtils.ftos(self.loc_x, 8) + "\t" + MiscUtils.ftos(self.loc_z, 8) + "\t" + MiscUtils.ftos(self.loc_y, 8) + "\t" + MiscUtils.ftos(self.normal_x, 8) + "\t" + MiscUtils.ftos(self.normal_z, 8) + "\t" + MiscUtils.ftos(self.normal_y, 8) + "\t" + MiscUtils.ftos(self.uv_x, 8) + "\t" + MiscUtils.ftos(self.uv_y, 8)
+    return (verticies[first[order]], remap[inverse][indicies])
 
 #Rotate a vertex around an axis ("x", "y", or "z"). Angle must be in degrees. Returns the new vertex as a tuple of x y z in that order.
 def rotate_vertex_on_axis(vertex, angle, axis):
@@ -69,35 +139,43 @@ def rotate_vertex_on_axis(vertex, angle, axis):
 
     return (new_x, new_y, new_z)
 
-#Creates an object in Blender with the specified verticies and indicies (from the X-Plane format)
+#Creates a Blender mesh from an n x 8 vertex array (loc x y z, normal x y z, uv x y) and indicies (3 per triangle, from the X-Plane format).
+#Everything is set in bulk with foreach_set, and the normals become custom split normals so they come back out exactly as they went in
+def create_mesh(name, verticies, indicies):
+    verticies = np.asarray(verticies, dtype=np.float32).reshape(-1, 8)
+    indicies = np.asarray(indicies, dtype=np.int32)
+    indicies = indicies[:len(indicies) - len(indicies) % 3]
+    tri_count = len(indicies) // 3
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(verticies))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(verticies[:, 0:3]).ravel())
+    mesh.loops.add(len(indicies))
+    mesh.loops.foreach_set("vertex_index", indicies)
+    mesh.polygons.add(tri_count)
+    mesh.polygons.foreach_set("loop_start", np.arange(0, len(indicies), 3, dtype=np.int32))
+
+    #loop_total is worked out from loop_start in newer Blender versions, and is read-only there
+    if not mesh.polygons.bl_rna.properties["loop_total"].is_readonly:
+        mesh.polygons.foreach_set("loop_total", np.full(tri_count, 3, dtype=np.int32))
+    mesh.update(calc_edges=True)
+
+    #UVs are per loop, so they're just the vertex UVs looked up by index
+    uv_layer = mesh.uv_layers.new(name="UVMap")
+    uv_layer.data.foreach_set("uv", np.ascontiguousarray(verticies[indicies, 6:8]).ravel())
+
+    #Custom normals need smooth faces, and before Blender 4.1, auto smooth
+    mesh.polygons.foreach_set("use_smooth", np.ones(tri_count, dtype=bool))
+    if hasattr(mesh, "use_auto_smooth"):
+        mesh.use_auto_smooth = True
+    mesh.normals_split_custom_set(verticies[indicies, 3:6].tolist())
+
+    mesh.update()
+    return mesh
+
+#Creates an object in Blender with the specified verticies (a VertexBuffer) and indicies (from the X-Plane format)
 def create_debug_obj(verticies, indicies):
-    #Create a new bmesh
-    bm = bmesh.new()
-
-    #Iterate through the indicies, 3 at a time, and create a face with the verticies at specified indicies
-    i = 0
-    while i < len(indicies) - 2:
-        # Add vertices to the bmesh
-        v1 = verticies[indicies[i]]
-        v2 = verticies[indicies[i + 1]]
-        v3 = verticies[indicies[i + 2]]
-        verts = [bm.verts.new((v1.loc_x, v1.loc_y, v1.loc_z)), bm.verts.new((v2.loc_x, v2.loc_y, v2.loc_z)), bm.verts.new((v3.loc_x, v3.loc_y, v3.loc_z))]
-
-        # Update the bmesh to ensure the vertices are added
-        bm.verts.ensure_lookup_table()
-
-        # Create a new face with the vertices
-        bm.faces.new(verts)
-
-        # Update the bmesh to ensure the face is added
-        bm.faces.ensure_lookup_table()
-
-        i = i + 3
-
-    # Finish up, write the bmesh back to the mesh
-    mesh = bpy.data.meshes.new("Mesh")
-    bm.to_mesh(mesh)
-    bm.free()
+    mesh = create_mesh("Mesh", verticies.to_array(), indicies)
 
     # Create an object with the mesh
     obj = bpy.data.objects.new("Debug", mesh)
@@ -0,0 +1,112 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Index the scene's collections in a single pass: which are segments, curved segments, and the roof, and which meshes and empties each one holds.
+#Only the top level collections (in outliner order) are indexed, unless the facade includes child collections, in which case every collection is, depth first.
+#Every later stage of the export reads from the index instead of walking the collections and their objects again.
+
+import bpy # type: ignore
+
+#The objects of one collection, bucketed by type. Each bucket keeps the collection's object order
+class CollectionEntry:
+    def __init__(self, collection):
+        self.collection = collection
+        self.name = collection.name
+        self.meshes = []
+        self.empties = []
+
+        #Whether any object in the collection is exportable. Only these collections become segments (or the roof)
+        self.exportable = False
+
+        for obj in collection.objects:
+            if obj.type == "MESH":
+                self.meshes.append(obj)
+            elif obj.type == "EMPTY":
+                self.empties.append(obj)
+
+            if obj.facade_object.exportable:
+                self.exportable = True
+
+#Index of the collections in a view layer
+class SceneIndex:
+    def __init__(self):
+        self.entries = []           #Every included collection, in outliner order (depth first with child collections)
+        self.by_name = {}           #Lowercase name -> CollectionEntry. If names only differ in case, the first one in outliner order wins
+        self.segments = []          #CollectionEntry of each straight segment, in outliner order
+        self.curved_segments = []   #CollectionEntry of each segment's _curved variant, or None if it has none
+        self.roof = None            #CollectionEntry of the roof, or None
+
+    #Indexes the collections directly under a layer collection, and with nested, their children too (depth first). Excluded collections (and their children) are not included.
+    #Collections named in skip (and their children) aren't included either, they're the roots of other facades
+    def build(self, layer_collection, skip=(), nested=False):
+        seen = set()
+        self.add_children(layer_collection, seen, skip, nested)
+
+        for entry in self.entries:
+            name = entry.name.lower()
+            if name not in self.by_name:
+                self.by_name[name] = entry
+
+        #Sort the exportable collections into roles. Curved variants are found by name, so this stays linear in the number of collections
+        for entry in self.entries:
+            if not entry.exportable:
+                continue
+
+            name = entry.name.lower()
+            if name.endswith("_curved"):
+                continue
+
+            if name == "roof":
+                self.roof = entry
+                continue
+
+            self.segments.append(entry)
+            self.curved_segments.append(self.by_name.get(name + "_curved"))
+
+        return self
+
+    #Adds the children of a layer collection, and with nested, theirs too (depth first). A collection linked in more than one place is only added once
+    def add_children(self, layer_collection, seen, skip=(), nested=False):
+        for child in layer_collection.children:
+            if child.exclude or child.collection.name in skip:
+                continue
+
+            pointer = child.collection.as_pointer()
+            if pointer not in seen:
+                seen.add(pointer)
+                self.entries.append(CollectionEntry(child.collection))
+
+            if nested:
+                self.add_children(child, seen, skip, nested)
+
+    #Gets every entry that is exported (segments, curved variants, and the roof)
+    def get_exported_entries(self):
+        entries = self.segments + [entry for entry in self.curved_segments if entry != None]
+        if self.roof != None:
+            entries.append(self.roof)
+        return entries
+
+#Finds the layer collection of a collection under a layer collection, depth first. Returns None if it isn't there
+def find_layer_collection(layer_collection, collection):
+    for child in layer_collection.children:
+        if child.collection == collection:
+            return child
+
+        found = find_layer_collection(child, collection)
+        if found != None:
+            return found
+    return None
+
+#Indexes the collections of a view layer, the current one by default. With a root collection only the collections under it are indexed (none if it's excluded or not in the view layer).
+#skip is the names of collections to leave out, with their children. With nested, child collections are indexed (and exported) as well as the top level ones
+def build_index(view_layer=None, root=None, skip=(), nested=False):
+    if view_layer == None:
+        view_layer = bpy.context.view_layer
+
+    layer_collection = view_layer.layer_collection
+    if root != None:
+        layer_collection = find_layer_collection(layer_collection, root)
+        if layer_collection == None or layer_collection.exclude:
+            return SceneIndex()
+
+    return SceneIndex().build(layer_collection, skip, nested)
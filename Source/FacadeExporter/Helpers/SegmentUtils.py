@@ -4,21 +4,60 @@
 #Purpose: Provide utility functions to help in extracting the geometry and attached objects from the individual objects in a layer.
 
 #Blender modules
-import collections
+import array
+import contextlib
 import math
 import mathutils
+import numpy as np
 import bpy
 import bmesh
 
 #Our modules
 from . import GeometryUtils
-from . import MiscUtils
+from . import GeometryCache
+from . import FacadeModel
+from . import FacWriter
+
+#Table of the OBJ resources used in a facade. Each resource's index is the index of its OBJ line in the header
+class ResourceTable:
+    def __init__(self):
+        self.resources = []     #Unique resources, sorted. This is the order of the OBJ lines
+        self.indices = {}       #Resource -> index in resources
+
+    #Adds a resource. Duplicates are ignored. Indices are only assigned once every resource has been added (see finalize)
+    def add(self, resource):
+        self.indices[resource] = -1
+
+    #Adds the resource of an attached object (an exportable empty with a resource). Anything else is ignored
+    def add_object(self, obj):
+        #Make sure this is an empty
+        if obj.type != "EMPTY":
+            return
+        
+        #Check if it is exportable
+        if not obj.facade_object.exportable:
+            return
+        
+        #Check if it has the obj resource
+        if obj.facade_object.resource == "":
+            return
+        
+        self.add(obj.facade_object.resource)
+
+    #Sorts the resources, and assigns each its index
+    def finalize(self):
+        self.resources = sorted(self.indices)
+        self.indices = {resource: index for index, resource in enumerate(self.resources)}
+
+    #Gets the index of a resource, or -1 if it isn't in the table
+    def get_index(self, resource):
+        return self.indices.get(resource, -1)
+
+    def __len__(self):
+        return len(self.resources)
 
 #Simple container to hold attached object data  
 class AttachedObj:
-    #Class variables
-    all_objects = []
-
     #Define instance varialbes
     def __init__(self):
         self.loc_x = 0
@@ -96,194 +135,292 @@ class AttachedObj:
 
         self.valid = True
     
-    #Resets the all objects list
-    def reset_objects():
-        AttachedObj.all_objects = []
-
-    #Sorts and deduplicates the all objects list
-    def prep_object_list():
-        AttachedObj.all_objects.sort()
-
-        #Iterate through the list (except for the last item) adn remove duplicates
-        i = 0
-        while i < len(AttachedObj.all_objects) - 1:
-            if AttachedObj.all_objects[i] == AttachedObj.all_objects[i + 1]:
-                AttachedObj.all_objects.pop(i)
-            else:
-                i += 1
-
-    #Adds an object to the list of all objects so we can get it's index later
-    def add_object_to_list(obj):
-        #Make sure this is an empty
-        if obj.type != "EMPTY":
-            return
-        
-        #Check if it is exportable
-        if not obj.facade_object.exportable:
-            return
-        
-        #Check if it has the obj resource
-        if obj.facade_object.resource == "":
-            return
-        
-        #Get and store the resource
-        resource = obj.facade_object.resource
-        AttachedObj.all_objects.append(resource)
-        
+    #Gets this object as a FacadeModel.FacadeAttachedObj. resources is the export's ResourceTable, which gives the object's index.
+    #A resource that isn't in the table keeps the invalid index -1 (so X-Plane rejects it rather than placing the wrong object), and is added to warnings if given
+    def to_model(self, resources, warnings=None):
+        #Get the index of this object's resource in the list of all objects
+        index = resources.get_index(self.resource)
+        if index == -1:
+            print("Error: Resource not found in list of all objects. Number of object in list:" + str(len(resources)))
+            warning = "Attached object resource " + self.resource + " isn't in the facade's OBJ list, it was written with the invalid index -1"
+            if warnings != None and warning not in warnings:
+                warnings.append(warning)
+
+        return FacadeModel.FacadeAttachedObj(index, self.loc_x, self.loc_y, self.loc_z, self.rot_z, self.draped, self.roof_obj, self.min_draw, self.max_draw)
+
+    #Get the string representation of this object. resources is the export's ResourceTable, which gives the object's index (see to_model)
+    def get_string(self, resources, warnings=None):
+        return FacWriter.get_attached_obj_text(self.to_model(resources, warnings))
+
+#Gets the warning for a mesh with Generated LODs set, or None if it has none. They're never exported: facade LODs are additive (every MESH draws from 0 m out to its Far LOD, there is no near distance),
+#so a decimated copy would always draw on top of the mesh it was made from up close, on exactly the same planes. That z-fights, and adds triangles instead of removing them
+def get_generated_lod_warning(obj):
+    if obj.facade_object.lod_distances.strip() == "":
+        return None
+    return obj.name + " has Generated LODs (" + obj.facade_object.lod_distances.strip() + "), they aren't exported. Facade LODs are additive, so a decimated copy would draw on top of the mesh up close. Model far LODs by hand, as geometry that isn't already in the near mesh"
+
+#Gets an object's mesh with its modifiers (and shape keys) applied, as evaluated in depsgraph (the current evaluated depsgraph by default). Use it in a with block, the evaluated mesh is a temporary that is freed when the block ends.
+#Reading from this instead of obj.data means the export sees what the viewport shows, and never changes the original mesh
+@contextlib.contextmanager
+def get_evaluated_mesh(obj, depsgraph=None):
+    if depsgraph == None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+
+    obj_eval = obj.evaluated_get(depsgraph)
+    mesh = obj_eval.to_mesh()
+    try:
+        yield mesh
+    finally:
+        obj_eval.to_mesh_clear()
 
-    #Get the string representation of this object
-    def get_string(self):
-        out = ""
-        if self.roof_obj:
-            out += "ROOF_OBJ_HEADING "
-        elif self.draped:
-            out += "ATTACH_DRAPED "
-        else:
-            out += "ATTACH_GRADED "
+#Get the geometry from an object. Returns a tuple of a GeometryUtils.VertexBuffer and an array of integer indicies that represent the faces.
+#If weld is true, identical verticies (within weld_tolerance) are merged after the transform is applied. Modifiers are applied (see get_evaluated_mesh)
+def get_geometry_from_obj(obj, weld=False, weld_tolerance=0.0, depsgraph=None):
+    # Ensure the object is a mesh
+    if obj.type != 'MESH':
+        raise TypeError("Object must be a mesh")
 
-        #Get the index of this object's resource in the list of all objects
+    #Get our mesh data, with its modifiers applied. The evaluated copy is freed as soon as we've read it
+    with get_evaluated_mesh(obj, depsgraph) as mesh:
+        #Calculate split normals if this mesh has them
+        if hasattr(mesh, "calc_normals_split"):
+            mesh.calc_normals_split()
+
+        #Triangulate the mesh and get the loop triangles
+        mesh.calc_loop_triangles()
+        loop_triangles = mesh.loop_triangles
+
+        #Attempt to get the uv layer. We look for the first layer. 
         try:
-            index = MiscUtils.linear_search_list(AttachedObj.all_objects, self.resource)
-        except ValueError:
-            print("Error: Resource not found in list of all objects. Number of object in list:" + str(len(AttachedObj.all_objects)))
-            index = 0
+            uv_layer = mesh.uv_layers[0]
+        except (KeyError, TypeError) as e:
+            uv_layer = None
 
-        #Add the data index, x, y, z, rot_z, min_draw, max_draw
-        if self.roof_obj:
-            out += str(index) + " " + MiscUtils.ftos(self.loc_x, 8) + " " + MiscUtils.ftos(self.loc_y, 8) + " " + MiscUtils.ftos(MiscUtils.resolve_heading(self.rot_z * -1), 4) + " " + str(self.min_draw) + " " + str(self.max_draw)
-        else:
-            out += str(index) + " " + MiscUtils.ftos(self.loc_x, 8) + " " + MiscUtils.ftos(self.loc_z, 8) + " " + MiscUtils.ftos(self.loc_y, 8) + " " + MiscUtils.ftos(MiscUtils.resolve_heading(self.rot_z + 180), 3) + " " + str(self.min_draw) + " " + str(self.max_draw)
+        #Now we iterate through the loop triangles, and turn them into verticies and indicies.
+        #Every face gets 3 new verticies here, duplicates are welded after the transform if requested.
+        #The index output array is in the order of last vertex, middle, first.
 
-        return out
+        #Define our output arrays
+        out_verts = GeometryUtils.VertexBuffer()
+        out_inds = array.array("l")
 
-#Get the geometry from an object. Returns a tuple of XPVertex and integer indicies that represent the faces.
-def get_geometry_from_obj(obj):
-    # Ensure the object is a mesh
-    if obj.type != 'MESH':
-        raise TypeError("Object must be a mesh")
+        for tri in loop_triangles:
 
-    #Get our mesh data
-    mesh = obj.data
+            #Get our UV and normal data
+            uvs = ((0, 0), (0, 0), (0, 0))
+            if uv_layer != None:
+                uvs = (uv_layer.data[tri.loops[0]].uv, uv_layer.data[tri.loops[1]].uv, uv_layer.data[tri.loops[2]].uv)
 
-    #Calculate split normals if this mesh has them
-    if hasattr(mesh, "calc_normals_split"):
-        mesh.calc_normals_split()
+            normals = (tri.split_normals[0], tri.split_normals[1], tri.split_normals[2])
+            if not tri.use_smooth:
+                normals = (tri.normal, tri.normal, tri.normal)
 
-    #Triangulate the mesh and get the loop triangles
-    mesh.calc_loop_triangles()
-    loop_triangles = mesh.loop_triangles
+            #Add the verticies, last first
+            base = len(out_verts)
+            for i in (2, 1, 0):
+                out_verts.append(mesh.vertices[tri.vertices[i]].co, normals[i], uvs[i])
 
-    #Attempt to get the uv layer. We look for the first layer. 
-    try:
-        uv_layer = mesh.uv_layers[0]
-    except (KeyError, TypeError) as e:
-        uv_layer = None
-
-    #Define a temporary data structure to hold our triangle faces.
-    XPTriangle = collections.namedtuple(
-                    "XPTriangle",
-                    field_names=[
-                        "vertex_pos",  # Tuple[Tuple[float, float, float], Tuple[float, float, float], Tuple[float, float, float]] Tuple containing the positions for each vertex. Only used when smooth is true
-                        "vertex_nrm",  # Tuple[Tuple[float, float, float], Tuple[float, float, float], Tuple[float, float, float]] Tuple containing the normals for each vertex. Only used when smooth is true
-                        "uvs",  # type: Tuple[[float, float], [float, float], [float, float]]
-                    ],
-                )
-    
-    #Define an array to hold our faces
-    xp_triangles = []
-
-    #Now we iterate through teh loop triangles to populate our array of XPTriangles
-    for tri in loop_triangles:
-
-        #Define our UV and normal data beforehand. The struct is immutable so we can't change it after the fact
-        xp_triangle_uvs = ((0, 0), (0, 0), (0, 0))
-        if uv_layer != None:
-            xp_triangle_uvs = (uv_layer.data[tri.loops[0]].uv, uv_layer.data[tri.loops[1]].uv, uv_layer.data[tri.loops[2]].uv)
-
-        xp_triangles_normals = (tri.split_normals[0], tri.split_normals[1], tri.split_normals[2])
-        if not tri.use_smooth:
-            xp_triangles_normals = (tri.normal, tri.normal, tri.normal)
-
-
-        #Define a temporary face with the data from the loop triangle. UVs default to none so we can add them IF we do have a uv layer
-        tmp_face = XPTriangle(
-            vertex_pos = (mesh.vertices[tri.vertices[0]].co, mesh.vertices[tri.vertices[1]].co, mesh.vertices[tri.vertices[2]].co),
-            vertex_nrm = xp_triangles_normals,
-            uvs = xp_triangle_uvs
-        )
-
-        #Append the face to the array
-        xp_triangles.append(tmp_face)
-
-    #Now that we have the faces stored, we need to actually turn them into verticies and indicies.
-    #This is a bit more complicated. We have to iterate through every face. Then we need to check if *any* of it's 3 verticies already exist - if they do, we will use the existing one instead
-    #Once we know the indicies of each vertex because it's either been added, or already exists, we can do the index output array, which would be in the order of last vertex, middle, first. 
-
-    #Define our output arrays
-    out_verts = []  #Array of XPVertex
-    out_inds = []   #Ints
-
-    for t in xp_triangles:
-        #Define verticies for each triangle. Then see if they exist, if they don't, add them.
-        v1 = GeometryUtils.XPVertex(t.vertex_pos[0][0], t.vertex_pos[0][1], t.vertex_pos[0][2], t.vertex_nrm[0][0], t.vertex_nrm[0][1], t.vertex_nrm[0][2], t.uvs[0][0], t.uvs[0][1])
-        v2 = GeometryUtils.XPVertex(t.vertex_pos[1][0], t.vertex_pos[1][1], t.vertex_pos[1][2], t.vertex_nrm[1][0], t.vertex_nrm[1][1], t.vertex_nrm[1][2], t.uvs[1][0], t.uvs[1][1])
-        v3 = GeometryUtils.XPVertex(t.vertex_pos[2][0], t.vertex_pos[2][1], t.vertex_pos[2][2], t.vertex_nrm[2][0], t.vertex_nrm[2][1], t.vertex_nrm[2][2], t.uvs[2][0], t.uvs[2][1])
-
-        try_optomize = False
-
-        if try_optomize:
-            v1_index = MiscUtils.linear_search_list(out_verts, v1)
-            v2_index = MiscUtils.linear_search_list(out_verts, v2)
-            v3_index = MiscUtils.linear_search_list(out_verts, v3)
-
-            if v1_index == -1:
-                out_verts.append(v3)
-                v1_index = len(out_verts) - 1
-            if v2_index == -1:
-                out_verts.append(v2)
-                v2_index = len(out_verts) - 1
-            if v3_index == -1:
-                out_verts.append(v1)
-                v3_index = len(out_verts) - 1
-        else:
-            out_verts.append(v3)
-            v1_index = len(out_verts) - 1
-            out_verts.append(v2)
-            v2_index = len(out_verts) - 1
-            out_verts.append(v1)
-            v3_index = len(out_verts) - 1
-
-        #Now finally we add the indicies! These are in the order v3, v2, v1
-        out_inds.append(v3_index)
-        out_inds.append(v2_index)
-        out_inds.append(v1_index)
-
-    #Now we need to get the transform matrix for the object
+            #Now finally we add the indicies! These point at the first, middle, then last vertex
+            out_inds.append(base + 2)
+            out_inds.append(base + 1)
+            out_inds.append(base)
+
+    #Now we need to get the transform matrix for the object, and the matrix to transform the normals
     transform = obj.matrix_world
+    normal_matrix = obj.matrix_world.inverted().transposed()
 
     #Now we loop through the verticies and apply the transform to each one
-    for v in out_verts:
+    for i in range(len(out_verts)):
         #Get the local position as a vector
-        local_position = mathutils.Vector((v.loc_x, v.loc_y, v.loc_z))
-        normal = mathutils.Vector((v.normal_x, v.normal_y, v.normal_z))
+        local_position = mathutils.Vector(out_verts.get_position(i))
+        normal = mathutils.Vector(out_verts.get_normal(i))
 
         #Apply the full transformation
         transformed_position = transform @ local_position
 
         #Work to apply the transform to the normals
-        normal_matrix = obj.matrix_world.inverted().transposed()
         transformed_normal = normal_matrix @ normal
         transformed_normal.normalize()
 
-        #Set the new position and rotation
-        v.loc_x = transformed_position.x
-        v.loc_y = transformed_position.y
-        v.loc_z = transformed_position.z
+        #Set the new position and normal
+        out_verts.set_position(i, transformed_position.x, transformed_position.y, transformed_position.z)
+        out_verts.set_normal(i, transformed_normal.x, transformed_normal.y, transformed_normal.z)
+
+    #Merge duplicate verticies
+    if weld:
+        return GeometryUtils.weld_vertices(out_verts, out_inds, weld_tolerance)
+
+    #Return the verticies and indicies
+    return (out_verts, out_inds)
+
+#Multiplies an array of 3D vectors (n x 3, float32) by a 4x4 matrix the same way mathutils' Matrix @ Vector does.
+#Each product is rounded to a float, the products are summed as doubles (with an implied w of 1), then the sum is rounded back to a float.
+#This keeps the bulk path byte-identical to transforming every vertex with mathutils.
+def mul_matrix_vectors(matrix, vectors):
+    m = np.array(matrix, dtype=np.float32)
+    out = np.empty((len(vectors), 3), dtype=np.float32)
+    for row in range(3):
+        dot = (m[row, 0] * vectors[:, 0]).astype(np.float64)
+        dot += m[row, 1] * vectors[:, 1]
+        dot += m[row, 2] * vectors[:, 2]
+        dot += np.float64(m[row, 3])
+        out[:, row] = dot
+    return out
+
+#Normalizes an array of 3D vectors (n x 3, float32) the same way mathutils' Vector.normalize does. Zero length vectors become 0, 0, 0.
+def normalize_vectors(vectors):
+    #The squared length is summed as doubles, last component first
+    length_sq = (vectors[:, 2] * vectors[:, 2]).astype(np.float64)
+    length_sq += vectors[:, 1] * vectors[:, 1]
+    length_sq += vectors[:, 0] * vectors[:, 0]
+
+    valid = length_sq > 1.0e-35
+    length = np.sqrt(length_sq).astype(np.float32)
+    length[~valid] = 1
+    scale = np.float32(1.0) / length
+
+    return np.where(valid[:, np.newaxis], vectors * scale[:, np.newaxis], np.float32(0))
+
+#Reads the local-space geometry of a mesh using bulk (foreach_get) reads into NumPy arrays. Returns a GeometryCache.LocalGeometry with one entry per emitted vertex.
+def get_local_geometry_from_mesh(mesh):
+    #Calculate split normals if this mesh has them
+    if hasattr(mesh, "calc_normals_split"):
+        mesh.calc_normals_split()
+
+    #Triangulate the mesh and get the loop triangles
+    mesh.calc_loop_triangles()
+    loop_triangles = mesh.loop_triangles
+    tri_count = len(loop_triangles)
+
+    #Read the triangle data. Loops and verticies are 3 per triangle
+    tri_loops = np.empty(tri_count * 3, dtype=np.int32)
+    tri_verts = np.empty(tri_count * 3, dtype=np.int32)
+    tri_smooth = np.empty(tri_count, dtype=bool)
+    tri_normals = np.empty(tri_count * 3, dtype=np.float32)
+    loop_triangles.foreach_get("loops", tri_loops)
+    loop_triangles.foreach_get("vertices", tri_verts)
+    loop_triangles.foreach_get("use_smooth", tri_smooth)
+    loop_triangles.foreach_get("normal", tri_normals)
+
+    #Read the vertex positions
+    positions = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", positions)
+    positions = positions.reshape(-1, 3)
+
+    #Read the split (corner) normals. Blender 4.1+ moved these from the loops to corner_normals
+    loop_normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+    if hasattr(mesh, "corner_normals"):
+        mesh.corner_normals.foreach_get("vector", loop_normals)
+    else:
+        mesh.loops.foreach_get("normal", loop_normals)
+    loop_normals = loop_normals.reshape(-1, 3)
+
+    #Verticies are emitted in the order last, middle, first corner of every triangle
+    loop_order = tri_loops.reshape(-1, 3)[:, ::-1].ravel()
+    vert_order = tri_verts.reshape(-1, 3)[:, ::-1].ravel()
+
+    #Smooth triangles use the split normals, flat triangles use the face normal for all 3 corners
+    normals = loop_normals[loop_order]
+    flat = np.repeat(~tri_smooth, 3)
+    normals[flat] = np.repeat(tri_normals.reshape(-1, 3), 3, axis=0)[flat]
+
+    #Get the UVs from the first uv layer if there is one
+    uvs = np.zeros((tri_count * 3, 2), dtype=np.float32)
+    if len(mesh.uv_layers) > 0:
+        loop_uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        mesh.uv_layers[0].data.foreach_get("uv", loop_uvs)
+        uvs = loop_uvs.reshape(-1, 2)[loop_order]
+
+    return GeometryCache.LocalGeometry(positions[vert_order], normals, uvs)
+
+#Gets the local geometry of an object's evaluated mesh (see get_evaluated_mesh) and its fingerprint (see GeometryCache.get_fingerprint), from the cache if it's unchanged.
+#The cache is per object, since modifiers make the geometry depend on the object and not just its mesh datablock
+def get_local_geometry(obj, mesh, fingerprint):
+    local = GeometryCache.get_local_geometry(obj, fingerprint)
+    if local is None:
+        local = get_local_geometry_from_mesh(mesh)
+        GeometryCache.store_local_geometry(obj, fingerprint, local)
+    return local
+
+#The local geometry of the mesh datablocks read so far in one export, so linked duplicates (objects sharing a mesh) are only evaluated, triangulated, and read once. Each object then just gets its own transform applied (see transform_local_geometry).
+#Only objects whose evaluated mesh is their mesh datablock as is can share it. Enabled modifiers or shape keys make the geometry depend on the object, those objects are read on their own
+class SharedMeshTable:
+    def __init__(self):
+        self.meshes = {}    #Mesh datablock pointer -> (fingerprint, LocalGeometry or None if it hasn't been read yet)
+        self.hits = 0       #Objects that reused another object's fingerprint or geometry
+
+    #Gets the key an object's geometry is shared under, or None if it can't be shared
+    def get_key(self, obj):
+        if obj.data.shape_keys != None:
+            return None
+        for modifier in obj.modifiers:
+            if modifier.show_viewport:
+                return None
+        return obj.data.as_pointer()
+
+    #Gets the (fingerprint, LocalGeometry) read for another object with the same mesh, or None. The LocalGeometry is None if only the fingerprint was needed so far
+    def get(self, obj):
+        key = self.get_key(obj)
+        if key == None:
+            return None
+
+        entry = self.meshes.get(key)
+        if entry != None:
+            self.hits += 1
+        return entry
+
+    #Stores an object's fingerprint and local geometry (or None) for the other objects using its mesh
+    def add(self, obj, fingerprint, local):
+        key = self.get_key(obj)
+        if key != None:
+            self.meshes[key] = (fingerprint, local)
+
+#Gets the local geometry of an object's evaluated mesh, from the cache if it's unchanged. With a SharedMeshTable, linked duplicates reuse the geometry read for the first of them
+def read_local_geometry(obj, depsgraph=None, shared=None):
+    entry = shared.get(obj) if shared != None else None
+    if entry != None and entry[1] is not None:
+        return entry[1]
+
+    with get_evaluated_mesh(obj, depsgraph) as mesh:
+        #A shared mesh that was only fingerprinted so far isn't fingerprinted again
+        fingerprint = entry[0] if entry != None else GeometryCache.get_fingerprint(mesh)
+        local = get_local_geometry(obj, mesh, fingerprint)
+
+    if shared != None:
+        shared.add(obj, fingerprint, local)
+    return local
+
+#Get the geometry from an object using bulk (foreach_get) reads into NumPy arrays. Returns a tuple of an n x 8 array of verticies and an array of integer indicies that represent the faces.
+#Each vertex row is laid out like GeometryUtils.VertexBuffer.to_array: loc x y z, normal x y z, uv x y. The output is identical to get_geometry_from_obj, just without the per triangle Python loop.
+#The local-space geometry is cached per object, so an object that only moved just gets the transform re-applied. With a SharedMeshTable, linked duplicates reuse the geometry read for the first of them
+def get_geometry_arrays_from_obj(obj, weld=False, weld_tolerance=0.0, depsgraph=None, shared=None):
+    # Ensure the object is a mesh
+    if obj.type != 'MESH':
+        raise TypeError("Object must be a mesh")
 
-        #Set the new normal
-        v.normal_x = transformed_normal.x
-        v.normal_y = transformed_normal.y
-        v.normal_z = transformed_normal.z
+    local = read_local_geometry(obj, depsgraph, shared)
+    return transform_local_geometry(local, obj.matrix_world, weld, weld_tolerance)
+
+#Applies a world matrix to local geometry. Returns a tuple of an n x 8 array of verticies and an array of integer indicies, like get_geometry_arrays_from_obj
+def transform_local_geometry(local, matrix_world, weld=False, weld_tolerance=0.0):
+    #Apply the object transform to the positions and the normal matrix to the normals, once for the whole array
+    normal_matrix = matrix_world.inverted().transposed()
+    out_positions = mul_matrix_vectors(matrix_world, local.positions)
+    out_normals = normalize_vectors(mul_matrix_vectors(normal_matrix, local.normals))
+
+    #Pack the verticies into loc, normal, uv order
+    out_verts = np.empty((local.tri_count * 3, 8), dtype=np.float64)
+    out_verts[:, 0:3] = out_positions
+    out_verts[:, 3:6] = out_normals
+    out_verts[:, 6:8] = local.uvs
+
+    #The indicies are in the order v3, v2, v1 of each triangle's reversed verticies
+    base = np.arange(local.tri_count, dtype=np.int64) * 3
+    out_inds = np.stack((base + 2, base + 1, base), axis=1).ravel()
+
+    #Merge duplicate verticies
+    if weld:
+        return GeometryUtils.weld_vertex_arrays(out_verts, out_inds, weld_tolerance)
 
     #Return the verticies and indicies
     return (out_verts, out_inds)
@@ -0,0 +1,112 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Reorder a mesh's triangles so the GPU's post-transform vertex cache is hit more often (Tipsify, Sander et al. 2007), and measure the ACMR (average cache misses per triangle) before and after.
+#Only the order of whole triangles changes, each triangle keeps its verticies and winding. Reordering only helps when triangles share verticies, so use it with vertex welding.
+
+import collections
+import numpy as np
+
+#Size of the FIFO vertex cache we optimize for and measure with
+CACHE_SIZE = 16
+
+#Simulates a FIFO vertex cache over an index array. Returns the ACMR, the number of verticies transformed per triangle (between 0.5 and 3, lower is better)
+def get_acmr(indicies, cache_size=CACHE_SIZE):
+    tri_count = len(indicies) // 3
+    if tri_count == 0:
+        return 0.0
+
+    fifo = collections.deque()
+    cached = set()
+    misses = 0
+    for index in np.asarray(indicies).tolist():
+        if index in cached:
+            continue
+
+        misses += 1
+        fifo.append(index)
+        cached.add(index)
+        if len(fifo) > cache_size:
+            cached.discard(fifo.popleft())
+
+    return misses / tri_count
+
+#Reorders the triangles of an index array with Tipsify. Returns the new index array (int64)
+def tipsify(indicies, vertex_count, cache_size=CACHE_SIZE):
+    indicies = np.asarray(indicies, dtype=np.int64)
+    tri_count = len(indicies) // 3
+    if tri_count == 0:
+        return indicies
+
+    #Triangles using each vertex, as a compressed list: vertex_tris[vertex_starts[v]:vertex_starts[v + 1]]
+    valence = np.bincount(indicies, minlength=vertex_count)
+    vertex_starts = np.zeros(vertex_count + 1, dtype=np.int64)
+    np.cumsum(valence, out=vertex_starts[1:])
+    vertex_tris = (np.argsort(indicies, kind="stable") // 3).tolist()
+    vertex_starts = vertex_starts.tolist()
+
+    tris = indicies.tolist()
+    live = valence.tolist()                 #Triangles not emitted yet, per vertex
+    cache_time = [0] * vertex_count         #When each vertex last entered the cache
+    emitted = bytearray(tri_count)
+    dead_end = []                           #Recently used verticies, to restart from when we run out of neighbours
+    time = cache_size + 1
+    cursor = 0                              #Next vertex to try when there's nothing better
+    out = []
+
+    fan = tris[0]
+    while fan >= 0:
+        #Emit every remaining triangle around the fanning vertex
+        candidates = []
+        for t in vertex_tris[vertex_starts[fan]:vertex_starts[fan + 1]]:
+            if emitted[t]:
+                continue
+            emitted[t] = 1
+
+            for v in tris[t * 3:t * 3 + 3]:
+                out.append(v)
+                dead_end.append(v)
+                candidates.append(v)
+                live[v] -= 1
+                if time - cache_time[v] > cache_size:
+                    cache_time[v] = time
+                    time += 1
+
+        #Pick the next fanning vertex. Prefer the oldest candidate that will still be in the cache once its triangles are emitted
+        fan = -1
+        best = -1
+        for v in candidates:
+            if live[v] > 0:
+                priority = 0
+                if time - cache_time[v] + 2 * live[v] <= cache_size:
+                    priority = time - cache_time[v]
+                if priority > best:
+                    best = priority
+                    fan = v
+
+        #Nothing around here, go back to a recently used vertex, then on to the next unfinished vertex in order
+        if fan == -1:
+            while len(dead_end) > 0:
+                v = dead_end.pop()
+                if live[v] > 0:
+                    fan = v
+                    break
+        if fan == -1:
+            while cursor < vertex_count:
+                if live[cursor] > 0:
+                    fan = cursor
+                    break
+                cursor += 1
+
+    return np.array(out, dtype=np.int64)
+
+#Reorders the triangles of a mesh for the vertex cache. Returns a tuple of (new indicies, ACMR before, ACMR after).
+#If reordering doesn't help the original order is kept
+def optimize_index_order(indicies, vertex_count, cache_size=CACHE_SIZE):
+    before = get_acmr(indicies, cache_size)
+    reordered = tipsify(indicies, vertex_count, cache_size)
+    after = get_acmr(reordered, cache_size)
+
+    if after >= before:
+        return (indicies, before, before)
+    return (reordered, before, after)
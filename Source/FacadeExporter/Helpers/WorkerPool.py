@@ -0,0 +1,78 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Keep the worker pool used to format meshes in parallel. Only formatting runs on the pool, everything that touches bpy stays on the main thread.
+#The pool is kept for the whole Blender session (starting worker processes takes longer than formatting most facades), and replaced when the settings change or it breaks.
+
+import sys
+import concurrent.futures
+import multiprocessing
+
+#The session's executor, and the (pool_type, workers) it was made with
+executor = None
+executor_settings = None
+
+#Creates an executor with the given number of workers. pool_type is "THREAD" or "PROCESS". Returns None for 1 worker or less, meaning format serially
+def create_executor(pool_type, workers):
+    if workers <= 1:
+        return None
+
+    if pool_type == "PROCESS":
+        #Always spawn, forking a running Blender isn't safe
+        return concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+
+    return concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+
+#Gets whether spawned worker processes can start. They run the __main__ script again, so they can't while Blender runs a --python script (it imports bpy, which the workers don't have)
+def can_spawn_processes():
+    main = sys.modules.get("__main__")
+    if getattr(getattr(main, "__spec__", None), "name", None) != None:
+        return True
+    return getattr(main, "__file__", None) == None
+
+#Gets the session's executor for these settings, creating it if needed. Returns None for 1 worker or less, meaning format serially.
+#If processes can't start here we use threads instead, and add why to warnings
+def get_executor(pool_type, workers, warnings=None):
+    global executor, executor_settings
+
+    if workers <= 1:
+        return None
+
+    if pool_type == "PROCESS" and not can_spawn_processes():
+        add_warning(warnings, "Worker processes can't start while Blender runs a script, formatting on threads instead")
+        pool_type = "THREAD"
+
+    if executor == None or executor_settings != (pool_type, workers):
+        shutdown()
+        executor = create_executor(pool_type, workers)
+        executor_settings = (pool_type, workers)
+    return executor
+
+#Drops an executor that failed, so the next export starts a new one
+def discard_executor(failed_executor):
+    global executor, executor_settings
+    if failed_executor is executor:
+        executor = None
+        executor_settings = None
+    if failed_executor != None:
+        failed_executor.shutdown(wait=False, cancel_futures=True)
+
+#Shuts down the session's executor (when the addon is unregistered, or the settings change)
+def shutdown():
+    global executor, executor_settings
+    if executor != None:
+        executor.shutdown(wait=True, cancel_futures=True)
+    executor = None
+    executor_settings = None
+
+#Gets the number of jobs to keep in flight for an executor with this many workers. Enough to keep every worker busy, few enough that the pending arrays don't pile up
+def get_max_pending(workers):
+    if workers <= 1:
+        return 0
+    return workers * 2
+
+#Adds a warning to a list once, so a pool failing on every mesh only shows up once
+def add_warning(warnings, warning):
+    print(warning)
+    if warnings != None and warning not in warnings:
+        warnings.append(warning)
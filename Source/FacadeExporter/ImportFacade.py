@@ -0,0 +1,207 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Import a type 2 .fac back into Blender, as the collections, meshes, empties, spellings, and facade properties the exporter would turn into that .fac
+
+import os
+import math
+import bpy  #type: ignore
+from .Helpers import FacParser
+from .Helpers import GeometryUtils
+from .Helpers import ExportSession
+
+#Counts of what an import created, for the operator's report
+class ImportResult:
+    def __init__(self):
+        self.segments = 0
+        self.curved_segments = 0
+        self.meshes = 0
+        self.triangles = 0
+        self.attached_objs = 0
+        self.warnings = []
+
+#Creates the mesh objects and empties of a parsed segment in collection
+def add_segment_objects(fac, segment, collection, result):
+    for fac_mesh in segment.meshes:
+        name = collection.name + " LOD " + str(fac_mesh.far_lod)
+        mesh = GeometryUtils.create_mesh(name, fac_mesh.verticies, fac_mesh.indicies)
+        obj = bpy.data.objects.new(name, mesh)
+        obj.facade_object.far_lod = fac_mesh.far_lod
+        obj.facade_object.group = fac_mesh.group
+        obj.facade_object.cuts = fac_mesh.cuts
+        collection.objects.link(obj)
+
+        result.meshes += 1
+        result.triangles += len(fac_mesh.indicies) // 3
+
+    for fac_obj in segment.attached_objs:
+        add_attached_obj(fac, fac_obj, collection, result)
+
+#Creates an empty for an attached (or roof) object in collection. The heading is turned back into the rotation SegmentUtils.AttachedObj reads
+def add_attached_obj(fac, fac_obj, collection, result):
+    resource = ""
+    if 0 <= fac_obj.resource_index < len(fac.resources):
+        resource = fac.resources[fac_obj.resource_index]
+    else:
+        result.warnings.append("Attached object in " + collection.name + " uses OBJ " + str(fac_obj.resource_index) + ", but there are only " + str(len(fac.resources)))
+
+    obj = bpy.data.objects.new(os.path.splitext(os.path.basename(resource))[0] or "Attached Object", None)
+    obj.location = (fac_obj.x, fac_obj.y, fac_obj.z)
+    if fac_obj.roof_obj:
+        obj.rotation_euler.z = math.radians(-fac_obj.heading)
+    else:
+        obj.rotation_euler.z = math.radians(fac_obj.heading - 180)
+    obj.facade_object.resource = resource
+    obj.facade_object.draped = fac_obj.draped
+    collection.objects.link(obj)
+
+    result.attached_objs += 1
+
+#Creates the roof collection: a plane the size of the roof (GetRoof reads the scale from its dimensions) and the roof objects
+def add_roof(fac, parent, result):
+    collection = bpy.data.collections.new("Roof")
+    parent.children.link(collection)
+
+    scale_x, scale_y = fac.roof_scale
+    height = fac.properties["roof_height"]
+    mesh = bpy.data.meshes.new("Roof")
+    mesh.from_pydata([(0, 0, height), (scale_x, 0, height), (scale_x, scale_y, height), (0, scale_y, height)], [], [(0, 1, 2, 3)])
+    mesh.update()
+    collection.objects.link(bpy.data.objects.new("Roof", mesh))
+
+    for fac_obj in fac.roof_objs:
+        add_attached_obj(fac, fac_obj, collection, result)
+
+#Sets up one side's (wall or roof) 4 decal slots from the parsed decal lines. An albedo line followed by a normal line with the same keys is one BOTH slot, that's how the exporter writes them.
+#More than 2 slots can only come from seperate normal decals, in which case slots 0 and 1 are albedo and 2 and 3 are normal
+def set_decals(decal_items, fac_decals, result, side):
+    while len(decal_items) < 4:
+        decal_items.add()
+
+    #Group the lines into slots, each a list of its FacDecals
+    slots = []
+    index = 0
+    while index < len(fac_decals):
+        decal = fac_decals[index]
+        following = fac_decals[index + 1] if index + 1 < len(fac_decals) else None
+        if decal.kind == "ALB" and following != None and following.kind == "NML" and following.projected == decal.projected and following.values[-6:] == decal.values[-12:-6] and following.values[:-6] == decal.values[:-13]:
+            slots.append([decal, following])
+            index += 2
+        else:
+            slots.append([decal])
+            index += 1
+
+    seperate = len(slots) > 2
+    if seperate:
+        alb_slots = [[decal for decal in slot if decal.kind != "NML"] for slot in slots]
+        nml_slots = [[decal for decal in slot if decal.kind == "NML"] for slot in slots]
+        alb_slots = [slot for slot in alb_slots if len(slot) > 0]
+        nml_slots = [slot for slot in nml_slots if len(slot) > 0]
+        assigned = [(alb_slots[:2], 0), (nml_slots[:2], 2)]
+        dropped = max(0, len(alb_slots) - 2) + max(0, len(nml_slots) - 2)
+    else:
+        assigned = [(slots[:2], 0)]
+        dropped = max(0, len(slots) - 2)
+
+    if dropped > 0:
+        result.warnings.append(str(dropped) + " " + side + " decals didn't fit in the 4 decal slots and were skipped")
+
+    for index, item in enumerate(decal_items):
+        item.enabled = False
+        item.visible = seperate or index < 2
+        item.type = ("ALB" if index < 2 else "NML") if seperate else "BOTH"
+
+    for slot_list, first in assigned:
+        for offset, slot in enumerate(slot_list):
+            set_decal_slot(decal_items[first + offset], slot)
+
+    return seperate
+
+#Fills in a decal slot from its FacDecals (see DecalProperties.to_string for the order the values are written in)
+def set_decal_slot(item, decals):
+    item.enabled = True
+    for decal in decals:
+        if decal.kind == "LIB":
+            item.decal_lib = decal.path
+            continue
+
+        values = decal.values
+        item.projected = decal.projected
+        if decal.projected:
+            item.scale_x, item.scale_y = values[0], values[1]
+            values = values[2:]
+        else:
+            item.tile_ratio = values[0]
+            values = values[1:]
+
+        if decal.kind == "ALB":
+            item.alb = decal.path
+            item.dither_ratio = values[0]
+            values = values[1:]
+            item.alpha_decal_key_red, item.alpha_decal_key_green, item.alpha_decal_key_blue, item.alpha_decal_key_alpha = values[6:10]
+            item.alpha_strength_modulator, item.alpha_strength_constant = values[10:12]
+        else:
+            item.nml = decal.path
+
+        item.rgb_decal_key_red, item.rgb_decal_key_green, item.rgb_decal_key_blue, item.rgb_decal_key_alpha = values[0:4]
+        item.rgb_strength_modulator, item.rgb_strength_constant = values[4:6]
+
+#Copies the parsed header and spellings into the properties of the scene's active facade. Its root collection becomes the imported collection, so the facade is exactly what was imported
+def set_scene_properties(fac, scene, file_path, result, collection):
+    f = ExportSession.get_active_facade(scene)
+    f.root_collection = collection
+
+    for name, value in fac.properties.items():
+        setattr(f, name, value)
+
+    f.wall_seperate_normal_decals = set_decals(f.wall_decals, fac.wall_decals, result, "wall")
+    f.roof_seperate_normal_decals = set_decals(f.roof_decals, fac.roof_decals, result, "roof")
+
+    f.spellings.clear()
+    for spelling in fac.spellings:
+        item = f.spellings.add()
+        for name, value in spelling.items():
+            setattr(item, name, value)
+
+    #The facade name is relative to the blender file, so exporting writes back to the file we imported
+    facade_name = os.path.splitext(file_path)[0]
+    if bpy.data.filepath != "":
+        try:
+            facade_name = os.path.relpath(facade_name, os.path.dirname(bpy.data.filepath))
+        except ValueError:
+            pass    #On another drive, keep it absolute
+    f.facade_name = facade_name
+
+#Imports a .fac into scene. Segments become collections under a new collection named after the file, in order, with their _curved variants where the file has a curved segment that differs from the straight one.
+#Returns an ImportResult
+def import_facade(file_path, scene=None, set_properties=True):
+    if scene == None:
+        scene = bpy.context.scene
+
+    fac = FacParser.read_fac(file_path)
+    result = ImportResult()
+
+    name = os.path.splitext(os.path.basename(file_path))[0]
+    parent = bpy.data.collections.new(name)
+    scene.collection.children.link(parent)
+
+    for segment in fac.segments:
+        collection = bpy.data.collections.new(name + " " + str(segment.index))
+        parent.children.link(collection)
+        add_segment_objects(fac, segment, collection, result)
+        result.segments += 1
+
+        #The exporter writes a copy of the straight segment when there's no _curved collection, so only a curved segment with its own content needs one
+        curved = fac.curved_segments.get(segment.index)
+        if curved != None and curved.digest.digest() != segment.digest.digest():
+            curved_collection = bpy.data.collections.new(collection.name + "_curved")
+            parent.children.link(curved_collection)
+            add_segment_objects(fac, curved, curved_collection, result)
+            result.curved_segments += 1
+
+    add_roof(fac, parent, result)
+
+    if set_properties:
+        set_scene_properties(fac, scene, file_path, result, parent)
+
+    return result
@@ -15,6 +15,7 @@ class PROP_facade_object(bpy.types.PropertyGroup):
     exportable: bpy.props.BoolProperty(name="Exportable", description="Whether the object is exportable", default=True) # type: ignore
     draped: bpy.props.BoolProperty(name="Draped", description="Whether the object is draped", default=False)    # type: ignore
     resource: bpy.props.StringProperty(name="Resource", description="The resource for the object")  # type: ignore
+    lod_distances: bpy.props.StringProperty(name="Generated LODs", description="Not exported. Facade LODs are additive (every mesh draws from 0 out to its Far LOD), so a generated copy would draw on top of this mesh up close. Clear it and model far LODs by hand")  # type: ignore
     
 #Class that creates the UI
 class MENU_facade_object(bpy.types.Panel):
@@ -38,6 +39,10 @@ class MENU_facade_object(bpy.types.Panel):
             layout.prop(facade_object, "far_lod")
             layout.prop(facade_object, "group")
             layout.prop(facade_object, "cuts")
+            #Only shown so files that still have Generated LODs set can clear them
+            if facade_object.lod_distances.strip() != "":
+                layout.prop(facade_object, "lod_distances")
+                layout.label(text="Generated LODs aren't exported, facade LODs are additive", icon='ERROR')
             layout.prop(facade_object, "exportable")
 
         elif context.object.type == 'EMPTY':
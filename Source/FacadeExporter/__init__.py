@@ -18,22 +18,36 @@ bl_info = {
 #System modules
 import os
 
-#Blender api
-import bpy
+#Blender api. This package is also imported by export worker processes, which don't have bpy. They only use the bpy-free helpers, so we skip the Blender side
+try:
+    import bpy
+except ImportError:
+    bpy = None
 
 #Our modules
-from . import FacadeProperties
-from . import ObjectProperties
-from . import DecalProperties
-
-#List of all classes to register
-classes = (
-    FacadeProperties.MENU_facade_exporter,
-    FacadeProperties.BUTTON_export_facade,
-    ObjectProperties.MENU_facade_object,
-    FacadeProperties.MENU_BT_facade_exporter_add_spelling,
-    FacadeProperties.MENU_BT_facade_exporter_remove_spelling
-)
+if bpy != None:
+    from . import FacadeProperties
+    from . import ObjectProperties
+    from . import DecalProperties
+    from .Helpers import GeometryCache
+    from .Helpers import ExportTracker
+    from .Helpers import GeometryBudget
+    from .Helpers import WorkerPool
+
+    #List of all classes to register
+    classes = (
+        FacadeProperties.MENU_facade_exporter,
+        FacadeProperties.BUTTON_export_facade,
+        FacadeProperties.BUTTON_export_all_facades,
+        FacadeProperties.BUTTON_analyze_facade,
+        FacadeProperties.BUTTON_import_facade,
+        ObjectProperties.MENU_facade_object,
+        FacadeProperties.MENU_BT_facade_exporter_add_spelling,
+        FacadeProperties.MENU_BT_facade_exporter_remove_spelling,
+        FacadeProperties.MENU_BT_facade_exporter_add_facade,
+        FacadeProperties.MENU_BT_facade_exporter_remove_facade,
+        FacadeProperties.MENU_BT_facade_exporter_select_facade
+    )
 
 def register():
 
@@ -47,6 +61,10 @@ def register():
     bpy.utils.register_class(FacadeProperties.PROP_facade_exporter)
     bpy.types.Scene.facade_exporter = bpy.props.PointerProperty(type=FacadeProperties.PROP_facade_exporter)
 
+    #More facades in the same scene, and which one the panel shows (0 is facade_exporter, n is facade_exporters[n - 1])
+    bpy.types.Scene.facade_exporters = bpy.props.CollectionProperty(type=FacadeProperties.PROP_facade_exporter)
+    bpy.types.Scene.facade_exporter_index = bpy.props.IntProperty(min=0)
+
     #Object specific properties
     bpy.utils.register_class(ObjectProperties.PROP_facade_object)
     bpy.types.Object.facade_object = bpy.props.PointerProperty(type=ObjectProperties.PROP_facade_object)
@@ -54,10 +72,20 @@ def register():
     for cls in classes:
         bpy.utils.register_class(cls)
 
+    bpy.types.TOPBAR_MT_file_import.append(FacadeProperties.menu_import_facade)
+
     bpy.app.handlers.load_post.append(FacadeProperties.set_four_decals)
+    bpy.app.handlers.load_post.append(GeometryCache.on_load)
+    bpy.app.handlers.depsgraph_update_post.append(GeometryCache.on_depsgraph_update)
+    bpy.app.handlers.load_post.append(ExportTracker.on_load)
+    bpy.app.handlers.depsgraph_update_post.append(ExportTracker.on_depsgraph_update)
+    bpy.app.handlers.load_post.append(GeometryBudget.on_load)
+    bpy.app.handlers.depsgraph_update_post.append(GeometryBudget.on_depsgraph_update)
 
 def unregister():
 
+    bpy.types.TOPBAR_MT_file_import.remove(FacadeProperties.menu_import_facade)
+
     for cls in classes:
         bpy.utils.unregister_class(cls)
 
@@ -66,5 +94,23 @@ def unregister():
     bpy.utils.unregister_class(FacadeProperties.FacadeSpellingItem)
     bpy.utils.unregister_class(DecalProperties.DecalProperties)
 
+    if GeometryCache.on_load in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(GeometryCache.on_load)
+    if GeometryCache.on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(GeometryCache.on_depsgraph_update)
+    if ExportTracker.on_load in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(ExportTracker.on_load)
+    if ExportTracker.on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(ExportTracker.on_depsgraph_update)
+    if GeometryBudget.on_load in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(GeometryBudget.on_load)
+    if GeometryBudget.on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(GeometryBudget.on_depsgraph_update)
+    if bpy.app.timers.is_registered(GeometryBudget.on_refresh_timer):
+        bpy.app.timers.unregister(GeometryBudget.on_refresh_timer)
+    GeometryCache.clear()
+    ExportTracker.reset()
+    WorkerPool.shutdown()
+
 if __name__ == "__main__":
     register()
\ No newline at end of file
@@ -30,6 +30,9 @@ $Test40 = $true
 $Test41 = $true
 $Test42 = $true
 
+#Benchmarks are slow, so they are off by default. They run on 4.2 only
+$RunBenchmarks = $false
+
 #First run build our build script, which is in the same folder as this script
 & "$cd\Build.ps1"
 
@@ -50,6 +53,30 @@ function Test-Exporter {
     Remove-Item "$OutputTestDir\Exporter.fac" -ErrorAction SilentlyContinue
 }
 
+#Checks that only need the addon's modules, not a .blend. Each is a script in Tests that appends its own result
+$Checks = @("Formatting", "VertexBuffer", "IndexOrder", "Welding", "AtomicWrite", "FacRoundTrip", "GeneratedLods")
+
+#Check function. Opens Blender and runs every check script
+function Test-Checks {
+    param (
+        [string]$BlenderExe
+    )
+
+    foreach ($Check in $Checks) {
+        & $BlenderExe --background --python "$TestDir\$Check.py" -- --test-dir $OutputTestDir
+    }
+}
+
+#Benchmark function. Opens Blender and runs the synthetic scene benchmark, results are written to Tests\WorkingDir\Benchmarks
+function Test-Benchmark {
+    param (
+        [string]$BlenderExe
+    )
+
+    $Commit = git rev-parse --short HEAD
+    & $BlenderExe --background --python "$TestDir\Benchmark.py" -- --test-dir $OutputTestDir --commit $Commit
+}
+
 #Remove the old result file
 Remove-Item "$OutputTestDir\Test Results.csv" -ErrorAction SilentlyContinue
 
@@ -62,66 +89,82 @@ Add-Content "$OutputTestDir\Test Results.csv" "$DateAndTime`nTest Name,Result"
 if ($Test29) {
     Add-Content "$OutputTestDir\Test Results.csv" "2.9 Tests"
     Test-Exporter -BlenderExe $BlenderExe29
+    Test-Checks -BlenderExe $BlenderExe29
 }
 
 #3.0 Tests
 if ($Test30) {
     Add-Content "$OutputTestDir\Test Results.csv" "3.0 Tests"
     Test-Exporter -BlenderExe $BlenderExe30
+    Test-Checks -BlenderExe $BlenderExe30
 }
 
 #3.1 Tests
 if ($Test31) {
     Add-Content "$OutputTestDir\Test Results.csv" "3.1 Tests"
     Test-Exporter -BlenderExe $BlenderExe31
+    Test-Checks -BlenderExe $BlenderExe31
 }
 
 #3.2 Tests
 if ($Test32) {
     Add-Content "$OutputTestDir\Test Results.csv" "3.2 Tests"
     Test-Exporter -BlenderExe $BlenderExe32
+    Test-Checks -BlenderExe $BlenderExe32
 }
 
 #3.3 Tests
 if ($Test33) {
     Add-Content "$OutputTestDir\Test Results.csv" "3.3 Tests"
     Test-Exporter -BlenderExe $BlenderExe33
+    Test-Checks -BlenderExe $BlenderExe33
 }
 
 #3.4 Tests
 if ($Test34) {
     Add-Content "$OutputTestDir\Test Results.csv" "3.4 Tests"
     Test-Exporter -BlenderExe $BlenderExe34
+    Test-Checks -BlenderExe $BlenderExe34
 }
 
 #3.5 Tests
 if ($Test35) {
     Add-Content "$OutputTestDir\Test Results.csv" "3.5 Tests"
     Test-Exporter -BlenderExe $BlenderExe35
+    Test-Checks -BlenderExe $BlenderExe35
 }
 
 #3.6 Tests
 if ($Test36) {
     Add-Content "$OutputTestDir\Test Results.csv" "3.6 Tests"
     Test-Exporter -BlenderExe $BlenderExe36
+    Test-Checks -BlenderExe $BlenderExe36
 }
 
 #4.0 Tests
 if ($Test40) {
     Add-Content "$OutputTestDir\Test Results.csv" "4.0 Tests"
     Test-Exporter -BlenderExe $BlenderExe40
+    Test-Checks -BlenderExe $BlenderExe40
 }
 
 #4.1 Tests
 if ($Test41) {
     Add-Content "$OutputTestDir\Test Results.csv" "4.1 Tests"
     Test-Exporter -BlenderExe $BlenderExe41
+    Test-Checks -BlenderExe $BlenderExe41
 }
 
 #4.2 Tests
 if ($Test42) {
     Add-Content "$OutputTestDir\Test Results.csv" "4.2 Tests"
     Test-Exporter -BlenderExe $BlenderExe42
+    Test-Checks -BlenderExe $BlenderExe42
+}
+
+#Benchmarks
+if ($RunBenchmarks) {
+    Test-Benchmark -BlenderExe $BlenderExe42
 }
 
 #Open the result file
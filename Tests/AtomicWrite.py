@@ -0,0 +1,135 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Check that writing a .fac (Helpers/AtomicWriter, and Helpers/ExportQueue for export all) leaves the existing file alone when the export fails, and doesn't touch it when the output is unchanged (byte for byte, so line endings count). Doesn't need a .blend, just the addon's modules
+
+import os
+import sys
+import shutil
+import tempfile
+import importlib
+
+ORIGINAL = "A\nFACADE\n" + "VERTEX\t0.00000000\n" * 1000
+
+#Writes the original file, with an old modified time so we can tell if it's touched
+def reset_file(file_path):
+    with open(file_path, "w") as file:
+        file.write(ORIGINAL)
+    os.utime(file_path, (1000000000, 1000000000))
+
+#Reads the whole file
+def read_file(file_path):
+    with open(file_path, "r") as file:
+        return file.read()
+
+#Writes chunks to a writer in a with block, raising partway through if fail_at is a chunk index. Returns whether it raised
+def write_chunks(writer, chunks, fail_at=None):
+    try:
+        with writer as file:
+            for i, chunk in enumerate(chunks):
+                if i == fail_at:
+                    raise RuntimeError("Export failed")
+                file.write(chunk)
+    except RuntimeError:
+        return True
+    return False
+
+#Runs every case with one kind of writer. Returns a message for the first problem, or None
+def check_writer(make_writer, name, directory):
+    file_path = os.path.join(directory, "Test.fac")
+    half = len(ORIGINAL) // 2
+
+    #Failing while the output still matches, and after it's started to differ (so the temporary file exists)
+    for chunks in [[ORIGINAL[:half], ORIGINAL[half:]], ["Changed\n", "More text\n"]]:
+        reset_file(file_path)
+        if not write_chunks(make_writer(file_path), chunks, 1):
+            return name + ": the error wasn't raised"
+        if read_file(file_path) != ORIGINAL or os.path.getmtime(file_path) != 1000000000:
+            return name + ": a failed export changed the existing file"
+        if os.listdir(directory) != ["Test.fac"]:
+            return name + ": a failed export left " + ", ".join(sorted(os.listdir(directory)))
+
+    #Identical output, in any size of chunk, isn't written
+    reset_file(file_path)
+    writer = make_writer(file_path)
+    write_chunks(writer, [ORIGINAL[:3], ORIGINAL[3:half], ORIGINAL[half:]])
+    if writer.written or os.path.getmtime(file_path) != 1000000000:
+        return name + ": unchanged output was written"
+
+    #Output that's only the start of the existing file, longer than it, or different is written
+    for text in [ORIGINAL[:half], ORIGINAL + "More\n", "Changed\n" + ORIGINAL[8:]]:
+        reset_file(file_path)
+        writer = make_writer(file_path)
+        write_chunks(writer, [text[:half], text[half:]])
+        if not writer.written or read_file(file_path) != text:
+            return name + ": changed output wasn't written"
+        if os.listdir(directory) != ["Test.fac"]:
+            return name + ": writing left " + ", ".join(sorted(os.listdir(directory)))
+
+    #The same text with the other line ending is a change, and is written with the platform's
+    other_newline = "\r\n" if os.linesep == "\n" else "\n"
+    reset_file(file_path)
+    with open(file_path, "wb") as file:
+        file.write(ORIGINAL.replace("\n", other_newline).encode("ascii"))
+    writer = make_writer(file_path)
+    write_chunks(writer, [ORIGINAL[:half], ORIGINAL[half:]])
+    with open(file_path, "rb") as file:
+        data = file.read()
+    if not writer.written or data != ORIGINAL.replace("\n", os.linesep).encode("ascii"):
+        return name + ": output with different line endings wasn't written"
+
+    #A new file
+    os.remove(file_path)
+    writer = make_writer(file_path)
+    write_chunks(writer, [ORIGINAL])
+    if not writer.written or read_file(file_path) != ORIGINAL:
+        return name + ": a new file wasn't written"
+
+    return None
+
+#Checks both writers in a temporary folder. Returns a message for the first problem, or None
+def check(addon):
+    AtomicWriter = importlib.import_module(addon + ".Helpers.AtomicWriter")
+    ExportQueue = importlib.import_module(addon + ".Helpers.ExportQueue")
+
+    directory = tempfile.mkdtemp(prefix="fac_atomic_")
+    try:
+        difference = check_writer(AtomicWriter.AtomicWriter, "AtomicWriter", directory)
+        if difference == None:
+            difference = check_writer(ExportQueue.QueuedWriter, "QueuedWriter", directory)
+        return difference
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+def test(test_dir, addon="FacadeExporter"):
+    difference = check(addon)
+    b_pass = difference == None
+    if not b_pass:
+        print("Difference: " + difference)
+
+    exporter_output = test_dir + "/Test Results.csv"
+
+    #Append the test results to the exporter_output file
+    with open(exporter_output, 'a') as output:
+        if b_pass:
+            output.write("AtomicWrite,PASS\n")
+        else:
+            output.write("AtomicWrite,FAIL,\"" + difference + "\"\n")
+
+#Program entry point. Here we get the test directory, and call the test function
+if __name__ == "__main__":
+
+    addon = "FacadeExporter"
+
+    #Parse the command line arguments
+    try:
+        for i in range(len(sys.argv)):
+            if sys.argv[i] == "--test-dir":
+                test_dir = sys.argv[i+1]
+            elif sys.argv[i] == "--addon-module":
+                addon = sys.argv[i+1]
+    except:
+        print("Error parsing command line arguments")
+        sys.exit(1)
+
+    test(test_dir, addon)
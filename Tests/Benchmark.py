@@ -0,0 +1,238 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Generate parametric facade scenes in headless Blender, time each stage of the export, and save the results as JSON so regressions show up across commits and Blender versions.
+#Usage: blender --background --python Benchmark.py -- --test-dir <dir> [--cases "segments,triangles,empties;..."] [--repeat N] [--commit <id>] [--workers N] [--pool THREAD|PROCESS]
+
+import bpy
+import sys
+import os
+import json
+import math
+import time
+import datetime
+import argparse
+import importlib
+import numpy as np
+
+#Default cases: (segments, triangles per mesh, attached empties per segment)
+DEFAULT_CASES = [(4, 2000, 4), (16, 20000, 16), (32, 100000, 32)]
+
+#Makes a wall mesh (a grid in the YZ plane, running along negative Y) with about the requested number of triangles, a UV layer, and a mix of smooth and flat faces
+def make_wall_mesh(name, triangles, length=10.0, height=5.0):
+    quads = max(1, triangles // 2)
+    cols = max(1, int(math.sqrt(quads * length / height)))
+    rows = max(1, quads // cols)
+
+    #Grid verticies, slightly bumped in X so normals aren't all identical
+    ys = np.linspace(0, -length, cols + 1)
+    zs = np.linspace(0, height, rows + 1)
+    grid_y, grid_z = np.meshgrid(ys, zs)
+    grid_x = 0.05 * np.sin(grid_y * 3.0) * np.cos(grid_z * 2.0)
+    verts = np.stack((grid_x.ravel(), grid_y.ravel(), grid_z.ravel()), axis=1)
+
+    #Quad faces
+    index = np.arange((rows + 1) * (cols + 1)).reshape(rows + 1, cols + 1)
+    faces = np.stack((index[:-1, :-1].ravel(), index[:-1, 1:].ravel(), index[1:, 1:].ravel(), index[1:, :-1].ravel()), axis=1)
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(verts.tolist(), [], faces.tolist())
+
+    #Half the faces smooth, half flat
+    smooth = np.zeros(len(mesh.polygons), dtype=bool)
+    smooth[::2] = True
+    mesh.polygons.foreach_set("use_smooth", smooth)
+
+    #UVs from the position along the wall
+    uv_layer = mesh.uv_layers.new()
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    uvs = np.stack((-verts[loop_verts, 1] / length, verts[loop_verts, 2] / height), axis=1)
+    uv_layer.data.foreach_set("uv", uvs.astype(np.float32).ravel())
+
+    mesh.update()
+    return mesh, cols
+
+#Builds a synthetic facade scene in an empty file
+def build_scene(segments, triangles, empties, test_dir):
+    bpy.ops.wm.read_homefile(use_empty=True)
+    scene = bpy.context.scene
+
+    for s in range(segments):
+        variants = [("Segment " + str(s), triangles)]
+
+        #Every other segment gets a curved variant with more geometry
+        if s % 2 == 1:
+            variants.append(("Segment " + str(s) + "_curved", triangles * 2))
+
+        for col_name, tri_count in variants:
+            col = bpy.data.collections.new(col_name)
+            scene.collection.children.link(col)
+
+            mesh, cuts = make_wall_mesh(col_name + " Mesh", tri_count)
+            obj = bpy.data.objects.new(col_name + " Wall", mesh)
+            obj.location = (0.1 * s, 0, 0)
+            obj.rotation_euler = (0, 0, 0.01 * s)
+            obj.facade_object.cuts = cuts
+            col.objects.link(obj)
+
+            for k in range(empties):
+                empty = bpy.data.objects.new(col_name + " Attached " + str(k), None)
+                empty.location = (1.0, -10.0 * k / max(1, empties), 0)
+                empty.rotation_euler = (0, 0, math.radians(15 * k))
+                empty.facade_object.resource = "lib/benchmark/object_" + str(k % 7) + ".obj"
+                empty.facade_object.draped = k % 2 == 0
+                col.objects.link(empty)
+
+    #Roof
+    roof_col = bpy.data.collections.new("Roof")
+    scene.collection.children.link(roof_col)
+    roof_mesh, cuts = make_wall_mesh("Roof Mesh", 2)
+    roof_col.objects.link(bpy.data.objects.new("Roof", roof_mesh))
+
+    #Facade properties and spellings
+    f = scene.facade_exporter
+    f.facade_name = os.path.join(test_dir, "Benchmark")
+    f.render_wall = True
+    f.render_roof = True
+    f.wall_texture_alb = "Wall.png"
+
+    wall = f.spellings.add()
+    wall.type = "WALL"
+    wall.wall_name = "Benchmark"
+    wall.max_width = 1000
+    wall.max_heading = 360
+    for s in range(segments):
+        spelling = f.spellings.add()
+        spelling.type = "SPELLING"
+        spelling.spellings = " ".join(str(i) for i in range(s + 1))
+
+#Times a function call. Returns (seconds, result)
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return (time.perf_counter() - start, result)
+
+#Runs the export stage by stage, then as a whole (cold and warm cache). Returns a dictionary of timings and counts
+def run_case(addon, segments, triangles, empties, test_dir, workers, pool):
+    GetFacade = importlib.import_module(addon + ".GetFacade")
+    SceneIndex = importlib.import_module(addon + ".Helpers.SceneIndex")
+    SegmentUtils = importlib.import_module(addon + ".Helpers.SegmentUtils")
+    FormatUtils = importlib.import_module(addon + ".Helpers.FormatUtils")
+    GeometryCache = importlib.import_module(addon + ".Helpers.GeometryCache")
+    ExportTracker = importlib.import_module(addon + ".Helpers.ExportTracker")
+
+    stages = {}
+    stages["scene_build"], _ = timed(build_scene, segments, triangles, empties, test_dir)
+
+    #Collection scan
+    stages["collection_scan"], scene_index = timed(SceneIndex.build_index)
+    mesh_objs = [obj for entry in scene_index.segments + [entry for entry in scene_index.curved_segments if entry != None] for obj in entry.meshes]
+
+    #Geometry extraction (local space)
+    stages["geometry_extraction"], locals = timed(lambda: [SegmentUtils.get_local_geometry_from_mesh(obj.data) for obj in mesh_objs])
+
+    #Transform
+    stages["transform"], geometry = timed(lambda: [SegmentUtils.transform_local_geometry(local, obj.matrix_world) for obj, local in zip(mesh_objs, locals)])
+
+    #Formatting
+    stages["formatting"], text = timed(lambda: [FormatUtils.format_mesh(verticies, indicies) for verticies, indicies in geometry])
+
+    #Write
+    def write():
+        with open(os.path.join(test_dir, "Benchmark.write.tmp"), "w", buffering=1024 * 1024) as file:
+            for chunks in text:
+                for chunk in chunks:
+                    file.write(chunk)
+    stages["write"], _ = timed(write)
+    os.remove(os.path.join(test_dir, "Benchmark.write.tmp"))
+
+    #Whole export, with nothing cached and then with everything cached
+    GeometryCache.clear()
+    ExportTracker.reset()
+    stages["export_cold"], _ = timed(bpy.ops.blender_utils.export_facade)
+    stages["export_warm"], _ = timed(bpy.ops.blender_utils.export_facade)
+
+    #Whole export with nothing cached, formatting on the main thread and then on the worker pool
+    f = bpy.context.scene.facade_exporter
+    f.export_pool = pool
+    for worker_count in [1, workers]:
+        f.export_workers = worker_count
+        GeometryCache.clear()
+        ExportTracker.reset()
+        stages["export_workers_" + str(worker_count)], _ = timed(bpy.ops.blender_utils.export_facade)
+    f.export_workers = 1
+
+    output_path = GetFacade.get_output_path()
+    counts = {
+        "meshes": len(mesh_objs),
+        "triangles": sum(len(indicies) // 3 for verticies, indicies in geometry),
+        "verticies": sum(len(verticies) for verticies, indicies in geometry),
+        "file_size": os.path.getsize(output_path)
+    }
+    os.remove(output_path)
+
+    return {"segments": segments, "triangles_per_mesh": triangles, "empties_per_segment": empties, "stages": stages, "counts": counts}
+
+#Runs every case, keeping the fastest time of each stage over the repeats, and writes the results
+def benchmark(test_dir, cases, repeat, commit, addon, workers, pool):
+    results = []
+    for segments, triangles, empties in cases:
+        best = None
+        for r in range(repeat):
+            print("Benchmark: " + str(segments) + " segments, " + str(triangles) + " triangles, " + str(empties) + " empties, run " + str(r + 1))
+            result = run_case(addon, segments, triangles, empties, test_dir, workers, pool)
+            if best is None:
+                best = result
+            else:
+                for stage, seconds in result["stages"].items():
+                    best["stages"][stage] = min(best["stages"][stage], seconds)
+        results.append(best)
+
+        for stage, seconds in best["stages"].items():
+            print("    " + stage.ljust(20) + "{:.4f}".format(seconds) + "s")
+
+    output = {
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "blender_version": bpy.app.version_string,
+        "commit": commit,
+        "repeat": repeat,
+        "workers": workers,
+        "pool": pool,
+        "cpu_count": os.cpu_count(),
+        "cases": results
+    }
+
+    #One file per run, so results from different commits and versions can be compared side by side
+    output_dir = os.path.join(test_dir, "Benchmarks")
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = os.path.join(output_dir, "Benchmark " + bpy.app.version_string.replace(" ", "_") + " " + datetime.datetime.now().strftime("%Y-%m-%d %H-%M-%S") + ".json")
+    with open(output_path, "w") as file:
+        json.dump(output, file, indent=4)
+
+    print("Benchmark results written to " + output_path)
+
+#Parses "segments,triangles,empties;..." into a list of cases
+def parse_cases(text):
+    cases = []
+    for case in text.split(";"):
+        if case.strip() != "":
+            cases.append(tuple(int(value) for value in case.split(",")))
+    return cases
+
+#Program entry point. Here we get the test directory and options, and run the benchmark
+if __name__ == "__main__":
+    script_args = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--test-dir", required=True)
+    parser.add_argument("--cases", default="")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--commit", default="")
+    parser.add_argument("--addon-module", default="FacadeExporter")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--pool", default="THREAD", choices=["THREAD", "PROCESS"])
+    args = parser.parse_args(script_args)
+
+    cases = parse_cases(args.cases) if args.cases != "" else DEFAULT_CASES
+    benchmark(args.test_dir, cases, args.repeat, args.commit, args.addon_module, args.workers, args.pool)
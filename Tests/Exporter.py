@@ -6,10 +6,14 @@
 import bpy
 import sys
 import argparse
+import importlib
 
-def test(test_dir):
+def test(test_dir, addon="FacadeExporter", tolerance=1e-6):
     b_pass = False
 
+    #The structural diff lives in the addon, so it can share the .fac parser
+    FacDiff = importlib.import_module(addon + ".Helpers.FacDiff")
+
     #Open the test file, which is in the test_dir/Exporter.blend
     print("Opening test file: " + test_dir + "/Exporter.blend")
     bpy.ops.wm.open_mainfile(filepath=test_dir + "/Exporter.blend")
@@ -23,59 +27,38 @@ def test(test_dir):
     known_good_file = test_dir + "/Exporter.good.fac"
     exporter_output = test_dir + "/Test Results.csv"
 
-    #Check if this is Blender version 3.6 or greater. If so we need to check against a different file as there are tiny coordinate differences between the versions
-    if bpy.app.version[0] >= 4 and bpy.app.version[1] >= 0:
-        known_good_file = test_dir + "/Exporter.good.40.fac"
-    elif bpy.app.version[0] >= 3 and bpy.app.version[1] >= 6:
-        known_good_file = test_dir + "/Exporter.good.36.fac"
-
     print("Comparing files" + new_file + " and " + known_good_file)
 
-    #Compare the exported file with the known good file
-    b_pass = True
-    chr_same = 0
-    chr_total = 0
-    with open(new_file, 'r') as new, open(known_good_file, 'r') as good:
-        f_new = new.read()
-        f_good = good.read()
-
-        #Iterate through every character
-        for i in range(len(f_new)):
-            try:
-                if f_new[i] == f_good[i]:
-                    chr_same += 1
-                else:
-                    b_pass = False                    
-                chr_total += 1
-            except:
-                b_pass = False
-                print("ERROR at " + str(i) + " in file " + new_file)
-                break
-        
-    try:
-        similarity = chr_same / chr_total
-    except:
-        similarity = 0
+    #Compare the exported file with the known good file. Numbers only need to match within the tolerance, there are tiny coordinate differences between Blender versions
+    difference = FacDiff.compare(new_file, known_good_file, tolerance)
+    b_pass = difference == None
+    if not b_pass:
+        print("Difference: " + str(difference))
 
     #Append the test results to the exporter_output file
     with open(exporter_output, 'a') as output:
         if b_pass:
-            output.write("Exporter,PASS," + "{:.{precision}f}".format(similarity * 100, precision=4) + "%\n")
+            output.write("Exporter,PASS\n")
         else:
-            output.write("Exporter,FAIL," + "{:.{precision}f}".format(similarity * 100, precision=4) + "%\n")
+            output.write("Exporter,FAIL,\"" + str(difference).replace("\"", "\"\"") + "\"\n")
 
 #Program entry point. Here we get the test directory, and call the test function
 if __name__ == "__main__":
 
+    addon = "FacadeExporter"
+    tolerance = 1e-6
+
     #Parse the command line arguments
     try:
         for i in range(len(sys.argv)):
             if sys.argv[i] == "--test-dir":
                 test_dir = sys.argv[i+1]
+            elif sys.argv[i] == "--addon-module":
+                addon = sys.argv[i+1]
+            elif sys.argv[i] == "--tolerance":
+                tolerance = float(sys.argv[i+1])
     except:
         print("Error parsing command line arguments")
         sys.exit(1)
 
-    test(test_dir)
-
-
+    test(test_dir, addon, tolerance)
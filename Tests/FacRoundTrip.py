@@ -0,0 +1,103 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Check that Exporter.good.fac round trips: parsed (Helpers/FacParser) and written back (Helpers/FacWriter) it's line for line the same, and the structural diff (Helpers/FacDiff) finds no difference, but does find small changes to it. Doesn't need a .blend, just the addon's modules
+
+import io
+import sys
+import importlib
+
+#Writes parsed directives back to .fac text. Lines other than meshes are written as their words, meshes are formatted like an export
+def get_directives_text(directives, FacWriter, FacadeModel):
+    chunks = []
+    for line_number, words, mesh in directives:
+        if mesh == None:
+            chunks.append(" ".join(words) + "\n")
+        else:
+            chunks.extend(FacWriter.iter_mesh_text(FacadeModel.FacadeMesh(mesh.group, mesh.far_lod, mesh.cuts, mesh.verticies, mesh.indicies)))
+    return "".join(chunks)
+
+#Compares .fac text with the known good file's text
+def compare_text(FacDiff, text, good_text, tolerance):
+    return FacDiff.compare_files(io.StringIO(text), io.StringIO(good_text), tolerance)
+
+#Round trips the known good file, then makes sure small changes to it are found. Returns a message for the first problem, or None
+def check(test_dir, addon):
+    FacParser = importlib.import_module(addon + ".Helpers.FacParser")
+    FacWriter = importlib.import_module(addon + ".Helpers.FacWriter")
+    FacadeModel = importlib.import_module(addon + ".Helpers.FacadeModel")
+    FacDiff = importlib.import_module(addon + ".Helpers.FacDiff")
+
+    with open(test_dir + "/Exporter.good.fac", "r") as file:
+        good_text = file.read()
+
+    directives = list(FacParser.iter_directives(io.StringIO(good_text)))
+    meshes = [mesh for line_number, words, mesh in directives if mesh != None]
+    if len(meshes) == 0:
+        return "No meshes were read from Exporter.good.fac"
+
+    #Written back, every line but the blank ones is the same
+    text = get_directives_text(directives, FacWriter, FacadeModel)
+    if text.splitlines() != [line for line in good_text.splitlines() if line.strip() != ""]:
+        return "Writing the parsed file back doesn't give the same lines"
+
+    difference = compare_text(FacDiff, text, good_text, 0.0)
+    if difference != None:
+        return "The round trip differs: " + str(difference)
+
+    #A vertex moved by more than the tolerance is found, by less than it isn't
+    mesh = meshes[-1]
+    mesh.verticies[len(mesh.verticies) // 2, 1] += 1e-5
+    if compare_text(FacDiff, get_directives_text(directives, FacWriter, FacadeModel), good_text, 1e-6) == None:
+        return "A vertex moved by 1e-5 wasn't found"
+    if compare_text(FacDiff, get_directives_text(directives, FacWriter, FacadeModel), good_text, 1e-4) != None:
+        return "A vertex moved by 1e-5 was found at a tolerance of 1e-4"
+    mesh.verticies[len(mesh.verticies) // 2, 1] -= 1e-5
+
+    #So is a changed index
+    mesh.indicies[[0, 1]] = mesh.indicies[[1, 0]]
+    if compare_text(FacDiff, get_directives_text(directives, FacWriter, FacadeModel), good_text, 1e-6) == None:
+        return "A changed index wasn't found"
+    mesh.indicies[[0, 1]] = mesh.indicies[[1, 0]]
+
+    #A changed line, and a file cut off partway through a mesh
+    lines = good_text.splitlines(True)
+    if compare_text(FacDiff, "".join(lines[:1]) + "B\n" + "".join(lines[2:]), good_text, 1e-6) == None:
+        return "A changed line wasn't found"
+    if compare_text(FacDiff, good_text[:len(good_text) // 2], good_text, 1e-6) == None:
+        return "A truncated file wasn't found"
+
+    return None
+
+def test(test_dir, addon="FacadeExporter"):
+    difference = check(test_dir, addon)
+    b_pass = difference == None
+    if not b_pass:
+        print("Difference: " + difference)
+
+    exporter_output = test_dir + "/Test Results.csv"
+
+    #Append the test results to the exporter_output file
+    with open(exporter_output, 'a') as output:
+        if b_pass:
+            output.write("FacRoundTrip,PASS\n")
+        else:
+            output.write("FacRoundTrip,FAIL,\"" + difference.replace("\"", "\"\"") + "\"\n")
+
+#Program entry point. Here we get the test directory, and call the test function
+if __name__ == "__main__":
+
+    addon = "FacadeExporter"
+
+    #Parse the command line arguments
+    try:
+        for i in range(len(sys.argv)):
+            if sys.argv[i] == "--test-dir":
+                test_dir = sys.argv[i+1]
+            elif sys.argv[i] == "--addon-module":
+                addon = sys.argv[i+1]
+    except:
+        print("Error parsing command line arguments")
+        sys.exit(1)
+
+    test(test_dir, addon)
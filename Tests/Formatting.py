@@ -0,0 +1,98 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Check that the bulk VERTEX and IDX formatting (Helpers/FormatUtils) is byte for byte the same as the per line code it replaced. Doesn't need a .blend, just the addon's modules
+
+import sys
+import importlib
+import numpy as np
+
+#The IDX block the way the exporter used to write it, one index at a time
+def get_old_index_lines(indicies):
+    output = ""
+    for i in range(0, len(indicies)):
+        #Add the newline idx
+        if (i + 1) % 10 == 1:
+            output += "IDX "
+
+        #Add the index
+        output += str(indicies[i]) + " "
+
+        #Add the newline every 10 indicies
+        if (i + 1) % 10 == 0 and i != 0:
+            output += "\n"
+    output += "\n"
+    return output
+
+#A VERTEX line the way the exporter used to write it, one value at a time. X-Plane is Y up, so y and z swap
+def get_old_vertex_line(loc_x, loc_y, loc_z, normal_x, normal_y, normal_z, uv_x, uv_y):
+    return "VERTEX\t" + "{:.8f}".format(loc_x) + "\t" + "{:.8f}".format(loc_z) + "\t" + "{:.8f}".format(loc_y) + "\t" + "{:.8f}".format(normal_x) + "\t" + "{:.8f}".format(normal_z) + "\t" + "{:.8f}".format(normal_y) + "\t" + "{:.8f}".format(uv_x) + "\t" + "{:.8f}".format(uv_y)
+
+#Makes an n x 8 vertex array with random values, plus the ones that are easy to get wrong: -0.0, tiny negatives that round to -0.00000000, and values that round up a digit.
+#Blender gives us 32 bit floats, so the values are too
+def get_test_verticies(count):
+    rng = np.random.default_rng(0)
+    values = rng.uniform(-1000, 1000, (count, 8)).astype(np.float32)
+    values[0] = [-0.0, 0.0, -1e-10, 1e-10, 9.999999999, -9.999999999, 0.5, -0.5]
+    values[1] = [123456.78, -0.00000001, 1.0, -1.0, 0.0, 0.0, 1.0, 0.0]
+    return values.astype(np.float64)
+
+#Compares the old and new output. Returns a message for the first difference, or None
+def check(addon):
+    FormatUtils = importlib.import_module(addon + ".Helpers.FormatUtils")
+
+    #VERTEX lines, in one chunk and split over several
+    array = get_test_verticies(1000)
+    old_text = "".join(get_old_vertex_line(*row) + "\n" for row in array.tolist())
+    if FormatUtils.format_vertex_lines(array) != old_text:
+        return "VERTEX lines differ"
+    if "".join(FormatUtils.iter_vertex_lines(array, 7)) != old_text:
+        return "VERTEX lines differ when chunked"
+    if FormatUtils.get_vertex_lines_size(array) != len(old_text):
+        return "VERTEX size is " + str(FormatUtils.get_vertex_lines_size(array)) + ", expected " + str(len(old_text))
+
+    #IDX lines, for every way the last line can end
+    for count in [0, 1, 3, 9, 10, 11, 20, 27, 30, 301]:
+        indicies = np.arange(count, dtype=np.int64) * 37 % 1000
+        old_text = get_old_index_lines(indicies.tolist())
+        if FormatUtils.format_index_lines(indicies) != old_text:
+            return "IDX lines differ for " + str(count) + " indicies"
+        if "".join(FormatUtils.iter_index_lines(indicies, 2)) != old_text:
+            return "IDX lines differ when chunked for " + str(count) + " indicies"
+        if FormatUtils.get_index_lines_size(indicies) != len(old_text):
+            return "IDX size is " + str(FormatUtils.get_index_lines_size(indicies)) + ", expected " + str(len(old_text)) + " for " + str(count) + " indicies"
+
+    return None
+
+def test(test_dir, addon="FacadeExporter"):
+    difference = check(addon)
+    b_pass = difference == None
+    if not b_pass:
+        print("Difference: " + difference)
+
+    exporter_output = test_dir + "/Test Results.csv"
+
+    #Append the test results to the exporter_output file
+    with open(exporter_output, 'a') as output:
+        if b_pass:
+            output.write("Formatting,PASS\n")
+        else:
+            output.write("Formatting,FAIL,\"" + difference + "\"\n")
+
+#Program entry point. Here we get the test directory, and call the test function
+if __name__ == "__main__":
+
+    addon = "FacadeExporter"
+
+    #Parse the command line arguments
+    try:
+        for i in range(len(sys.argv)):
+            if sys.argv[i] == "--test-dir":
+                test_dir = sys.argv[i+1]
+            elif sys.argv[i] == "--addon-module":
+                addon = sys.argv[i+1]
+    except:
+        print("Error parsing command line arguments")
+        sys.exit(1)
+
+    test(test_dir, addon)
@@ -0,0 +1,107 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Check that a mesh with Generated LODs set exports only its own MESH, with all its triangles, plus a warning. Facade LODs are additive, so a generated copy would draw on top of it up close. Builds its own scene, it doesn't need a .blend
+
+import bpy
+import os
+import sys
+import importlib
+import numpy as np
+
+#Makes a wall mesh object: a grid of quads in the YZ plane, running along negative Y, cols quads long (one segment per column)
+def make_wall(name, rows, cols, far_lod, lod_distances):
+    ys = np.linspace(0, -10, cols + 1)
+    zs = np.linspace(0, 5, rows + 1)
+    verts = [(0.0, y, z) for z in zs for y in ys]
+    faces = [(r * (cols + 1) + c, r * (cols + 1) + c + 1, (r + 1) * (cols + 1) + c + 1, (r + 1) * (cols + 1) + c) for r in range(rows) for c in range(cols)]
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(verts, [], faces)
+    mesh.uv_layers.new()
+    mesh.update()
+
+    obj = bpy.data.objects.new(name, mesh)
+    obj.facade_object.far_lod = far_lod
+    obj.facade_object.cuts = cols
+    obj.facade_object.lod_distances = lod_distances
+    return obj
+
+#Exports a segment with a near mesh that has Generated LODs set and a hand made far LOD. Returns a message for the first problem, or None
+def check(test_dir, addon):
+    GetFacade = importlib.import_module(addon + ".GetFacade")
+    ExportSession = importlib.import_module(addon + ".Helpers.ExportSession")
+    FacParser = importlib.import_module(addon + ".Helpers.FacParser")
+
+    bpy.ops.wm.read_homefile(use_empty=True)
+    scene = bpy.context.scene
+
+    col = bpy.data.collections.new("Segment 0")
+    scene.collection.children.link(col)
+    near = make_wall("Near", 8, 12, 1000, "2000, 5000")
+    far = make_wall("Far", 1, 4, 3000, "")
+    col.objects.link(near)
+    col.objects.link(far)
+
+    #Export it without the operator, so we can see the session's warnings
+    session = ExportSession.ExportSession(scene, bpy.context.view_layer)
+    file_path = os.path.join(test_dir, "GeneratedLods.fac")
+    try:
+        with open(file_path, "w") as file:
+            GetFacade.write_facade(file, session)
+        session.finish()
+        fac = FacParser.read_fac(file_path)
+    finally:
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+    #Just the two meshes that were modelled, with their own far LODs and every triangle
+    meshes = fac.segments[0].meshes
+    expected = [(1000, 12, 8 * 12 * 2), (3000, 4, 4 * 2)]
+    found = [(mesh.far_lod, mesh.cuts, len(mesh.indicies) // 3) for mesh in meshes]
+    if found != expected:
+        return "Expected the MESH lines (far LOD, segments, triangles) " + str(expected) + ", found " + str(found)
+
+    #The curved segment is a copy of the straight one, so it mustn't have gained any either
+    curved = [(mesh.far_lod, len(mesh.indicies) // 3) for mesh in fac.curved_segments[0].meshes]
+    if curved != [(far_lod, triangles) for far_lod, cuts, triangles in expected]:
+        return "The curved segment's meshes are " + str(curved)
+
+    warnings = [warning for warning in session.warnings if "Generated LODs" in warning]
+    if len(warnings) != 1 or not warnings[0].startswith("Near"):
+        return "Expected one Generated LODs warning for Near, found " + str(session.warnings)
+
+    return None
+
+def test(test_dir, addon="FacadeExporter"):
+    difference = check(test_dir, addon)
+    b_pass = difference == None
+    if not b_pass:
+        print("Difference: " + difference)
+
+    exporter_output = test_dir + "/Test Results.csv"
+
+    #Append the test results to the exporter_output file
+    with open(exporter_output, 'a') as output:
+        if b_pass:
+            output.write("GeneratedLods,PASS\n")
+        else:
+            output.write("GeneratedLods,FAIL,\"" + difference.replace("\"", "\"\"") + "\"\n")
+
+#Program entry point. Here we get the test directory, and call the test function
+if __name__ == "__main__":
+
+    addon = "FacadeExporter"
+
+    #Parse the command line arguments
+    try:
+        for i in range(len(sys.argv)):
+            if sys.argv[i] == "--test-dir":
+                test_dir = sys.argv[i+1]
+            elif sys.argv[i] == "--addon-module":
+                addon = sys.argv[i+1]
+    except:
+        print("Error parsing command line arguments")
+        sys.exit(1)
+
+    test(test_dir, addon)
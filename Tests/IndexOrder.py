@@ -0,0 +1,93 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Check that reordering a mesh's triangles for the vertex cache (Helpers/VertexCache) keeps every triangle and its winding, and never raises the ACMR. Doesn't need a .blend, just the addon's modules
+
+import sys
+import importlib
+import numpy as np
+
+#Makes the indicies of a welded grid of quads, two triangles each, like a wall. The triangles are in row order
+def get_grid_indicies(rows, cols):
+    index = np.arange((rows + 1) * (cols + 1)).reshape(rows + 1, cols + 1)
+    a = index[:-1, :-1].ravel()
+    b = index[:-1, 1:].ravel()
+    c = index[1:, 1:].ravel()
+    d = index[1:, :-1].ravel()
+    return np.stack((a, b, c, a, c, d), axis=1).ravel()
+
+#Gets the triangles as a sorted list, each rotated so its smallest index is first. Rotating keeps the winding, so two index arrays with the same triangles and windings give the same list
+def get_triangle_set(indicies):
+    triangles = np.asarray(indicies, dtype=np.int64).reshape(-1, 3)
+    first = np.argmin(triangles, axis=1)
+    rows = np.arange(len(triangles))
+    rotated = np.stack((triangles[rows, first], triangles[rows, (first + 1) % 3], triangles[rows, (first + 2) % 3]), axis=1)
+    return sorted(map(tuple, rotated.tolist()))
+
+#Reorders each test mesh. Returns a message for the first problem, or None
+def check(addon):
+    VertexCache = importlib.import_module(addon + ".Helpers.VertexCache")
+
+    rng = np.random.default_rng(0)
+    grid = get_grid_indicies(40, 60)
+    shuffled = grid.reshape(-1, 3)[rng.permutation(len(grid) // 3)].ravel()
+    meshes = {
+        "grid": grid,
+        "shuffled grid": shuffled,
+        "unwelded": np.arange(3000, dtype=np.int64),
+        "single triangle": np.array([2, 0, 1], dtype=np.int64),
+        "empty": np.array([], dtype=np.int64)
+    }
+
+    for name, indicies in meshes.items():
+        vertex_count = int(indicies.max()) + 1 if len(indicies) > 0 else 0
+
+        reordered = VertexCache.tipsify(indicies, vertex_count)
+        if get_triangle_set(reordered) != get_triangle_set(indicies):
+            return "Tipsify changed the triangles (or their winding) in the " + name + " mesh"
+
+        optimized, before, after = VertexCache.optimize_index_order(indicies, vertex_count)
+        if get_triangle_set(optimized) != get_triangle_set(indicies):
+            return "optimize_index_order changed the triangles (or their winding) in the " + name + " mesh"
+        if after > before or VertexCache.get_acmr(optimized) > VertexCache.get_acmr(indicies):
+            return "optimize_index_order raised the ACMR of the " + name + " mesh from " + str(before) + " to " + str(after)
+
+    #A shuffled mesh has plenty to gain, make sure it actually gets better
+    _, before, after = VertexCache.optimize_index_order(shuffled, int(shuffled.max()) + 1)
+    if after >= before:
+        return "optimize_index_order didn't lower the ACMR of the shuffled grid (" + str(before) + ")"
+
+    return None
+
+def test(test_dir, addon="FacadeExporter"):
+    difference = check(addon)
+    b_pass = difference == None
+    if not b_pass:
+        print("Difference: " + difference)
+
+    exporter_output = test_dir + "/Test Results.csv"
+
+    #Append the test results to the exporter_output file
+    with open(exporter_output, 'a') as output:
+        if b_pass:
+            output.write("IndexOrder,PASS\n")
+        else:
+            output.write("IndexOrder,FAIL,\"" + difference + "\"\n")
+
+#Program entry point. Here we get the test directory, and call the test function
+if __name__ == "__main__":
+
+    addon = "FacadeExporter"
+
+    #Parse the command line arguments
+    try:
+        for i in range(len(sys.argv)):
+            if sys.argv[i] == "--test-dir":
+                test_dir = sys.argv[i+1]
+            elif sys.argv[i] == "--addon-module":
+                addon = sys.argv[i+1]
+    except:
+        print("Error parsing command line arguments")
+        sys.exit(1)
+
+    test(test_dir, addon)
@@ -0,0 +1,111 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Check that the array backed VertexBuffer (Helpers/GeometryUtils) gives the same VERTEX lines as the XPVertex objects it replaced, and that to_array keeps every value exactly. Doesn't need a .blend, just the addon's modules
+
+import sys
+import importlib
+import numpy as np
+
+#The vertex class the exporter used to build a list of, one per vertex
+class XPVertex:
+    def __init__(self, loc_x, loc_y, loc_z, normal_x, normal_y, normal_z, uv_x, uv_y):
+        self.loc_x = loc_x
+        self.loc_y = loc_y
+        self.loc_z = loc_z
+
+        self.normal_x = normal_x
+        self.normal_y = normal_y
+        self.normal_z = normal_z
+
+        self.uv_x = uv_x
+        self.uv_y = uv_y
+
+    def to_string(self, MiscUtils):
+        return "VERTEX\t" + MiscUtils.ftos(self.loc_x, 8) + "\t" + MiscUtils.ftos(self.loc_z, 8) + "\t" + MiscUtils.ftos(self.loc_y, 8) + "\t" + MiscUtils.ftos(self.normal_x, 8) + "\t" + MiscUtils.ftos(self.normal_z, 8) + "\t" + MiscUtils.ftos(self.normal_y, 8) + "\t" + MiscUtils.ftos(self.uv_x, 8) + "\t" + MiscUtils.ftos(self.uv_y, 8)
+
+#Makes float32 vertex values (what Blender gives us), random plus the ones that are easy to get wrong: -0.0, tiny negatives that round to -0.00000000, and values that round up a digit
+def get_test_values(count):
+    rng = np.random.default_rng(1)
+    values = rng.uniform(-1000, 1000, (count, 8)).astype(np.float32)
+    values[0] = [-0.0, 0.0, -1e-10, 1e-10, 9.999999999, -9.999999999, 0.5, -0.5]
+    values[1] = [123456.78, -0.00000001, 1.0, -1.0, 0.0, 0.0, 1.0, 0.0]
+    return values
+
+#Compares a VertexBuffer with XPVertex objects built from the same values. Returns a message for the first difference, or None
+def check(addon):
+    GeometryUtils = importlib.import_module(addon + ".Helpers.GeometryUtils")
+    MiscUtils = importlib.import_module(addon + ".Helpers.MiscUtils")
+
+    values = get_test_values(1000)
+    rows = values.tolist()
+
+    verticies = GeometryUtils.VertexBuffer()
+    old_verticies = []
+    for row in rows:
+        verticies.append(row[0:3], row[3:6], row[6:8])
+        old_verticies.append(XPVertex(*row))
+
+    if len(verticies) != len(old_verticies):
+        return "The buffer has " + str(len(verticies)) + " verticies, expected " + str(len(old_verticies))
+
+    #Every VERTEX line
+    for i in range(len(old_verticies)):
+        if verticies.to_string(i) != old_verticies[i].to_string(MiscUtils):
+            return "VERTEX line " + str(i) + " differs: " + verticies.to_string(i) + " vs " + old_verticies[i].to_string(MiscUtils)
+        if verticies.get_vertex(i) != tuple(rows[i]):
+            return "Vertex " + str(i) + " reads back as " + str(verticies.get_vertex(i))
+
+    #The array has the same bits, so -0.0 stays -0.0
+    array = verticies.to_array()
+    if array.shape != (len(rows), 8):
+        return "to_array gave a " + str(array.shape) + " array"
+    if array.astype(np.float32).tobytes() != values.tobytes():
+        return "to_array changed some values"
+
+    #Moving a vertex changes just its line
+    verticies.set_position(5, 1.5, -2.25, 0.125)
+    verticies.set_normal(5, 0.0, -0.0, 1.0)
+    moved = XPVertex(1.5, -2.25, 0.125, 0.0, -0.0, 1.0, rows[5][6], rows[5][7])
+    if verticies.to_string(5) != moved.to_string(MiscUtils) or verticies.to_string(4) != old_verticies[4].to_string(MiscUtils):
+        return "set_position and set_normal gave " + verticies.to_string(5)
+
+    #An empty buffer
+    empty = GeometryUtils.VertexBuffer()
+    if len(empty) != 0 or empty.to_array().shape != (0, 8):
+        return "An empty buffer isn't empty"
+
+    return None
+
+def test(test_dir, addon="FacadeExporter"):
+    difference = check(addon)
+    b_pass = difference == None
+    if not b_pass:
+        print("Difference: " + difference)
+
+    exporter_output = test_dir + "/Test Results.csv"
+
+    #Append the test results to the exporter_output file
+    with open(exporter_output, 'a') as output:
+        if b_pass:
+            output.write("VertexBuffer,PASS\n")
+        else:
+            output.write("VertexBuffer,FAIL,\"" + difference.replace("\"", "\"\"") + "\"\n")
+
+#Program entry point. Here we get the test directory, and call the test function
+if __name__ == "__main__":
+
+    addon = "FacadeExporter"
+
+    #Parse the command line arguments
+    try:
+        for i in range(len(sys.argv)):
+            if sys.argv[i] == "--test-dir":
+                test_dir = sys.argv[i+1]
+            elif sys.argv[i] == "--addon-module":
+                addon = sys.argv[i+1]
+    except:
+        print("Error parsing command line arguments")
+        sys.exit(1)
+
+    test(test_dir, addon)
@@ -0,0 +1,79 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Check that the hash map vertex welding (GeometryUtils.weld_vertices) and the sort based welding of vertex arrays (GeometryUtils.weld_vertex_arrays) give the same verticies and indicies. Doesn't need a .blend, just the addon's modules
+
+import sys
+import importlib
+import numpy as np
+
+#Makes a VertexBuffer and indicies for a mesh that's been split into separate triangles, the way it's read before welding.
+#Rows are drawn from a small pool so there are plenty of duplicates, with a few that only differ by -0.0, and a few that are only a hair apart
+def get_test_mesh(GeometryUtils, triangles):
+    rng = np.random.default_rng(0)
+    pool = rng.uniform(-10, 10, (200, 8)).astype(np.float32)
+    pool[1] = pool[0]
+    pool[1][3] = -0.0
+    pool[0][3] = 0.0
+    pool[2] = pool[3] + np.float32(1e-6)
+
+    rows = pool[rng.integers(0, len(pool), triangles * 3)]
+    verticies = GeometryUtils.VertexBuffer()
+    for row in rows:
+        verticies.append(row[0:3].tolist(), row[3:6].tolist(), row[6:8].tolist())
+    return verticies, np.arange(triangles * 3, dtype=np.int64)
+
+#Welds the test mesh both ways at each tolerance. Returns a message for the first difference, or None
+def check(addon):
+    GeometryUtils = importlib.import_module(addon + ".Helpers.GeometryUtils")
+
+    verticies, indicies = get_test_mesh(GeometryUtils, 2000)
+    for tolerance in [0.0, 1e-4, 0.5]:
+        hash_verticies, hash_indicies = GeometryUtils.weld_vertices(verticies, indicies.tolist(), tolerance)
+        array_verticies, array_indicies = GeometryUtils.weld_vertex_arrays(verticies.to_array(), indicies, tolerance)
+
+        if len(hash_verticies) == len(verticies) and tolerance > 0:
+            return "Nothing was welded at a tolerance of " + str(tolerance)
+        if len(hash_verticies) != len(array_verticies):
+            return "Welding at a tolerance of " + str(tolerance) + " left " + str(len(hash_verticies)) + " verticies, and " + str(len(array_verticies)) + " welding the arrays"
+        if not np.array_equal(hash_verticies.to_array(), array_verticies):
+            return "The welded verticies differ at a tolerance of " + str(tolerance)
+        if not np.array_equal(np.signbit(hash_verticies.to_array()), np.signbit(array_verticies)):
+            return "The signs of zeros differ at a tolerance of " + str(tolerance)
+        if not np.array_equal(np.asarray(hash_indicies, dtype=np.int64), array_indicies):
+            return "The welded indicies differ at a tolerance of " + str(tolerance)
+
+    return None
+
+def test(test_dir, addon="FacadeExporter"):
+    difference = check(addon)
+    b_pass = difference == None
+    if not b_pass:
+        print("Difference: " + difference)
+
+    exporter_output = test_dir + "/Test Results.csv"
+
+    #Append the test results to the exporter_output file
+    with open(exporter_output, 'a') as output:
+        if b_pass:
+            output.write("Welding,PASS\n")
+        else:
+            output.write("Welding,FAIL,\"" + difference + "\"\n")
+
+#Program entry point. Here we get the test directory, and call the test function
+if __name__ == "__main__":
+
+    addon = "FacadeExporter"
+
+    #Parse the command line arguments
+    try:
+        for i in range(len(sys.argv)):
+            if sys.argv[i] == "--test-dir":
+                test_dir = sys.argv[i+1]
+            elif sys.argv[i] == "--addon-module":
+                addon = sys.argv[i+1]
+    except:
+        print("Error parsing command line arguments")
+        sys.exit(1)
+
+    test(test_dir, addon)
@@ -0,0 +1,210 @@
+#Project: BlenderFacadeExporter
+#Author: Connor Russell
+#Date: 10/18/2026
+#Purpose: Export every facade from many .blend files at once, running several background Blender processes in parallel, and summarize the results.
+#
+#Usage (plain Python, or any Python with access to a Blender executable):
+#   python BatchExport.py --blender <path to blender> [--jobs N] [--summary summary.json] [--timeout seconds] <.blend files or globs>...
+#
+#Each file is opened in its own "blender --background" process, which runs this script again in worker mode to export every facade in the file.
+#The FacadeExporter addon must be enabled in that Blender's preferences. There's one result per facade, a failing facade or file is recorded and the rest of the batch carries on.
+
+import argparse
+import concurrent.futures
+import glob
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+#Worker side (runs inside Blender) -------------------------------------------------------------------------------
+
+#Exports one facade of the open .blend file with the same function the export button uses. Returns a result dictionary, this never raises
+def export_facade(GetFacade, scene, view_layer, facade, file_paths):
+    result = {"facade": facade.facade_name, "success": False, "output": "", "size": 0, "error": "", "warnings": []}
+    start = time.perf_counter()
+
+    try:
+        if facade.facade_name == "":
+            raise ValueError("The facade has no name")
+
+        output_path = GetFacade.get_output_path(scene, facade)
+        if output_path in file_paths:
+            raise ValueError("Another facade is already exported to " + os.path.basename(output_path))
+        file_paths.add(output_path)
+
+        session, output_path, written = GetFacade.export_facade(scene, view_layer, facade)
+
+        result["output"] = output_path
+        result["size"] = os.path.getsize(output_path)
+        result["written"] = written
+        result["warnings"] = list(session.warnings)
+        result["success"] = True
+    except Exception as e:
+        result["error"] = str(e)
+
+    result["export_time"] = time.perf_counter() - start
+    return result
+
+#Exports every facade in the open .blend file and writes their results as a JSON list to result_path
+def run_worker(result_path, addon_module):
+    import bpy # type: ignore
+    import importlib
+
+    results = []
+    start = time.perf_counter()
+
+    try:
+        #Make sure the addon is enabled, it may not be in a factory or portable install
+        if addon_module not in bpy.context.preferences.addons:
+            bpy.ops.preferences.addon_enable(module=addon_module)
+
+        GetFacade = importlib.import_module(addon_module + ".GetFacade")
+        ExportSession = importlib.import_module(addon_module + ".Helpers.ExportSession")
+
+        scene = bpy.context.scene
+        file_paths = set()
+        for facade in ExportSession.get_facades(scene):
+            results.append(export_facade(GetFacade, scene, bpy.context.view_layer, facade, file_paths))
+    except Exception as e:
+        #Nothing could be exported, report the file as one failed result
+        results.append({"facade": "", "success": False, "output": "", "size": 0, "error": str(e), "warnings": [], "export_time": time.perf_counter() - start})
+
+    with open(result_path, "w") as file:
+        json.dump(results, file)
+
+#Driver side (runs in plain Python) -------------------------------------------------------------------------------
+
+#Expands the file and glob arguments into a sorted list of unique .blend paths
+def expand_inputs(inputs):
+    paths = []
+    for item in inputs:
+        matches = glob.glob(item, recursive=True)
+        if len(matches) == 0 and os.path.isfile(item):
+            matches = [item]
+        paths.extend(os.path.abspath(match) for match in matches if match.lower().endswith(".blend"))
+
+    return sorted(set(paths))
+
+#Exports every facade of one .blend file in a background Blender process. Returns a list of result dictionaries, one per facade (or just one if the file failed), this never raises
+def export_file(blender, blend_path, addon_module, timeout):
+    failure = {"facade": "", "success": False, "output": "", "size": 0, "error": "", "warnings": [], "export_time": 0.0}
+    results = []
+    start = time.perf_counter()
+
+    #The worker writes its result here, so we don't have to parse Blender's console output
+    handle, result_path = tempfile.mkstemp(suffix=".json", prefix="fac_batch_")
+    os.close(handle)
+
+    try:
+        command = [blender, "--background", blend_path, "--python", os.path.abspath(__file__), "--", "--worker", "--result", result_path, "--addon-module", addon_module]
+        process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, timeout=timeout, text=True, errors="replace")
+
+        if os.path.getsize(result_path) > 0:
+            with open(result_path, "r") as file:
+                results = json.load(file)
+
+        if len(results) == 0:
+            failure["error"] = "Blender exited with code " + str(process.returncode) + " without a result. Last output: " + process.stdout[-500:]
+    except subprocess.TimeoutExpired:
+        failure["error"] = "Timed out after " + str(timeout) + " seconds"
+    except Exception as e:
+        failure["error"] = str(e)
+    finally:
+        os.remove(result_path)
+
+    if len(results) == 0:
+        results = [failure]
+
+    total_time = time.perf_counter() - start
+    for result in results:
+        result["file"] = blend_path
+        result["total_time"] = total_time
+    return results
+
+#Exports every file across a pool of background Blender processes. Returns the facades' results, in the order of blend_paths
+def run_batch(blender, blend_paths, jobs, addon_module="FacadeExporter", timeout=None, on_result=None):
+    results = []
+
+    #Each worker thread just waits on its own Blender process, the processes do the actual work
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, jobs)) as executor:
+        futures = [executor.submit(export_file, blender, path, addon_module, timeout) for path in blend_paths]
+        for future in concurrent.futures.as_completed(futures):
+            if on_result != None:
+                for result in future.result():
+                    on_result(result)
+
+        for future in futures:
+            results.extend(future.result())
+
+    return results
+
+#Prints one line per finished facade
+def print_result(result):
+    status = "OK  " if result["success"] else "FAIL"
+    line = status + " " + "{:8.2f}".format(result["export_time"]) + "s " + "{:12d}".format(result["size"]) + " bytes  " + result["file"]
+    if result["facade"] != "":
+        line += " (" + result["facade"] + ")"
+    if not result["success"]:
+        line += "\n       " + result["error"]
+    for warning in result["warnings"]:
+        line += "\n       Warning: " + warning
+    print(line, flush=True)
+
+#Builds the summary of a batch
+def get_summary(results, wall_time):
+    succeeded = [r for r in results if r["success"]]
+    return {
+        "files": len(set(r["file"] for r in results)),
+        "facades": len(results),
+        "succeeded": len(succeeded),
+        "failed": len(results) - len(succeeded),
+        "wall_time": wall_time,
+        "total_export_time": sum(r["export_time"] for r in results),
+        "total_size": sum(r["size"] for r in succeeded),
+        "results": results
+    }
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Export X-Plane facades from many .blend files in parallel background Blender processes.")
+    parser.add_argument("inputs", nargs="+", help=".blend files or glob patterns (use ** for recursive)")
+    parser.add_argument("--blender", default="blender", help="Path to the Blender executable")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="Number of Blender processes to run at once")
+    parser.add_argument("--summary", default="", help="Write the summary as JSON to this path")
+    parser.add_argument("--timeout", type=float, default=None, help="Seconds before a single file is considered failed")
+    parser.add_argument("--addon-module", default="FacadeExporter", help="Module name the addon is installed under")
+    args = parser.parse_args(argv)
+
+    blend_paths = expand_inputs(args.inputs)
+    if len(blend_paths) == 0:
+        print("No .blend files matched")
+        return 1
+
+    print("Exporting " + str(len(blend_paths)) + " files with " + str(args.jobs) + " Blender processes", flush=True)
+
+    start = time.perf_counter()
+    results = run_batch(args.blender, blend_paths, args.jobs, args.addon_module, args.timeout, print_result)
+    summary = get_summary(results, time.perf_counter() - start)
+
+    print(str(summary["succeeded"]) + " of " + str(summary["facades"]) + " facades succeeded, " + str(summary["total_size"]) + " bytes written in " + "{:.2f}".format(summary["wall_time"]) + "s")
+
+    if args.summary != "":
+        with open(args.summary, "w") as file:
+            json.dump(summary, file, indent=4)
+
+    return 0 if summary["failed"] == 0 else 1
+
+#Program entry point. Inside Blender we are a worker, arguments come after "--"
+if __name__ == "__main__":
+    if "--worker" in sys.argv:
+        script_args = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+        worker_parser = argparse.ArgumentParser()
+        worker_parser.add_argument("--worker", action="store_true")
+        worker_parser.add_argument("--result", required=True)
+        worker_parser.add_argument("--addon-module", default="FacadeExporter")
+        worker_args = worker_parser.parse_args(script_args)
+        run_worker(worker_args.result, worker_args.addon_module)
+    else:
+        sys.exit(main(sys.argv[1:]))